@@ -26,6 +26,10 @@ built from multiples of the standard 64x32 panel:
     MATRIX_SERPENTINE = true   # alternate panel rows rotated 180 degrees
     MATRIX_BIT_DEPTH = 2       # more depth = more colors, more RAM/CPU
 
+Setting ASYNC_RUNTIME = true runs the sign as asyncio tasks (see
+give_me_a_sign.asyncio_runtime) instead of the loop at the bottom of
+this file; both publish their display latency with the diagnostics.
+
 On CircuitPython older than 10.2, settings.toml values must be strings or
 ints, so use MATRIX_SERPENTINE = 1 (or "true") instead of a bare boolean.
 
@@ -72,6 +76,7 @@ MATRIX_PANEL_HEIGHT = _get_setting("MATRIX_PANEL_HEIGHT", 32)
 MATRIX_TILE = _get_setting("MATRIX_TILE", 1)
 MATRIX_SERPENTINE = _get_setting("MATRIX_SERPENTINE", True)
 MATRIX_BIT_DEPTH = _get_setting("MATRIX_BIT_DEPTH", 2)
+ASYNC_RUNTIME = _get_setting("ASYNC_RUNTIME", False)
 
 if MATRIX_WIDTH % 64 != 0 or MATRIX_WIDTH < 64:
     raise ValueError("MATRIX_WIDTH must be a positive multiple of 64")
@@ -140,6 +145,11 @@ def _log_exception(prefix, err):
         print("logger.error failed while reporting exception")
 
 
+if ASYNC_RUNTIME:
+    from give_me_a_sign.asyncio_runtime import AsyncRunner
+
+    AsyncRunner(app).run()
+
 while True:
     try:
         app.loop()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+# SPDX-License-Identifier: MIT
+"""
+Encode an image as a pre-rendered frame for the sign's frame screen.
+
+Run from anywhere; reading images needs Pillow:
+  python3 extras/frame/encode_frame.py chart.png chart.frame
+  python3 extras/frame/encode_frame.py --raw --colors 16 chart.png chart.frame
+
+then publish the file, e.g.
+  mosquitto_pub -h broker -t givemeasign/all/module/frame -f chart.frame
+
+The image is converted to at most --colors palette colors and must
+already be 64x32 (scaled up on the sign) or the display's native size.
+The format is described in give_me_a_sign/frame.py; encode() needs
+nothing but the standard library, so other renderers can import it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import struct
+from pathlib import Path
+
+MAGIC = b"GF"
+RAW = 0
+RLE = 1
+# longest literal and repeat runs one control byte can describe
+MAX_LITERAL = 128
+MAX_REPEAT = 129
+
+
+def _rle_row(row: bytes) -> bytearray:
+    """One row as runs that never cross its end"""
+    out = bytearray()
+    literal = bytearray()
+
+    def flush():
+        while literal:
+            chunk = literal[:MAX_LITERAL]
+            out.append(len(chunk) - 1)
+            out.extend(chunk)
+            del literal[:MAX_LITERAL]
+
+    index = 0
+    while index < len(row):
+        value = row[index]
+        run = 1
+        while index + run < len(row) and row[index + run] == value and run < MAX_REPEAT:
+            run += 1
+        if run >= 2:
+            flush()
+            out.append(run + 126)
+            out.append(value)
+        else:
+            literal.append(value)
+        index += run
+    flush()
+    return out
+
+
+def encode(
+    width: int, height: int, palette: list, pixels: bytes, rle: bool = True
+) -> bytes:
+    """
+    A frame of width x height pixels
+
+    :param palette: up to 256 (r, g, b) tuples
+    :param pixels: one palette index a byte, row by row
+    :param rle: run-length encode the pixels; raw otherwise
+    """
+    if not 1 <= len(palette) <= 256:
+        raise ValueError("1 to 256 palette colors")
+    if len(pixels) != width * height:
+        raise ValueError(f"{len(pixels)} pixels for {width}x{height}")
+
+    header = MAGIC + struct.pack(
+        "<BBHH", RLE if rle else RAW, len(palette) - 1, width, height
+    )
+    colors = b"".join(bytes(color) for color in palette)
+    if not rle:
+        return header + colors + bytes(pixels)
+
+    body = bytearray()
+    for y in range(height):
+        body += _rle_row(pixels[y * width : (y + 1) * width])
+    return header + colors + bytes(body)
+
+
+def encode_image(path: Path, colors: int = 256, rle: bool = True) -> bytes:
+    """The image at path as a frame, quantized to colors"""
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+
+    image = Image.open(path).convert("RGB").quantize(colors=colors)
+    flat = image.getpalette()[: 3 * 256]
+    palette = [tuple(flat[index : index + 3]) for index in range(0, len(flat), 3)]
+    return encode(image.width, image.height, palette, image.tobytes(), rle)
+
+
+def main() -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("image", type=Path)
+    parser.add_argument("frame", type=Path)
+    parser.add_argument("--colors", type=int, default=256)
+    parser.add_argument("--raw", action="store_true", help="don't run-length encode")
+    args = parser.parse_args()
+
+    frame = encode_image(args.image, args.colors, not args.raw)
+    args.frame.write_bytes(frame)
+    print(f"{args.frame}: {len(frame)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+# SPDX-License-Identifier: MIT
+"""
+Send a file to a sign in chunks over MQTT (see give_me_a_sign/transfer.py).
+
+Run from anywhere with paho-mqtt installed:
+  python3 extras/transfer/send.py --broker mqtt.local \\
+      --sign givemeasign/sign/aa_bb_cc_dd_ee_ff sunny.bmp
+  python3 extras/transfer/send.py --broker mqtt.local \\
+      --sign givemeasign/sign/aa_bb_cc_dd_ee_ff --key timezone tz.json
+
+A file without --key is saved on the sign as /transfers/<name>. The sign's
+retained status says which chunk it wants next, so if the transfer stalls
+(the sign or this script lost its connection) the manifest is sent again
+and sending carries on from there.
+"""
+
+from __future__ import annotations
+
+import argparse
+import binascii
+import json
+import threading
+import time
+from pathlib import Path
+
+import paho.mqtt.client as mqtt
+
+# seconds without progress before resuming from the sign's status
+STALL_SECONDS = 10
+ATTEMPTS = 5
+
+
+def manifest(transfer_id: str, data: bytes, chunk_size: int, **target) -> dict:
+    """The manifest announcing data; target is name= or key="""
+    return {
+        "id": transfer_id,
+        "size": len(data),
+        "crc32": binascii.crc32(data),
+        "chunk_size": chunk_size,
+        **target,
+    }
+
+
+def send(client, sign: str, data: bytes, announce: dict, delay: float) -> bool:
+    """Publish announce and the chunks of data until the sign reports done"""
+    status = {}
+    changed = threading.Event()
+
+    def on_status(_client, _userdata, message):
+        report = json.loads(message.payload)
+        if report.get("id") == announce["id"]:
+            status.update(report)
+            changed.set()
+
+    client.message_callback_add(f"{sign}/transfer/status", on_status)
+    client.subscribe(f"{sign}/transfer/status", qos=1)
+    # let a retained status from an earlier run arrive, and forget it
+    time.sleep(1)
+    status.clear()
+
+    chunk_size = announce["chunk_size"]
+    chunks = (len(data) + chunk_size - 1) // chunk_size
+    for _ in range(ATTEMPTS):
+        changed.clear()
+        client.publish(f"{sign}/transfer", json.dumps(announce), qos=1)
+        if not changed.wait(STALL_SECONDS):
+            print("no answer from the sign")
+            continue
+        if status["state"] == "failed":
+            print(f"sign says: {status.get('error')}")
+            return False
+
+        start = status["next"] if status["state"] == "receiving" else 0
+        print(f"sending chunks {start}..{chunks - 1}")
+        for index in range(start, chunks):
+            chunk = data[index * chunk_size : (index + 1) * chunk_size]
+            client.publish(f"{sign}/transfer/{announce['id']}/{index}", chunk, qos=1)
+            time.sleep(delay)
+
+        deadline = time.monotonic() + STALL_SECONDS
+        while status["state"] == "receiving" and time.monotonic() < deadline:
+            changed.clear()
+            changed.wait(1)
+        if status["state"] == "done":
+            return True
+        print(f"stalled at chunk {status['next']}, resuming")
+    return False
+
+
+def main() -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--broker", required=True)
+    parser.add_argument("--port", type=int, default=1883)
+    parser.add_argument("--username")
+    parser.add_argument("--password")
+    parser.add_argument("--sign", required=True, help="the sign's base topic")
+    parser.add_argument("--key", help="Data key to store the payload under")
+    parser.add_argument("--id", help="transfer id; the file's stem by default")
+    parser.add_argument("--chunk-size", type=int, default=1024)
+    parser.add_argument(
+        "--delay", type=float, default=0.05, help="seconds between chunks"
+    )
+    parser.add_argument("file", type=Path)
+    args = parser.parse_args()
+
+    data = args.file.read_bytes()
+    target = {"key": args.key} if args.key else {"name": args.file.name}
+    announce = manifest(args.id or args.file.stem, data, args.chunk_size, **target)
+
+    client = mqtt.Client()
+    if args.username:
+        client.username_pw_set(args.username, args.password)
+    client.connect(args.broker, args.port)
+    client.loop_start()
+    try:
+        done = send(client, args.sign, data, announce, args.delay)
+    finally:
+        client.loop_stop()
+        client.disconnect()
+
+    print("done" if done else "gave up")
+    return 0 if done else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/asyncio_runtime - cooperative runtime for GiveMeASign
+====================================================
+
+* Author: John Romkey
+"""
+
+import gc
+import traceback
+
+import asyncio
+
+from . import timesource
+
+# seconds each task sleeps between passes
+MQTT_INTERVAL = 0.05
+RENDER_INTERVAL = 0.05
+BUTTON_INTERVAL = 0.005
+# how long the tone task waits for something to play
+TONE_IDLE_INTERVAL = 0.1
+
+# seconds a task backs off after an exception, as in examples/code.py
+ERROR_BACKOFF = 0.5
+OS_ERROR_BACKOFF = 1.0
+MEMORY_ERROR_BACKOFF = 2.0
+
+
+class AsyncRunner:
+    """
+    Run a GiveMeASign as independent asyncio tasks instead of one superloop
+
+    app.loop() runs MQTT, tones, buttons, the display and GC one after
+    the other, so a slow MQTT read or a long screen update delays
+    everything else. Here each of them is its own task with its own
+    cadence: the button scanner runs every few milliseconds whatever the
+    display is doing, and the tone sequencer sleeps until the next note
+    is due rather than polling.
+
+    The MQTT read is still a blocking MiniMQTT call and holds the event
+    loop for up to its socket timeout; splitting it out bounds how often
+    that happens rather than eliminating it. app.render_latency records
+    the gap between display updates either way, so the two runtimes can
+    be compared on the same device.
+
+    .. code-block:: python
+       app = GiveMeASign(display)
+       app.start()
+       AsyncRunner(app).run()
+    """
+
+    def __init__(self, app):
+        self._app = app
+
+    def run(self) -> None:
+        """Run forever"""
+        asyncio.run(self.main())
+
+    async def main(self) -> None:
+        """Start every task and wait on them"""
+        app = self._app
+        await asyncio.gather(
+            asyncio.create_task(self._every("mqtt", app.platform.loop, MQTT_INTERVAL)),
+            asyncio.create_task(self._every("render", self._render, RENDER_INTERVAL)),
+            asyncio.create_task(
+                self._every("buttons", app.update_buttons, BUTTON_INTERVAL)
+            ),
+            asyncio.create_task(self._tones()),
+        )
+
+    def _render(self) -> None:
+        """Draw, then collect garbage in the gap before the next frame"""
+        self._app.render()
+        self._app.collect_garbage()
+
+    async def _every(self, name, step, interval) -> None:
+        """Call step() every interval seconds, surviving its exceptions"""
+        while True:
+            backoff = self._guard(name, step)
+            await asyncio.sleep(interval + backoff)
+
+    async def _tones(self) -> None:
+        """Advance the tone sequence exactly when the current tone ends"""
+        tones = self._app.tones
+        if tones is None:
+            # turned off in settings
+            return
+        while True:
+            backoff = self._guard("tones", tones.loop)
+            delay = tones.next_change()
+            if delay is None:
+                delay = TONE_IDLE_INTERVAL
+            await asyncio.sleep(delay + backoff)
+
+    def _guard(self, name, step) -> float:
+        """
+        Run step(), returning the seconds to back off if it failed so one
+        task's trouble doesn't spin the event loop or stop the others
+        """
+        try:
+            step()
+        except MemoryError:
+            print(f"asyncio_runtime:{name} MemoryError")
+            gc.collect()
+            return MEMORY_ERROR_BACKOFF
+        except OSError as error:
+            self._log(name, error)
+            return OS_ERROR_BACKOFF
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            self._log(name, error)
+            return ERROR_BACKOFF
+        return 0
+
+    def _log(self, name, error) -> None:
+        lines = traceback.format_exception(error)
+        print(f"asyncio_runtime:{name}", timesource.monotonic())
+        for line in lines:
+            print(line, end="")
+        try:
+            self._app.logger.error(f"asyncio_runtime:{name} " + "".join(lines))
+        except Exception:  # pylint: disable=broad-exception-caught
+            print("logger.error failed while reporting exception")
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/boot - boot milestone timing
+====================================================
+
+* Author: John Romkey
+"""
+
+from . import timesource
+
+
+class BootTimer:
+    """
+    Timestamps the milestones of a cold start
+
+    Times are milliseconds on the monotonic clock, which on CircuitPython
+    counts from power-on, so the first milestone already includes the
+    time spent booting the interpreter and importing code.py.
+
+    The milestones, roughly in the order they're reached:
+
+    * init - GiveMeASign() constructed (display, buttons, RTC, Data)
+    * clock - the clock is built and its font loaded
+    * first_clock - the time, from the RTC, is on the display
+    * started - start() returned; the loop takes over from here
+    * wifi - WiFi joined
+    * ntp - the RTC set from NTP
+    * mqtt - connected to the MQTT broker
+
+    The network milestones are reached from the loop, so they may never
+    be if the network isn't there. Each is recorded once, so a reconnect
+    later doesn't move it. The boot is done, and nothing more is
+    recorded, once the clock is showing and MQTT is up to report it.
+    """
+
+    # the milestones that complete a boot
+    COMPLETE = ("first_clock", "mqtt")
+
+    def __init__(self):
+        # [(name, milliseconds since power-on)] in the order reached
+        self.milestones = []
+        self.done = False
+
+    def mark(self, name) -> None:
+        """Record that name was reached now, unless it already was"""
+        if self.done or self.elapsed(name) is not None:
+            return
+
+        milliseconds = timesource.monotonic_ns() // 1_000_000
+        self.milestones.append((name, milliseconds))
+        print(f"boot: {name} at {milliseconds} ms")
+        for milestone in BootTimer.COMPLETE:
+            if self.elapsed(milestone) is None:
+                return
+        self.done = True
+
+    def elapsed(self, name):
+        """Milliseconds from power-on to name, or None if it wasn't reached"""
+        for milestone, milliseconds in self.milestones:
+            if milestone == name:
+                return milliseconds
+        return None
+
+    def report(self) -> dict:
+        """Every milestone reached, name -> milliseconds since power-on"""
+        return dict(self.milestones)
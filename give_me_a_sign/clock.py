@@ -16,13 +16,37 @@ give-me-a-sign/clock - clock module for LED Matrix display
 import time
 
 import displayio
+import terminalio
 from adafruit_bitmap_font import bitmap_font
 from adafruit_display_text.label import Label
 
 from ._paths import ASSETS_DIR
+from . import timesource
 
 
-class Clock:
+class TimeSnapshot:  # pylint: disable=too-few-public-methods
+    """
+    What the sign knows about "now", computed once when the second changes
+
+    Shared by the clock, the mini clock, diagnostics and the MQTT time
+    state so every screen renders the same instant without repeating the
+    timezone lookup, ``localtime`` conversion and solar color calculation.
+    """
+
+    def __init__(self):
+        # Unix epoch seconds, UTC; None until the first refresh
+        self.utc = None
+        # timezone offset in seconds in effect at ``utc``
+        self.offset = 0
+        # ``time.struct_time`` of the local wall-clock time
+        self.local = None
+        # solar phase color (see Clock._calculate_color)
+        self.color = 0
+        # "H:MM" with the colon blinking once per second
+        self.text = ""
+
+
+class Clock:  # pylint: disable=too-many-instance-attributes
     """
     Clock class
 
@@ -57,10 +81,12 @@ class Clock:
         font = bitmap_font.load_font(ASSETS_DIR + "/IBMPlexMono-Medium-24_jep.bdf")
         self._clock_label = Label(font)
         self._group.append(self._clock_label)
+        # loaded the first time the mini clock needs it
         self._mini_font = None
+        self._mini_font_enabled = True
 
+        # the first sync happens in loop() as soon as WiFi is up
         self._next_ntp_attempt = 0
-        self._ntp_update()
 
         self._last_update_time = None
 
@@ -68,16 +94,39 @@ class Clock:
         self._timezone_cache_until = 0
         self._timezone_cached_offset = 0
         self._solar_prev_sunrise = None
+        self._snapshot = TimeSnapshot()
 
-    def clock(self, label) -> None:
-        """Put the clock into the given label"""
-        # Solar sunrise/sunset from MQTT are Unix UTC seconds; match time.time().
-        label.color = self._calculate_color(time.time())
-        now = time.localtime(self.get_local_time())
+    def snapshot(self) -> TimeSnapshot:
+        """
+        Return the shared snapshot of the current second
 
-        colon = ":" if now[5] % 2 else " "
+        Reads the RTC on every call, but the timezone offset, local time,
+        color and text are only recomputed when the second changes.
+        The same object is updated in place, so callers shouldn't hold on
+        to it across loop passes.
+        """
+        now = int(timesource.time())
+        snap = self._snapshot
+        if snap.utc == now:
+            return snap
+
+        self._check_timezone_offset(now)
+        local = time.localtime(now + self._timezone_cached_offset)
+
+        snap.utc = now
+        snap.offset = self._timezone_cached_offset
+        snap.local = local
+        # Solar sunrise/sunset from MQTT are Unix UTC seconds; match timesource.time().
+        snap.color = self._calculate_color(now)
+        colon = ":" if local[5] % 2 else " "
+        snap.text = f"{local[3]}{colon}{local[4]:02d}"
+        return snap
 
-        label.text = f"{now[3]}{colon}{now[4]:02d}"
+    def clock(self, label) -> None:
+        """Put the clock into the given label"""
+        snap = self.snapshot()
+        label.color = snap.color
+        label.text = snap.text
 
     def update_time(self):
         """Updates the display with the current time; blinks the colon once per second"""
@@ -90,14 +139,31 @@ class Clock:
         self._clock_label.y = self._app.canvas_height // 2
         self._app.show_group(self._group)
 
+    @property
+    def mini_font_enabled(self) -> bool:
+        """
+        Whether the mini clock uses its own small font; turning it off
+        unloads the font and falls back to the built in one
+        """
+        return self._mini_font_enabled
+
+    @mini_font_enabled.setter
+    def mini_font_enabled(self, enabled) -> None:
+        self._mini_font_enabled = enabled
+        if not enabled:
+            self._mini_font = None
+
     def mini_clock(self) -> Label:
         """Create and return a label with the current time rendered into it in a small font"""
-        if self._mini_font is None:
-            # loading a BDF font is slow and allocates; do it once and reuse
-            self._mini_font = bitmap_font.load_font(
-                ASSETS_DIR + "/fonts/intelone-mono-font-family-regular-6.bdf"
-            )
-        label = Label(self._mini_font)
+        if not self._mini_font_enabled:
+            label = Label(terminalio.FONT)
+        else:
+            if self._mini_font is None:
+                # loading a BDF font is slow and allocates; do it once and reuse
+                self._mini_font = bitmap_font.load_font(
+                    ASSETS_DIR + "/fonts/intelone-mono-font-family-regular-6.bdf"
+                )
+            label = Label(self._mini_font)
 
         self.clock(label)
 
@@ -107,27 +173,27 @@ class Clock:
         """
         Do loop processing:
 
-        - call NTP if needed
-        - update the display if needed (once per second)
+        - call NTP if needed and the network is up
+        - update the display if needed (when the second changes)
         """
-        if time.monotonic_ns() >= self._next_ntp_attempt:
+        if (
+            timesource.monotonic_ns() >= self._next_ntp_attempt
+            and self._app.platform.wifi_is_connected
+        ):
             print("NTP update")
             self._ntp_update()
 
-        if (
-            self._last_update_time is None
-            or time.monotonic_ns() > self._last_update_time + 1_000_000_000
-        ):
-            self._last_update_time = time.monotonic_ns()
+        snap = self.snapshot()
+        if snap.utc != self._last_update_time:
+            self._last_update_time = snap.utc
             self.update_time()
 
     def get_local_time(self):
         """Returns the local time in seconds since Jan 1 1970, adjusted by the timezone offset"""
-        now = time.time()
-        self._check_timezone_offset()
-        return now + self._timezone_cached_offset
+        snap = self.snapshot()
+        return snap.utc + snap.offset
 
-    def _check_timezone_offset(self) -> None:
+    def _check_timezone_offset(self, now=None) -> None:
         """
         Gets the timezone offset for the current time.
 
@@ -136,8 +202,11 @@ class Clock:
         Timezone offsets are stored in Data under the key "timezone"
 
         They shoud be moved to Data with an endpoint to set them
+
+        :param now: UTC epoch to check against; defaults to timesource.time()
         """
-        now = time.time()
+        if now is None:
+            now = timesource.time()
 
         # Fresh timezone data must invalidate the cache immediately; otherwise
         # a long cache_until (next DST transition, or forever if all transitions
@@ -184,7 +253,7 @@ class Clock:
     def _calculate_color(self, now):  # pylint: disable=too-many-return-statements
         """
         Colors by solar phase. Expects ``solar`` in Data with ``sunrise`` and ``sunset``
-        as Unix epoch seconds in UTC (same basis as ``time.time()``).
+        as Unix epoch seconds in UTC (same basis as ``timesource.time()``).
 
         When ``sunrise > sunset`` (HA: next sunset still today, next sunrise tomorrow),
         ``now < sunrise - 1h`` is true for almost all of the local *day* because ``sunrise``
@@ -262,7 +331,7 @@ class Clock:
         if solar is None:
             return False
 
-        now = time.time()
+        now = timesource.time()
 
         try:
             sunrise = solar["sunrise"]
@@ -313,10 +382,13 @@ class Clock:
             # here would leave _next_ntp_attempt unset and retry every pass
             try:
                 self._app.rtc.datetime = updated_time
+                self._app.boot.mark("ntp")
             except OSError as error:
                 print("failed to set RTC:", error)
                 next_attempt = Clock.NTP_FAILURE_RETRY_INTERVAL
         else:
             next_attempt = Clock.NTP_FAILURE_RETRY_INTERVAL
 
-        self._next_ntp_attempt = time.monotonic_ns() + next_attempt * 1_000_000_000
+        self._next_ntp_attempt = (
+            timesource.monotonic_ns() + next_attempt * 1_000_000_000
+        )
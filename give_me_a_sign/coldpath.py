@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/coldpath - run rarely used code without keeping it in RAM
+====================================================
+
+* Author: John Romkey
+"""
+
+import sys
+
+# the package the cold modules live in, "give_me_a_sign"
+_PACKAGE = __name__.rpartition(".")[0]
+
+
+def call(name, function, *args):
+    """
+    Import the package's module name, return function(*args) from it,
+    and unload the module again
+
+    Even as .mpy, an imported module's bytecode and constant tables stay
+    on the heap until nothing refers to the module any more. Code that
+    runs once an hour or on reconnect (Home Assistant discovery,
+    connecting, ISO 8601 parsing, diagnostics) lives in modules of its
+    own that are only reached through here, so between uses the
+    collector can take them back. Each use pays for importing the module
+    again.
+
+    Resident code must never import these modules itself, or they'd stay
+    loaded.
+
+    :param name: module name within the package, e.g. "discovery"
+    :param function: name of the function in it to call
+    """
+    full_name = f"{_PACKAGE}.{name}"
+    module = __import__(full_name, None, None, (function,))
+    try:
+        return getattr(module, function)(*args)
+    finally:
+        unload(name)
+
+
+def unload(name) -> None:
+    """Forget the package's module name so it can be collected"""
+    sys.modules.pop(f"{_PACKAGE}.{name}", None)
+    # importing a submodule also binds it in the package
+    package = sys.modules.get(_PACKAGE)
+    if package is not None and name in dir(package):
+        delattr(package, name)
@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/collector - adaptive garbage collection scheduling
+====================================================
+
+* Author: John Romkey
+"""
+
+import gc
+
+from .stats import Histogram
+from . import timesource
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class Collector:
+    """
+    Decides when to run gc.collect() and keeps statistics about it
+
+    A fixed-interval collection lands wherever it lands, including in the
+    middle of a scroll or a tone sequence. Instead the sign offers
+    collections to poll() right after a frame has been drawn, says whether
+    anything time-sensitive is going on, and the collector runs one when
+    it's worth it:
+
+    * when idle and the adaptive interval has passed. The interval is
+      sized so that, at the measured allocation rate, a fraction of the
+      heap left free after the last collection gets used up between
+      collections. A fast allocator or a shrinking heap shortens it, a
+      quiet sign lengthens it.
+    * regardless of activity when the allocations since the last
+      collection approach the free heap, or after MAX_INTERVAL, so a long
+      busy stretch can't starve it.
+
+    Each collection's pause is recorded in a histogram.
+    """
+
+    # seconds
+    MIN_INTERVAL = 1
+    MAX_INTERVAL = 30
+    INITIAL_INTERVAL = 5
+
+    # share of the free heap allowed to be allocated between idle collections
+    BUDGET_FRACTION = 0.25
+    # share at which a collection happens even while busy
+    URGENT_FRACTION = 0.75
+
+    # weight of the newest allocation rate sample in the running average
+    RATE_SMOOTHING = 0.25
+
+    def __init__(self, collect=None, mem_alloc=None, mem_free=None):
+        """
+        :param collect: function to collect garbage, default gc.collect
+        :param mem_alloc: function returning bytes allocated, default gc.mem_alloc
+        :param mem_free: function returning bytes free, default gc.mem_free
+        """
+        # pylint: disable=no-member
+        self._collect = collect or gc.collect
+        self._mem_alloc = mem_alloc or gc.mem_alloc
+        self._mem_free = mem_free or gc.mem_free
+
+        self.pauses = Histogram()
+        self.collections = 0
+        # bytes per second, smoothed
+        self.alloc_rate = 0
+        self.interval = Collector.INITIAL_INTERVAL
+        # free heap right after the last collection
+        self.free_after = self._mem_free()
+
+        self._last_time = timesource.monotonic_ns()
+        self._alloc_after = self._mem_alloc()
+        self._stats_since = self._last_time
+
+    def poll(self, now, idle) -> bool:
+        """
+        Collect if it's due; returns True if a collection ran
+
+        :param now: timesource.monotonic_ns()
+        :param idle: False while something is animating or playing that a
+            pause would be noticeable in
+        """
+        elapsed = now - self._last_time
+        if elapsed < Collector.MIN_INTERVAL * NS_PER_SECOND:
+            return False
+
+        allocated = self._mem_alloc() - self._alloc_after
+        urgent = (
+            allocated >= self.free_after * Collector.URGENT_FRACTION
+            or elapsed >= Collector.MAX_INTERVAL * NS_PER_SECOND
+        )
+        if not urgent and not (idle and elapsed >= self.interval * NS_PER_SECOND):
+            return False
+
+        self.collect(now)
+        return True
+
+    def collect(self, now) -> None:
+        """Collect now, timing it and adapting the interval"""
+        allocated = self._mem_alloc() - self._alloc_after
+        elapsed = now - self._last_time
+
+        start = timesource.monotonic_ns()
+        self._collect()
+        end = timesource.monotonic_ns()
+
+        self.pauses.record((end - start) // 1000)
+        self.collections += 1
+
+        if elapsed > 0:
+            rate = allocated * NS_PER_SECOND // elapsed
+            if self.alloc_rate:
+                self.alloc_rate = int(
+                    self.alloc_rate
+                    + (rate - self.alloc_rate) * Collector.RATE_SMOOTHING
+                )
+            else:
+                self.alloc_rate = rate
+
+        self.free_after = self._mem_free()
+        self._alloc_after = self._mem_alloc()
+        self._last_time = now
+
+        interval = Collector.MAX_INTERVAL
+        if self.alloc_rate:
+            interval = self.free_after * Collector.BUDGET_FRACTION / self.alloc_rate
+        self.interval = max(
+            Collector.MIN_INTERVAL, min(Collector.MAX_INTERVAL, interval)
+        )
+
+    def collections_per_minute(self, now) -> float:
+        """Collections per minute since the statistics were last reset"""
+        elapsed = now - self._stats_since
+        if elapsed <= 0:
+            return 0
+        return self.pauses.count * 60 * NS_PER_SECOND / elapsed
+
+    def reset_stats(self, now) -> None:
+        """Start a new reporting period"""
+        self.pauses.reset()
+        self._stats_since = now
@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/connect - building the MQTT client and subscribing
+====================================================
+
+Only ever reached through coldpath.call(), once per (re)connect. The
+callbacks it registers are SignMQTT's own methods, so nothing here stays
+referenced once it returns.
+
+* Author: John Romkey
+"""
+
+# SignMQTT's helper: reaching into it is the point
+# pylint: disable=protected-access
+
+import os
+
+from .mqtt import _get_setting
+from .session import SessionMQTT
+
+
+def build_client(sign):
+    """
+    A new MiniMQTT client for the broker in settings.toml, with the
+    sign's last will set
+
+    :param sign: the SignMQTT
+    """
+    # a persistent session is found again by client id, so it can't be
+    # MiniMQTT's random one
+    client_id = os.getenv("MQTT_CLIENTID")
+    if not client_id and sign._persistent:
+        client_id = f"givemeasign-{sign._id}"
+
+    # A small socket timeout keeps loop() from stalling the display
+    # loop for seconds at a time. It's also used as the TCP connect
+    # timeout, so don't make it too small.
+    client = SessionMQTT(
+        broker=os.getenv("MQTT_BROKER"),
+        port=_get_setting("MQTT_PORT", 1883),
+        is_ssl=_get_setting("MQTT_SSL", False),
+        client_id=client_id,
+        username=os.getenv("MQTT_USERNAME"),
+        password=os.getenv("MQTT_PASSWORD"),
+        socket_pool=sign._platform.get_socket(),
+        socket_timeout=0.25,
+        # a single bounded attempt per connect() call; otherwise
+        # MiniMQTT retries internally with sleeps of up to ~30s each,
+        # freezing the display. SignMQTT owns the retry/backoff policy.
+        connect_retries=1,
+        # hand callbacks the received bytearray rather than a decoded
+        # copy; json.loads() takes it as is
+        use_binary_mode=True,
+    )
+
+    print("MQTT Connect")
+    client.will_set(f"{sign._ha_sign_base}/available", "offline", retain=True, qos=1)
+    return client
+
+
+def subscribe_all(sign) -> None:
+    """
+    Subscribe the sign's client to every topic it handles
+
+    :param sign: the SignMQTT
+    """
+    # (topic, name the profiler accounts for it under, callback)
+    handlers = []
+    for endpoint in sign.STORE_ENDPOINTS + sign._app.modules.keys():
+        # broadcast topic (all signs) and per-device topic (used by the
+        # Home Assistant text entities)
+        for topic in (
+            f"{sign._topic_prefix}/all/module/{endpoint}",
+            f"{sign._ha_sign_base}/module/{endpoint}",
+        ):
+            handlers.append(
+                (topic, f"store_data:{endpoint}", sign._store_callback(endpoint))
+            )
+
+    # several keys' data in one message
+    for topic in (f"{sign._topic_prefix}/all/bulk", f"{sign._ha_sign_base}/bulk"):
+        handlers.append((topic, "store_bulk", sign._on_bulk))
+
+    # large payloads in chunks: a manifest, then <id>/<index> (see transfer.py)
+    for root in (f"{sign._topic_prefix}/all", sign._ha_sign_base):
+        handlers.append(
+            (f"{root}/transfer", "transfer_manifest", sign._on_transfer_manifest)
+        )
+        handlers.append(
+            (f"{root}/transfer/+/+", "transfer_chunk", sign._on_transfer_chunk)
+        )
+
+    # matches the Home Assistant reboot button's command_topic
+    handlers.append((f"{sign._ha_sign_base}/reboot", "reboot", sign._on_reboot_command))
+
+    handlers.append(
+        (sign._display_command_topic, "display_command", sign._on_display_command)
+    )
+
+    # Home Assistant datetime entity + programmatic epoch/JSON payloads
+    handlers.append((sign._time_command_topic, "time_command", sign._on_time_command))
+
+    # Home Assistant "Publish Data" button dumps the in-memory store
+    handlers.append(
+        (sign._data_publish_topic, "publish_data", sign._on_publish_data_command)
+    )
+
+    # diagnostics reporting intervals
+    handlers.append(
+        (
+            sign._diagnostics_command_topic,
+            "diagnostics_command",
+            sign._on_diagnostics_command,
+        )
+    )
+
+    # Home Assistant switch turning the loop profiler on and off
+    handlers.append((sign._perf_command_topic, "perf_command", sign._on_perf_command))
+
+    # Home Assistant restarting, and per-entity discovery configs from
+    # before the sign published one device config
+    home_assistant = sign._home_assistant
+    handlers.append((home_assistant.STATUS_TOPIC, "ha_status", sign._on_ha_status))
+    if home_assistant.legacy_topic is not None:
+        handlers.append(
+            (home_assistant.legacy_topic, "ha_legacy", sign._on_ha_legacy_config)
+        )
+
+    # every callback is in place before the first SUBSCRIBE goes out: the
+    # broker sends a resumed session's held messages as soon as it can,
+    # even while MiniMQTT waits for a SUBACK, and a message that arrives
+    # before its callback is acked and lost
+    for topic, name, callback in handlers:
+        sign._add_handler(topic, name, callback)
+    sign._subscribe([topic for topic, _, _ in handlers])
@@ -9,11 +9,12 @@ give-me-a-sign/data - data storage for LED Matrix display
 * Author: John Romkey
 """
 
-import time
 import gc
 import json
 import storage
 
+from . import timesource
+
 
 class Data:
     """
@@ -28,11 +29,32 @@ class Data:
     KEY_UPDATED = "updated"
     KEY_LAST_UPDATED = "last_updated"
 
+    # keys whose new values are written through to flash
+    PERSISTENT_KEYS = ("timezone", "playlist")
+
     def __init__(self):
         self._data = {}
+        self._generation = 0
+        self._listeners = []
 
         self._restore()
 
+    @property
+    def generation(self) -> int:
+        """
+        Counter bumped on every change to the store; compare against a
+        saved value to find out cheaply whether anything changed
+        """
+        return self._generation
+
+    def add_listener(self, callback) -> None:
+        """
+        Call callback(key) whenever set_item() or set_items() stores a new
+        value, e.g. to queue every greeting as it arrives rather than just
+        the latest one
+        """
+        self._listeners.append(callback)
+
     def has_item(self, key) -> bool:
         """True if the the key has a value, False otherwise"""
         entry = self._data.get(key)
@@ -40,15 +62,45 @@ class Data:
 
     def set_item(self, key, data) -> None:
         """Set the value of the item associated with key"""
-        self._check_key(key)
+        self._put(key, data, timesource.time())
+        self._generation += 1
+
+        if key in Data.PERSISTENT_KEYS:
+            self._save()
 
-        self._data[key][Data.KEY_DATA] = data
-        self._data[key][Data.KEY_UPDATED] = True
-        self._data[key][Data.KEY_LAST_UPDATED] = time.time()
+        for listener in self._listeners:
+            listener(key)
 
-        if key == "timezone":
+    def set_items(self, items) -> None:
+        """
+        Set several items at once from a dict of key -> value
+
+        All of them are stored before anything hears about it: the
+        generation goes up once, so the playlist rebuilds once, flash is
+        written at most once, and listeners are then called for each key.
+        """
+        if not items:
+            return
+
+        now = timesource.time()
+        save = False
+        for key, data in items.items():
+            self._put(key, data, now)
+            save = save or key in Data.PERSISTENT_KEYS
+        self._generation += 1
+
+        if save:
             self._save()
 
+        for key in items:
+            for listener in self._listeners:
+                listener(key)
+
+    def remove_item(self, key) -> None:
+        """Forget key and its value, e.g. to free memory"""
+        if self._data.pop(key, None) is not None:
+            self._generation += 1
+
     def get_item(self, key, default=None):
         """Get the value of the item associated with key, None if there is none"""
         try:
@@ -72,7 +124,7 @@ class Data:
 
     def age(self, key) -> int:
         """Return the age of the key's value"""
-        return time.time() - self.last_updated(key)
+        return timesource.time() - self.last_updated(key)
 
     def clear_updated(self, key) -> None:
         """Clear the dirty flag for the key"""
@@ -99,6 +151,15 @@ class Data:
         self._data[key][Data.KEY_LAST_UPDATED] = 0
         self._data[key][Data.KEY_UPDATED] = False
 
+    def _put(self, key, data, now) -> None:
+        """Store data under key, marked updated at now"""
+        self._check_key(key)
+
+        entry = self._data[key]
+        entry[Data.KEY_DATA] = data
+        entry[Data.KEY_UPDATED] = True
+        entry[Data.KEY_LAST_UPDATED] = now
+
     def _save(self) -> bool:
         """
         Attempt to save all current data to flash as a JSON file
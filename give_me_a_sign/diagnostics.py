@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/diagnostics - the sign's diagnostics report
+====================================================
+
+Only ever reached through coldpath.call(), once per diagnostics interval.
+
+The report comes in two parts: facts that don't change while the sign is
+connected, published retained to <base>/info when it connects, and a
+small set of metrics published to <base>/diagnostics every interval.
+
+* Author: John Romkey
+"""
+
+import gc
+import os
+import sys
+import board
+
+from . import timesource
+
+
+def info(app) -> dict:
+    """
+    Facts about the sign that don't change while it's connected
+
+    :param app: the GiveMeASign object
+    """
+    flash = os.statvfs("/")
+    return {
+        "python_version": sys.version,
+        "circuitpython_version": ".".join([str(i) for i in sys.implementation[1]]),
+        "platform": sys.platform,
+        "board": board.board_id,
+        "mac_address": app.platform.wifi_mac_address,
+        "display_height": app.display.height,
+        "display_width": app.display.width,
+        "flash_size": flash[0] * flash[2],
+        "flash_free": flash[0] * flash[3],
+        "rtc": "software"
+        if app.rtc.__class__.__name__ == "RTC"
+        else app.rtc.__class__.__name__,
+        "wifi_ssid": app.platform.wifi_ssid,
+        "wifi_bssid": app.platform.wifi_bssid,
+        "ipv4address": str(app.platform.wifi_ip_address),
+    }
+
+
+def collect(app, now) -> dict:
+    """
+    Gather the metrics that change, resetting the interval statistics
+    they report
+
+    :param app: the GiveMeASign object
+    :param now: the clock's TimeSnapshot
+    """
+    metrics = {
+        "uptime": timesource.monotonic_ns() / 1e9,
+        "time_utc": now.utc,
+        "timezone_offset": now.offset,
+        "free_memory": gc.mem_free(),  # pylint: disable=no-member
+        "wifi_rssi": app.platform.wifi_rssi,
+    }
+
+    # milliseconds between display updates since the last report
+    latency = app.render_latency
+    metrics["loop_p50_ms"] = latency.percentile(0.5) / 1000
+    metrics["loop_p99_ms"] = latency.percentile(0.99) / 1000
+    metrics["loop_max_ms"] = latency.max / 1000
+    latency.reset()
+
+    collector = app.collector
+    monotonic_now = timesource.monotonic_ns()
+    metrics["gc_p50_ms"] = collector.pauses.percentile(0.5) / 1000
+    metrics["gc_p99_ms"] = collector.pauses.percentile(0.99) / 1000
+    metrics["gc_per_minute"] = round(collector.collections_per_minute(monotonic_now), 1)
+    metrics["gc_interval"] = round(collector.interval, 1)
+    metrics["alloc_rate"] = collector.alloc_rate
+    collector.reset_stats(monotonic_now)
+
+    metrics["memory_tier"] = app.memory.name
+    metrics["memory_tier_changes"] = app.memory.changes
+
+    # [name, bytes per minute] while the profiler is on
+    if app.profiler.enabled:
+        metrics["top_allocators"] = app.profiler.top_allocators()
+
+    return metrics
@@ -0,0 +1,458 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/discovery - Home Assistant autodiscovery configuration
+====================================================
+
+Only ever reached through coldpath.call(), so the entity definitions are
+in RAM just while the advertisements are being built. The per-entity
+configs come from a generator, which keeps this module alive until it's
+been run to the end.
+
+* Author: John Romkey
+"""
+
+from ._version import __repo__, __version__
+
+# settings every per-entity config repeats, shared once at the top of the
+# device config instead
+_SHARED = (
+    "device",
+    "availability_topic",
+    "payload_available",
+    "payload_not_available",
+)
+
+
+def create_autodiscovery_config(
+    device_id, name, mac_address, base_topic, perf_stages
+):  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    """
+    Generate Home Assistant MQTT autodiscovery configuration
+
+    :param device_id: Home Assistant device id, "givemeasign_<mac>"
+    :param name: device name shown in Home Assistant
+    :param mac_address: WiFi MAC address, colon separated
+    :param base_topic: the sign's MQTT topic base
+    :param perf_stages: names of the loop profiler's stages, each
+        advertised as a diagnostic sensor
+    :return: generator of {"topic": ..., "payload": ...}, each built as
+        it's asked for
+    """
+    availability_topic = f"{base_topic}/available"
+
+    device_info = {
+        "identifiers": [device_id],
+        "name": name,
+        "model": "Adafruit MatrixPortal S3",
+        "manufacturer": "Espressif",
+        "sw_version": __version__,
+        "connections": [["mac", mac_address]],
+    }
+
+    # state from <base>/diagnostics, or <base>/info where "topic" says so
+    sensors = {
+        "python_version": {
+            "topic": "info",
+            "name": "Python Version",
+            "value_template": "{{ value_json.python_version }}",
+            "icon": "mdi:language-python",
+        },
+        "free_memory": {
+            "name": "Free Memory",
+            "value_template": "{{ (value_json.free_memory / 1024 / 1024) | round(2) }}",
+            "unit_of_measurement": "MiB",
+            "device_class": "data_size",
+            "state_class": "measurement",
+            "icon": "mdi:memory",
+        },
+        "flash_free": {
+            "topic": "info",
+            "name": "Flash Free",
+            "value_template": "{{ (value_json.flash_free / 1024 / 1024) | round(2) }}",
+            "unit_of_measurement": "MiB",
+            "device_class": "data_size",
+            "state_class": "measurement",
+            "icon": "mdi:harddisk",
+        },
+        "flash_size": {
+            "topic": "info",
+            "name": "Flash Size",
+            "value_template": "{{ (value_json.flash_size / 1024 / 1024) | round(2) }}",
+            "unit_of_measurement": "MiB",
+            "device_class": "data_size",
+            "state_class": "measurement",
+            "icon": "mdi:harddisk",
+        },
+        "last_update": {
+            "name": "Last Update",
+            "value_template": "{{ value_json.time_utc_iso }}",
+            "device_class": "timestamp",
+            "icon": "mdi:clock",
+        },
+        "timezone_offset": {
+            "name": "Timezone Offset",
+            "value_template": "{{ (value_json.timezone_offset / 3600) | round(1) }}",
+            "unit_of_measurement": "hours",
+            "state_class": "measurement",
+            "icon": "mdi:clock-time-eight",
+        },
+        "time_utc": {
+            "name": "Current Timezone UTC",
+            "value_template": "{{ value_json.time_utc }}",
+            "unit_of_measurement": "seconds",
+            "icon": "mdi:clock",
+        },
+    }
+
+    diagnostics = {
+        "board": {
+            "topic": "info",
+            "name": "Device Board",
+            "value_template": "{{ value_json.board }}",
+            "icon": "mdi:developer-board",
+        },
+        "circuitpython_version": {
+            "topic": "info",
+            "name": "CircuitPython Version",
+            "value_template": "{{ value_json.circuitpython_version }}",
+            "icon": "mdi:information",
+        },
+        "wifi_rssi": {
+            "name": "WiFi RSSI",
+            "value_template": "{{ value_json.wifi_rssi }}",
+            "unit_of_measurement": "dBm",
+            "device_class": "signal_strength",
+            "state_class": "measurement",
+            "icon": "mdi:wifi",
+        },
+        "wifi_ssid": {
+            "topic": "info",
+            "name": "WiFi SSID",
+            "value_template": "{{ value_json.wifi_ssid }}",
+            "icon": "mdi:wifi",
+        },
+        "wifi_bssid": {
+            "topic": "info",
+            "name": "WiFi BSSID",
+            "value_template": "{{ value_json.wifi_bssid }}",
+            "icon": "mdi:wifi",
+        },
+        "ip_address": {
+            "topic": "info",
+            "name": "IP Address",
+            "value_template": "{{ value_json.ipv4address }}",
+            "icon": "mdi:ip-network",
+        },
+        "display_resolution": {
+            "topic": "info",
+            "name": "Display Resolution",
+            "value_template": "{{ value_json.display_width }}x{{ value_json.display_height }}",
+            "icon": "mdi:monitor",
+        },
+        "uptime": {
+            "name": "Uptime",
+            "value_template": "{{ value_json.uptime | int }}",
+            "unit_of_measurement": "s",
+            "device_class": "duration",
+            "state_class": "measurement",
+            "icon": "mdi:clock",
+        },
+        "rtc_status": {
+            "topic": "info",
+            "name": "RTC",
+            "value_template": "{{ value_json.rtc }}",
+            "icon": "mdi:clock-outline",
+        },
+    }
+
+    text_inputs = {
+        "greet": {
+            "name": "Greeting Text",
+            "command_topic": f"{base_topic}/module/greet",
+            "icon": "mdi:hand-wave",
+        },
+        "message": {
+            "name": "Message Text",
+            "command_topic": f"{base_topic}/module/message",
+            "icon": "mdi:message-text",
+        },
+    }
+
+    buttons = {
+        "reboot": {
+            "name": "Reboot Device",
+            "command_topic": f"{base_topic}/reboot",
+            "payload_press": "reboot",
+            "icon": "mdi:restart",
+        },
+        "publish_data": {
+            "name": "Publish Data Store",
+            "command_topic": f"{base_topic}/data/publish",
+            "payload_press": "publish",
+            "icon": "mdi:database-export",
+            "entity_category": "diagnostic",
+        },
+    }
+
+    switches = {
+        "display": {
+            "name": "Matrix display",
+            "command_topic": f"{base_topic}/display/set",
+            "state_topic": f"{base_topic}/display/state",
+            "payload_on": "ON",
+            "payload_off": "OFF",
+            "icon": "mdi:monitor",
+            "entity_category": "config",
+        },
+        "perf": {
+            "name": "Loop Profiler",
+            "command_topic": f"{base_topic}/perf/set",
+            "state_topic": f"{base_topic}/perf/state",
+            "payload_on": "ON",
+            "payload_off": "OFF",
+            "icon": "mdi:timer-cog",
+            "entity_category": "config",
+        },
+    }
+
+    datetimes = {
+        "device_time": {
+            "name": "Device Time",
+            "command_topic": f"{base_topic}/time/set",
+            "state_topic": f"{base_topic}/time/state",
+            "icon": "mdi:clock-edit",
+            "entity_category": "config",
+        }
+    }
+
+    for sensor_key, sensor_config in sensors.items():
+        topic = f"homeassistant/sensor/{device_id}/{sensor_key}/config"
+
+        payload = {
+            "name": sensor_config["name"],
+            "state_topic": f"{base_topic}/{sensor_config.get('topic', 'diagnostics')}",
+            "value_template": sensor_config["value_template"],
+            "icon": sensor_config["icon"],
+            "unique_id": f"{device_id}_{sensor_key}",
+            "availability_topic": availability_topic,
+            "payload_available": "online",
+            "payload_not_available": "offline",
+            "device": device_info
+            if sensor_key == "python_version"
+            else {"identifiers": [device_id]},
+        }
+
+        if "unit_of_measurement" in sensor_config:
+            payload["unit_of_measurement"] = sensor_config["unit_of_measurement"]
+        if "device_class" in sensor_config:
+            payload["device_class"] = sensor_config["device_class"]
+        if "state_class" in sensor_config:
+            payload["state_class"] = sensor_config["state_class"]
+
+        yield {"topic": topic, "payload": payload}
+
+    for diagnostic_key, diagnostic_config in diagnostics.items():
+        topic = f"homeassistant/sensor/{device_id}/{diagnostic_key}/config"
+
+        payload = {
+            "name": diagnostic_config["name"],
+            "state_topic": f"{base_topic}/{diagnostic_config.get('topic', 'diagnostics')}",
+            "value_template": diagnostic_config["value_template"],
+            "icon": diagnostic_config["icon"],
+            "unique_id": f"{device_id}_{diagnostic_key}",
+            "entity_category": "diagnostic",
+            "availability_topic": availability_topic,
+            "payload_available": "online",
+            "payload_not_available": "offline",
+            "device": {"identifiers": [device_id]},
+        }
+
+        if "unit_of_measurement" in diagnostic_config:
+            payload["unit_of_measurement"] = diagnostic_config["unit_of_measurement"]
+        if "device_class" in diagnostic_config:
+            payload["device_class"] = diagnostic_config["device_class"]
+        if "state_class" in diagnostic_config:
+            payload["state_class"] = diagnostic_config["state_class"]
+
+        yield {"topic": topic, "payload": payload}
+
+    # one sensor per loop stage: p95 as the state, p50/p95/max as
+    # attributes
+    for stage in perf_stages:
+        topic = f"homeassistant/sensor/{device_id}/perf_{stage}/config"
+
+        payload = {
+            "name": f"Loop {stage} p95",
+            "state_topic": f"{base_topic}/perf",
+            "value_template": f"{{{{ value_json['{stage}'].p95 }}}}",
+            "json_attributes_topic": f"{base_topic}/perf",
+            "json_attributes_template": f"{{{{ value_json['{stage}'] | tojson }}}}",
+            "unit_of_measurement": "ms",
+            "state_class": "measurement",
+            "icon": "mdi:timer-outline",
+            "unique_id": f"{device_id}_perf_{stage}",
+            "entity_category": "diagnostic",
+            "availability_topic": availability_topic,
+            "payload_available": "online",
+            "payload_not_available": "offline",
+            "device": {"identifiers": [device_id]},
+        }
+
+        yield {"topic": topic, "payload": payload}
+
+    # power-on to first clock; the other milestones as attributes
+    yield {
+        "topic": f"homeassistant/sensor/{device_id}/boot_time/config",
+        "payload": {
+            "name": "Boot Time",
+            "state_topic": f"{base_topic}/boot",
+            "value_template": "{{ value_json.first_clock / 1000 }}",
+            "json_attributes_topic": f"{base_topic}/boot",
+            "unit_of_measurement": "s",
+            "device_class": "duration",
+            "icon": "mdi:timer-play-outline",
+            "unique_id": f"{device_id}_boot_time",
+            "entity_category": "diagnostic",
+            "availability_topic": availability_topic,
+            "payload_available": "online",
+            "payload_not_available": "offline",
+            "device": {"identifiers": [device_id]},
+        },
+    }
+
+    for text_key, text_config in text_inputs.items():
+        topic = f"homeassistant/text/{device_id}/{text_key}/config"
+        topic_notify = f"homeassistant/notify/{device_id}/{text_key}/config"
+
+        payload = {
+            "name": text_config["name"],
+            "command_topic": text_config["command_topic"],
+            "icon": text_config["icon"],
+            "unique_id": f"{device_id}_{text_key}",
+            "availability_topic": availability_topic,
+            "payload_available": "online",
+            "payload_not_available": "offline",
+            "device": {"identifiers": [device_id]},
+        }
+
+        yield {"topic": topic, "payload": payload}
+
+        # unique_id must be unique across the whole MQTT integration, so the
+        # notify entity can't share the text entity's id
+        notify_payload = dict(payload)
+        notify_payload["unique_id"] = f"{device_id}_{text_key}_notify"
+        if text_key == "message":
+            # Home Assistant's notify service typically sends {"message": "..."}.
+            # Map that to the plain-text payload expected by this command topic.
+            notify_payload["command_template"] = "{{ value_json.message }}"
+        yield {"topic": topic_notify, "payload": notify_payload}
+
+    for button_key, button_config in buttons.items():
+        topic = f"homeassistant/button/{device_id}/{button_key}/config"
+
+        payload = {
+            "name": button_config["name"],
+            "command_topic": button_config["command_topic"],
+            "payload_press": button_config["payload_press"],
+            "icon": button_config["icon"],
+            "unique_id": f"{device_id}_{button_key}",
+            "availability_topic": availability_topic,
+            "payload_available": "online",
+            "payload_not_available": "offline",
+            "device": {"identifiers": [device_id]},
+        }
+        if "entity_category" in button_config:
+            payload["entity_category"] = button_config["entity_category"]
+
+        yield {"topic": topic, "payload": payload}
+
+    for switch_key, switch_config in switches.items():
+        topic = f"homeassistant/switch/{device_id}/{switch_key}/config"
+
+        payload = {
+            "name": switch_config["name"],
+            "command_topic": switch_config["command_topic"],
+            "state_topic": switch_config["state_topic"],
+            "payload_on": switch_config["payload_on"],
+            "payload_off": switch_config["payload_off"],
+            "icon": switch_config["icon"],
+            "unique_id": f"{device_id}_{switch_key}",
+            "availability_topic": availability_topic,
+            "payload_available": "online",
+            "payload_not_available": "offline",
+            "device": {"identifiers": [device_id]},
+        }
+        if "entity_category" in switch_config:
+            payload["entity_category"] = switch_config["entity_category"]
+
+        yield {"topic": topic, "payload": payload}
+
+    for datetime_key, datetime_config in datetimes.items():
+        topic = f"homeassistant/datetime/{device_id}/{datetime_key}/config"
+
+        payload = {
+            "name": datetime_config["name"],
+            "command_topic": datetime_config["command_topic"],
+            "state_topic": datetime_config["state_topic"],
+            "icon": datetime_config["icon"],
+            "unique_id": f"{device_id}_{datetime_key}",
+            "availability_topic": availability_topic,
+            "payload_available": "online",
+            "payload_not_available": "offline",
+            "device": {"identifiers": [device_id]},
+        }
+        if "entity_category" in datetime_config:
+            payload["entity_category"] = datetime_config["entity_category"]
+
+        yield {"topic": topic, "payload": payload}
+
+
+def create_device_config(device_id, name, mac_address, base_topic, perf_stages):
+    """
+    Generate one Home Assistant device discovery payload, for
+    homeassistant/device/<device_id>/config, holding every entity
+
+    Needs Home Assistant 2024.12 or later. The entities are the ones
+    create_autodiscovery_config() advertises one by one, with the same
+    unique ids, so either way Home Assistant ends up with the same
+    entities.
+
+    :param device_id: Home Assistant device id, "givemeasign_<mac>"
+    :param name: device name shown in Home Assistant
+    :param mac_address: WiFi MAC address, colon separated
+    :param base_topic: the sign's MQTT topic base
+    :param perf_stages: names of the loop profiler's stages
+    :return: the payload, as a dict
+    """
+    components = {}
+    device_info = None
+    for message in create_autodiscovery_config(
+        device_id, name, mac_address, base_topic, perf_stages
+    ):
+        # homeassistant/<platform>/<device_id>/<object_id>/config
+        payload = message["payload"]
+        if "name" in payload.get("device", {}):
+            device_info = payload["device"]
+        component = {"platform": message["topic"].split("/")[1]}
+        for key, value in payload.items():
+            if key not in _SHARED:
+                component[key] = value
+        # the text and notify entities share an object id; unique ids don't
+        components[payload["unique_id"][len(device_id) + 1 :]] = component
+
+    return {
+        "device": device_info,
+        "origin": {
+            "name": "give-me-a-sign",
+            "sw_version": __version__,
+            "support_url": __repo__,
+        },
+        "availability_topic": f"{base_topic}/available",
+        "payload_available": "online",
+        "payload_not_available": "offline",
+        "qos": 1,
+        "components": components,
+    }
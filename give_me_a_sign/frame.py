@@ -0,0 +1,192 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/frame - pre-rendered frames for LED Matrix display
+====================================================
+
+* Author: John Romkey
+"""
+
+import displayio
+import bitmaptools
+
+
+class Frame:
+    """
+    Show frames rendered somewhere else
+
+    Laying out text and decoding BMPs is most of what the sign spends its
+    time on. A frame is an indexed bitmap that a faster machine has
+    already rendered; the sign copies its pixels into a Bitmap it keeps
+    and shows that, so a chart costs the sign no more than a blank screen.
+
+    Frames arrive as binary MQTT messages on {prefix}/all/module/frame,
+    or through a transfer to the "frame" key:
+
+    ======  ======  ==================================================
+    offset  bytes
+    ======  ======  ==================================================
+    0       2       b"GF"
+    2       1       encoding: 0 raw, 1 run-length
+    3       1       number of palette colors - 1
+    4       2       width, little-endian
+    6       2       height, little-endian
+    8       3 * n   palette, R G B for each color
+    ...             pixels, one palette index a byte, row by row
+    ======  ======  ==================================================
+
+    A frame is either the size of the 64x32 canvas, scaled up to fill the
+    display as modules' screens are, or the size of the display itself.
+    Short of memory (MemoryPressure.DROP_FONTS and on), only canvas sized
+    frames are taken.
+
+    Run-length encoded rows are runs of a control byte n followed by
+    either n + 1 literal pixels (n < 128) or one pixel repeated n - 126
+    times (n >= 128). A run never goes past the end of its row, so each
+    is one bitmaptools.arrayblit() or fill_region() straight into the
+    Bitmap, without decoding into a buffer first.
+    """
+
+    KEY = "frame"
+
+    MAGIC = b"GF"
+    RAW = 0
+    RLE = 1
+    HEADER_SIZE = 8
+    MAX_COLORS = 256
+
+    def __init__(self, app):
+        self._app = app
+        self._palette = displayio.Palette(Frame.MAX_COLORS)
+        self._bitmap = None
+        self._group = None
+        # False until a frame decodes in full into the bitmap
+        self._valid = False
+        self._allocate(app.canvas_width, app.canvas_height)
+
+    def _allocate(self, width, height) -> None:
+        """A Bitmap, and a group to show it in, for width x height frames"""
+        self._bitmap = None
+        self._group = None
+        self._bitmap = displayio.Bitmap(width, height, Frame.MAX_COLORS)
+        self._group = displayio.Group()
+        self._group.append(displayio.TileGrid(self._bitmap, pixel_shader=self._palette))
+
+    def receive(self, payload):
+        """
+        Decode a frame into the bitmap; returns what to store in Data
+        about it, or None if it's not a frame the sign can show
+        """
+        try:
+            width, height, encoding, colors = self._read_header(payload)
+        except (ValueError, IndexError, TypeError) as error:
+            print("frame: bad header", error)
+            return None
+
+        # the palette and bitmap on screen are about to change
+        self._valid = False
+        view = memoryview(payload)
+        offset = Frame.HEADER_SIZE
+        palette = self._palette
+        for index in range(colors):
+            palette[index] = (
+                (view[offset] << 16) | (view[offset + 1] << 8) | view[offset + 2]
+            )
+            offset += 3
+
+        if self._bitmap.width != width or self._bitmap.height != height:
+            self._allocate(width, height)
+
+        try:
+            if encoding == Frame.RAW:
+                self._decode_raw(view, offset, width, height)
+            else:
+                self._decode_rle(view, offset, width, height)
+        except ValueError as error:
+            print("frame: bad pixels", error)
+            return None
+
+        self._valid = True
+        return {
+            "width": width,
+            "height": height,
+            "colors": colors,
+            "encoding": "raw" if encoding == Frame.RAW else "rle",
+            "bytes": len(payload),
+        }
+
+    def _read_header(self, payload) -> tuple:
+        """(width, height, encoding, colors), checked against the display"""
+        if len(payload) < Frame.HEADER_SIZE or payload[0:2] != Frame.MAGIC:
+            raise ValueError("not a frame")
+
+        encoding = payload[2]
+        colors = payload[3] + 1
+        width = payload[4] | (payload[5] << 8)
+        height = payload[6] | (payload[7] << 8)
+        if encoding not in (Frame.RAW, Frame.RLE):
+            raise ValueError(f"encoding {encoding}")
+        if (width, height) not in (
+            (self._app.canvas_width, self._app.canvas_height),
+            (self._app.display.width, self._app.display.height),
+        ):
+            raise ValueError(f"size {width}x{height}")
+        if len(payload) < Frame.HEADER_SIZE + 3 * colors:
+            raise ValueError("short palette")
+        return width, height, encoding, colors
+
+    def _decode_raw(self, view, offset, width, height) -> None:
+        if len(view) - offset != width * height:
+            raise ValueError(f"{len(view) - offset} bytes of pixels")
+        bitmaptools.arrayblit(self._bitmap, view[offset:], 0, 0, width, height)
+
+    def _decode_rle(self, view, offset, width, height) -> None:
+        bitmap = self._bitmap
+        end = len(view)
+        for y in range(height):
+            x = 0
+            while x < width:
+                if offset >= end:
+                    raise ValueError(f"ends in row {y}")
+                control = view[offset]
+                offset += 1
+                if control < 128:
+                    count = control + 1
+                    if x + count > width or offset + count > end:
+                        raise ValueError(f"run past row {y}")
+                    bitmaptools.arrayblit(
+                        bitmap, view[offset : offset + count], x, y, x + count, y + 1
+                    )
+                    offset += count
+                else:
+                    count = control - 126
+                    if x + count > width or offset >= end:
+                        raise ValueError(f"run past row {y}")
+                    bitmaptools.fill_region(
+                        bitmap, x, y, x + count, y + 1, view[offset]
+                    )
+                    offset += 1
+                x += count
+        if offset != end:
+            raise ValueError(f"{end - offset} bytes left over")
+
+    def show(self) -> bool:
+        """
+        Show the last frame received, or return False if there's none
+        (e.g. after a reboot, when Data remembers one but the bitmap
+        doesn't)
+        """
+        if not self._valid:
+            return False
+
+        bitmap = self._bitmap
+        if (
+            bitmap.width == self._app.canvas_width
+            and bitmap.height == self._app.canvas_height
+        ):
+            self._app.show_group(self._group)
+        else:
+            self._app.display.root_group = self._group
+        return True
@@ -33,11 +33,12 @@ class Greet:
         """
         self._app = app
 
-    def show(self) -> bool:
+    def show(self, greeting=None) -> bool:
         """
-        Display the current greeting if valid.
+        Display a greeting if valid.
 
-        Greetings are stored in Data under the key "greet"
+        :param greeting: the greeting to show; if None, the one stored in
+            Data under the key "greet" is shown if it's new
 
         Data structure should look like:
 
@@ -49,14 +50,16 @@ class Greet:
         The person's name should be in the format "John R.", giving only the
         last initial and not the full name.
         """
-        if not self._app.data.is_updated(Greet.KEY):
-            print("not updated")
-            return False
+        if greeting is None:
+            if not self._app.data.is_updated(Greet.KEY):
+                print("not updated")
+                return False
 
-        self._app.data.clear_updated(Greet.KEY)
+            self._app.data.clear_updated(Greet.KEY)
+            greeting = self._app.data.get_item(Greet.KEY)
 
         try:
-            person = self._app.data.get_item(Greet.KEY)["person"]
+            person = greeting["person"]
         except (KeyError, TypeError):
             return False
 
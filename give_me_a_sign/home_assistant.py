@@ -9,20 +9,42 @@ give_me_a_sign.home_assistant — Home Assistant MQTT autodiscovery
 * Author: John Romkey
 """
 
+import binascii
 import json
-import time
 import os
 
-from ._version import __version__
+from . import coldpath
+from . import timesource
 
 
-class HomeAssistant:
+class HomeAssistant:  # pylint: disable=too-many-instance-attributes
     """
     Home Assistant Autodiscovery module
     Publishes messages to MQTT that inform Home Assistant of functionality in GiveMeASign
+
+    By default every entity goes out in one retained device discovery
+    message (Home Assistant 2024.12 and later). It's published once
+    after boot, then again only if its contents change or Home Assistant
+    announces on homeassistant/status that it restarted. Per-entity
+    configs left on the broker from older versions are migrated to it
+    and cleared.
+
+    HA_DISCOVERY = "entity" in settings.toml advertises each entity on
+    its own topic every hour instead, for older Home Assistants.
     """
 
-    def __init__(self, mac_address, mqtt_client, base_topic):
+    # Home Assistant's birth and last will
+    STATUS_TOPIC = "homeassistant/status"
+
+    # published to a per-entity config topic to hand its entity over to
+    # the device config
+    MIGRATE_PAYLOAD = '{"migrate_discovery": true}'
+
+    # publishing time per loop() call; QoS 1 waits for each PUBACK, so an
+    # advertisement sent all at once could hold up the display for seconds
+    PUBLISH_BUDGET_NS = 20_000_000
+
+    def __init__(self, mac_address, mqtt_client, base_topic, perf_stages=()):
         """Initialize Home Assistant MQTT autodiscovery manager
 
         Args:
@@ -30,6 +52,8 @@ class HomeAssistant:
             mqtt_client: MQTT client object with publish() method
             base_topic (str): the sign's MQTT topic base, shared with SignMQTT
                 so that command/state topics match its subscriptions
+            perf_stages (tuple): names of the loop profiler's stages, each
+                advertised as a diagnostic sensor
         """
         self._name = "GiveMeASign - " + os.getenv("SIGN_NAME", mac_address)
         self._mac_address = mac_address
@@ -38,342 +62,146 @@ class HomeAssistant:
         self._device_id = f"givemeasign_{mac_clean}"
         self._base_topic = base_topic
         self._availability_topic = f"{self._base_topic}/available"
+        self._perf_stages = perf_stages
         self._last_advertisement_time = None  # None -> publish immediately
         self._advertisement_interval = 3600  # 1 hour in seconds
 
+        self._device_discovery = os.getenv("HA_DISCOVERY") != "entity"
+        self._device_topic = f"homeassistant/device/{self._device_id}/config"
+        # the serialized device config and its CRC-32; None -> build it
+        self._device_payload = None
+        self._device_hash = None
+        # CRC-32 of what's retained on the broker; None -> publish
+        self._published_hash = None
+        # per-entity config topics found retained on the broker
+        self._legacy_topics = []
+        # generator of (topic, payload) still to publish, or None
+        self._pending = None
+
+    @property
+    def legacy_topic(self):
+        """
+        Topic filter matching this sign's per-entity configs, to find
+        ones to migrate; None when they're what the sign publishes
+        """
+        if not self._device_discovery:
+            return None
+        return f"homeassistant/+/{self._device_id}/+/config"
+
     def set_mqtt_client(self, mqtt_client):
         """Point discovery/publish at a new client after MQTT is rebuilt (e.g. WiFi restore)."""
         self._mqtt_client = mqtt_client
-
-    def create_autodiscovery_config(
-        self,
-    ):  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+        # rebuild and compare on the next loop; only a change is republished
+        self._device_payload = None
+        if self._pending is not None:
+            # start an interrupted advertisement over; an interrupted
+            # migration picks its topics up again when they're resubscribed
+            self._pending = None
+            self._last_advertisement_time = None
+
+    def create_autodiscovery_config(self):
         """Generate Home Assistant MQTT autodiscovery configuration"""
+        return coldpath.call(
+            "discovery",
+            "create_autodiscovery_config",
+            self._device_id,
+            self._name,
+            self._mac_address,
+            self._base_topic,
+            self._perf_stages,
+        )
 
-        device_info = {
-            "identifiers": [self._device_id],
-            "name": self._name,
-            "model": "Adafruit MatrixPortal S3",
-            "manufacturer": "Espressif",
-            "sw_version": __version__,
-            "connections": [["mac", self._mac_address]],
-        }
-
-        sensors = {
-            "python_version": {
-                "name": "Python Version",
-                "value_template": "{{ value_json.python_version }}",
-                "icon": "mdi:language-python",
-            },
-            "free_memory": {
-                "name": "Free Memory",
-                "value_template": "{{ (value_json.free_memory / 1024 / 1024) | round(2) }}",
-                "unit_of_measurement": "MiB",
-                "device_class": "data_size",
-                "state_class": "measurement",
-                "icon": "mdi:memory",
-            },
-            "flash_free": {
-                "name": "Flash Free",
-                "value_template": "{{ (value_json.flash_free / 1024 / 1024) | round(2) }}",
-                "unit_of_measurement": "MiB",
-                "device_class": "data_size",
-                "state_class": "measurement",
-                "icon": "mdi:harddisk",
-            },
-            "flash_size": {
-                "name": "Flash Size",
-                "value_template": "{{ (value_json.flash_size / 1024 / 1024) | round(2) }}",
-                "unit_of_measurement": "MiB",
-                "device_class": "data_size",
-                "state_class": "measurement",
-                "icon": "mdi:harddisk",
-            },
-            "last_update": {
-                "name": "Last Update",
-                "value_template": "{{ value_json.time_utc_iso }}",
-                "device_class": "timestamp",
-                "icon": "mdi:clock",
-            },
-            "timezone_offset": {
-                "name": "Timezone Offset",
-                "value_template": "{{ (value_json.timezone_offset / 3600) | round(1) }}",
-                "unit_of_measurement": "hours",
-                "state_class": "measurement",
-                "icon": "mdi:clock-time-eight",
-            },
-            "time_utc": {
-                "name": "Current Timezone UTC",
-                "value_template": "{{ value_json.time_utc }}",
-                "unit_of_measurement": "seconds",
-                "icon": "mdi:clock",
-            },
-        }
-
-        diagnostics = {
-            "board": {
-                "name": "Device Board",
-                "value_template": "{{ value_json.board }}",
-                "icon": "mdi:developer-board",
-            },
-            "circuitpython_version": {
-                "name": "CircuitPython Version",
-                "value_template": "{{ value_json.circuitpython_version }}",
-                "icon": "mdi:information",
-            },
-            "wifi_rssi": {
-                "name": "WiFi RSSI",
-                "value_template": "{{ value_json.wifi_rssi }}",
-                "unit_of_measurement": "dBm",
-                "device_class": "signal_strength",
-                "state_class": "measurement",
-                "icon": "mdi:wifi",
-            },
-            "wifi_ssid": {
-                "name": "WiFi SSID",
-                "value_template": "{{ value_json.wifi_ssid }}",
-                "icon": "mdi:wifi",
-            },
-            "wifi_bssid": {
-                "name": "WiFi BSSID",
-                "value_template": "{{ value_json.wifi_bssid }}",
-                "icon": "mdi:wifi",
-            },
-            "ip_address": {
-                "name": "IP Address",
-                "value_template": "{{ value_json.ipv4address }}",
-                "icon": "mdi:ip-network",
-            },
-            "display_resolution": {
-                "name": "Display Resolution",
-                "value_template": "{{ value_json.display_width }}x{{ value_json.display_height }}",
-                "icon": "mdi:monitor",
-            },
-            "uptime": {
-                "name": "Uptime",
-                "value_template": "{{ value_json.uptime | int }}",
-                "unit_of_measurement": "s",
-                "device_class": "duration",
-                "state_class": "measurement",
-                "icon": "mdi:clock",
-            },
-            "rtc_status": {
-                "name": "RTC",
-                "value_template": "{{ value_json.rtc }}",
-                "icon": "mdi:clock-outline",
-            },
-        }
-
-        text_inputs = {
-            "greet": {
-                "name": "Greeting Text",
-                "command_topic": f"{self._base_topic}/module/greet",
-                "icon": "mdi:hand-wave",
-            },
-            "message": {
-                "name": "Message Text",
-                "command_topic": f"{self._base_topic}/module/message",
-                "icon": "mdi:message-text",
-            },
-        }
-
-        buttons = {
-            "reboot": {
-                "name": "Reboot Device",
-                "command_topic": f"{self._base_topic}/reboot",
-                "payload_press": "reboot",
-                "icon": "mdi:restart",
-            },
-            "publish_data": {
-                "name": "Publish Data Store",
-                "command_topic": f"{self._base_topic}/data/publish",
-                "payload_press": "publish",
-                "icon": "mdi:database-export",
-                "entity_category": "diagnostic",
-            },
-        }
-
-        switches = {
-            "display": {
-                "name": "Matrix display",
-                "command_topic": f"{self._base_topic}/display/set",
-                "state_topic": f"{self._base_topic}/display/state",
-                "payload_on": "ON",
-                "payload_off": "OFF",
-                "icon": "mdi:monitor",
-                "entity_category": "config",
-            }
-        }
-
-        datetimes = {
-            "device_time": {
-                "name": "Device Time",
-                "command_topic": f"{self._base_topic}/time/set",
-                "state_topic": f"{self._base_topic}/time/state",
-                "icon": "mdi:clock-edit",
-                "entity_category": "config",
-            }
-        }
-
-        autodiscovery_messages = []
-
-        for sensor_key, sensor_config in sensors.items():
-            topic = f"homeassistant/sensor/{self._device_id}/{sensor_key}/config"
-
-            payload = {
-                "name": sensor_config["name"],
-                "state_topic": f"{self._base_topic}/diagnostics",
-                "value_template": sensor_config["value_template"],
-                "icon": sensor_config["icon"],
-                "unique_id": f"{self._device_id}_{sensor_key}",
-                "availability_topic": self._availability_topic,
-                "payload_available": "online",
-                "payload_not_available": "offline",
-                "device": device_info
-                if sensor_key == "python_version"
-                else {"identifiers": [self._device_id]},
-            }
-
-            if "unit_of_measurement" in sensor_config:
-                payload["unit_of_measurement"] = sensor_config["unit_of_measurement"]
-            if "device_class" in sensor_config:
-                payload["device_class"] = sensor_config["device_class"]
-            if "state_class" in sensor_config:
-                payload["state_class"] = sensor_config["state_class"]
-
-            autodiscovery_messages.append({"topic": topic, "payload": payload})
-
-        for diagnostic_key, diagnostic_config in diagnostics.items():
-            topic = f"homeassistant/sensor/{self._device_id}/{diagnostic_key}/config"
-
-            payload = {
-                "name": diagnostic_config["name"],
-                "state_topic": f"{self._base_topic}/diagnostics",
-                "value_template": diagnostic_config["value_template"],
-                "icon": diagnostic_config["icon"],
-                "unique_id": f"{self._device_id}_{diagnostic_key}",
-                "entity_category": "diagnostic",
-                "availability_topic": self._availability_topic,
-                "payload_available": "online",
-                "payload_not_available": "offline",
-                "device": {"identifiers": [self._device_id]},
-            }
-
-            if "unit_of_measurement" in diagnostic_config:
-                payload["unit_of_measurement"] = diagnostic_config[
-                    "unit_of_measurement"
-                ]
-            if "device_class" in diagnostic_config:
-                payload["device_class"] = diagnostic_config["device_class"]
-            if "state_class" in diagnostic_config:
-                payload["state_class"] = diagnostic_config["state_class"]
-
-            autodiscovery_messages.append({"topic": topic, "payload": payload})
-
-        for text_key, text_config in text_inputs.items():
-            topic = f"homeassistant/text/{self._device_id}/{text_key}/config"
-            topic_notify = f"homeassistant/notify/{self._device_id}/{text_key}/config"
-
-            payload = {
-                "name": text_config["name"],
-                "command_topic": text_config["command_topic"],
-                "icon": text_config["icon"],
-                "unique_id": f"{self._device_id}_{text_key}",
-                "availability_topic": self._availability_topic,
-                "payload_available": "online",
-                "payload_not_available": "offline",
-                "device": {"identifiers": [self._device_id]},
-            }
-
-            autodiscovery_messages.append({"topic": topic, "payload": payload})
-
-            # unique_id must be unique across the whole MQTT integration, so the
-            # notify entity can't share the text entity's id
-            notify_payload = dict(payload)
-            notify_payload["unique_id"] = f"{self._device_id}_{text_key}_notify"
-            if text_key == "message":
-                # Home Assistant's notify service typically sends {"message": "..."}.
-                # Map that to the plain-text payload expected by this command topic.
-                notify_payload["command_template"] = "{{ value_json.message }}"
-            autodiscovery_messages.append(
-                {"topic": topic_notify, "payload": notify_payload}
-            )
-
-        for button_key, button_config in buttons.items():
-            topic = f"homeassistant/button/{self._device_id}/{button_key}/config"
-
-            payload = {
-                "name": button_config["name"],
-                "command_topic": button_config["command_topic"],
-                "payload_press": button_config["payload_press"],
-                "icon": button_config["icon"],
-                "unique_id": f"{self._device_id}_{button_key}",
-                "availability_topic": self._availability_topic,
-                "payload_available": "online",
-                "payload_not_available": "offline",
-                "device": {"identifiers": [self._device_id]},
-            }
-            if "entity_category" in button_config:
-                payload["entity_category"] = button_config["entity_category"]
-
-            autodiscovery_messages.append({"topic": topic, "payload": payload})
-
-        for switch_key, switch_config in switches.items():
-            topic = f"homeassistant/switch/{self._device_id}/{switch_key}/config"
-
-            payload = {
-                "name": switch_config["name"],
-                "command_topic": switch_config["command_topic"],
-                "state_topic": switch_config["state_topic"],
-                "payload_on": switch_config["payload_on"],
-                "payload_off": switch_config["payload_off"],
-                "icon": switch_config["icon"],
-                "unique_id": f"{self._device_id}_{switch_key}",
-                "availability_topic": self._availability_topic,
-                "payload_available": "online",
-                "payload_not_available": "offline",
-                "device": {"identifiers": [self._device_id]},
-            }
-            if "entity_category" in switch_config:
-                payload["entity_category"] = switch_config["entity_category"]
-
-            autodiscovery_messages.append({"topic": topic, "payload": payload})
-
-        for datetime_key, datetime_config in datetimes.items():
-            topic = f"homeassistant/datetime/{self._device_id}/{datetime_key}/config"
-
-            payload = {
-                "name": datetime_config["name"],
-                "command_topic": datetime_config["command_topic"],
-                "state_topic": datetime_config["state_topic"],
-                "icon": datetime_config["icon"],
-                "unique_id": f"{self._device_id}_{datetime_key}",
-                "availability_topic": self._availability_topic,
-                "payload_available": "online",
-                "payload_not_available": "offline",
-                "device": {"identifiers": [self._device_id]},
-            }
-            if "entity_category" in datetime_config:
-                payload["entity_category"] = datetime_config["entity_category"]
-
-            autodiscovery_messages.append({"topic": topic, "payload": payload})
-
-        return autodiscovery_messages
+    def create_device_config(self):
+        """Generate the Home Assistant device discovery payload"""
+        return coldpath.call(
+            "discovery",
+            "create_device_config",
+            self._device_id,
+            self._name,
+            self._mac_address,
+            self._base_topic,
+            self._perf_stages,
+        )
 
-    def publish_advertisements(self):
-        """Publish all autodiscovery advertisements to Home Assistant"""
-        print("Publishing Home Assistant autodiscovery advertisements...")
+    def refresh(self) -> None:
+        """Build the device config and note its hash"""
+        self._device_payload = json.dumps(self.create_device_config()).encode()
+        self._device_hash = binascii.crc32(self._device_payload)
 
-        advertisements = self.create_autodiscovery_config()
+    def publish_device_config(self):
+        """Publish the device discovery config to Home Assistant"""
+        if self._device_payload is None:
+            self.refresh()
+        self._mqtt_client.publish(
+            self._device_topic, self._device_payload, retain=True, qos=1
+        )
+        self._published_hash = self._device_hash
+        print(
+            f"Published Home Assistant device config, {len(self._device_payload)} bytes"
+        )
 
-        for message in advertisements:
-            topic = message["topic"]
-            payload = json.dumps(message["payload"])
+    def on_status(self, payload) -> None:
+        """Home Assistant's birth or will message on homeassistant/status"""
+        if payload == "online":
+            # it may have come back without the broker's retained configs
+            self._published_hash = None
+
+    def on_legacy_config(self, topic, payload) -> None:
+        """A per-entity config retained on the broker"""
+        # clearing or migrating one comes back here too
+        if not payload or payload == HomeAssistant.MIGRATE_PAYLOAD:
+            return
+        if topic not in self._legacy_topics:
+            self._legacy_topics.append(topic)
+
+    def _migration(self, topics):
+        """
+        Hand the per-entity configs' entities over to the device config,
+        then remove the per-entity configs, as Home Assistant asks
+        """
+        for topic in topics:
+            yield topic, HomeAssistant.MIGRATE_PAYLOAD
+        self._published_hash = self._device_hash
+        yield self._device_topic, self._device_payload
+        for topic in topics:
+            yield topic, ""
+        print(f"Migrated {len(topics)} Home Assistant entity configs")
+
+    def _advertisements(self):
+        """Each per-entity config, serialized as it's sent, then online status"""
+        count = 0
+        for message in self.create_autodiscovery_config():
+            count += 1
+            yield message["topic"], json.dumps(message["payload"])
+        print(f"Published {count} autodiscovery messages")
+        yield self._availability_topic, "online"
+
+    def _drain(self) -> None:
+        """
+        Publish what's pending until it's all gone or PUBLISH_BUDGET_NS
+        is up, leaving the rest for the next loop() call
 
-            # Publish with retain=True so Home Assistant can discover after restart
+        When the client is the sign's Outbox, each message waits for the
+        last to have gone out, so a migration's messages to the same
+        topic aren't coalesced and the Outbox never holds more than one.
+        """
+        deadline = timesource.monotonic_ns() + HomeAssistant.PUBLISH_BUDGET_NS
+        while not getattr(self._mqtt_client, "full", False):
+            try:
+                topic, payload = next(self._pending)
+            except StopIteration:
+                self._pending = None
+                return
+            # retained so Home Assistant can discover after it restarts
             self._mqtt_client.publish(topic, payload, retain=True, qos=1)
+            if timesource.monotonic_ns() >= deadline:
+                return
 
-        print(f"Published {len(advertisements)} autodiscovery messages")
+    def publish_advertisements(self):
+        """Publish all autodiscovery advertisements to Home Assistant, then online status"""
+        print("Publishing Home Assistant autodiscovery advertisements...")
+        for topic, payload in self._advertisements():
+            self._mqtt_client.publish(topic, payload, retain=True, qos=1)
 
     def publish_online_status(self):
         """Publish 'online' status to availability topic"""
@@ -384,9 +212,24 @@ class HomeAssistant:
 
     def loop(self):
         """Main loop - call this regularly from your main program loop"""
-        # monotonic clock: time.time() jumps when NTP corrects the RTC, which
+        if self._pending is not None:
+            self._drain()
+            return
+
+        if self._device_discovery:
+            if self._device_payload is None:
+                self.refresh()
+            if self._legacy_topics:
+                self._pending = self._migration(self._legacy_topics)
+                self._legacy_topics = []
+                self._drain()
+            elif self._device_hash != self._published_hash:
+                self.publish_device_config()
+            return
+
+        # monotonic clock: timesource.time() jumps when NTP corrects the RTC, which
         # could delay or spam the hourly advertisements
-        current_time = time.monotonic_ns() // 1_000_000_000
+        current_time = timesource.monotonic_ns() // 1_000_000_000
 
         # Check if it's time to publish advertisements (once per hour)
         if (
@@ -394,6 +237,7 @@ class HomeAssistant:
             or current_time - self._last_advertisement_time
             >= self._advertisement_interval
         ):
-            self.publish_advertisements()
-            self.publish_online_status()
+            print("Publishing Home Assistant autodiscovery advertisements...")
+            self._pending = self._advertisements()
             self._last_advertisement_time = current_time
+            self._drain()
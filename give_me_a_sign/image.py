@@ -24,13 +24,14 @@ class Image:
     def __init__(self, app):
         self._app = app
 
-    def show(self) -> bool:
+    def show(self, image=None) -> bool:
         """
-        Get image info from Data, key "image"
+        Get image info from Data, key "image" (or from image, if given)
         display it or return False to indicate there's nothing to do
         """
-        image = self._app.data.get_item(Image.KEY)
-        self._app.data.clear_updated(Image.KEY)
+        if image is None:
+            image = self._app.data.get_item(Image.KEY)
+            self._app.data.clear_updated(Image.KEY)
 
         try:
             if image is None or image["filename"] is None:
@@ -0,0 +1,173 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/interrupts - queue of greetings, messages and images
+====================================================
+
+* Author: John Romkey
+"""
+
+
+class Interrupt:  # pylint: disable=too-few-public-methods
+    """
+    One queued interrupt. Slots are allocated once by InterruptQueue and
+    reused; a popped slot is only valid until the next push().
+    """
+
+    def __init__(self):
+        # False for a free slot
+        self.queued = False
+        # Data key of the module that shows it
+        self.key = None
+        self.payload = None
+        self.priority = 0
+        # seconds to show it for
+        self.duration = 0
+        # monotonic_ns after which it's dropped unshown
+        self.expires = 0
+        # arrival order, for FIFO within a priority
+        self.sequence = 0
+
+
+class InterruptQueue:
+    """
+    Bounded priority queue of things that interrupt the playlist
+
+    Greetings, messages and images used to each hold a single slot in
+    Data, so a second one arriving before the first was shown replaced it.
+    They're now queued and shown one after another: highest priority
+    first, oldest first within a priority. Identical items already waiting
+    are collapsed into one.
+
+    All slots are preallocated so enqueueing a burst doesn't allocate.
+    When the queue is full a new item replaces the lowest-priority
+    (oldest) one if it outranks it, otherwise it's dropped.
+
+    Payloads may override the defaults with optional fields:
+
+    .. code-block:: python
+       { "priority": 5,    # higher is shown first
+         "duration": 30,   # seconds on screen
+         "ttl": 120        # seconds it may wait in the queue
+       }
+    """
+
+    def __init__(self, capacity):
+        self._slots = [Interrupt() for _ in range(capacity)]
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        count = 0
+        for slot in self._slots:
+            if slot.queued:
+                count += 1
+        return count
+
+    @staticmethod
+    def _free(slot) -> None:
+        slot.queued = False
+        slot.payload = None
+
+    @staticmethod
+    def _option(payload, field, default) -> int:
+        """Positive int payload[field], or default"""
+        try:
+            value = int(payload[field])
+        except (KeyError, TypeError, ValueError):
+            return default
+        return value if value > 0 else default
+
+    def push(  # pylint: disable=too-many-arguments
+        self, key, payload, now, priority, duration, ttl
+    ) -> bool:
+        """
+        Queue payload to be shown by the module for key
+
+        :param now: timesource.monotonic_ns()
+        :param priority: default priority, overridden by payload["priority"]
+        :param duration: default seconds on screen, overridden by payload["duration"]
+        :param ttl: default seconds to wait before expiring, overridden by payload["ttl"]
+
+        Returns False if the item was dropped because the queue is full of
+        higher priority items.
+        """
+        priority = InterruptQueue._option(payload, "priority", priority)
+        duration = InterruptQueue._option(payload, "duration", duration)
+        ttl = InterruptQueue._option(payload, "ttl", ttl)
+
+        free = None
+        weakest = None
+        for slot in self._slots:
+            if slot.queued and slot.expires <= now:
+                InterruptQueue._free(slot)
+
+            if not slot.queued:
+                if free is None:
+                    free = slot
+                continue
+
+            if slot.key == key and slot.payload == payload:
+                # already waiting: keep its place, take the better terms
+                slot.priority = max(slot.priority, priority)
+                slot.duration = duration
+                slot.expires = max(slot.expires, now + ttl * 1_000_000_000)
+                return True
+
+            if (
+                weakest is None
+                or slot.priority < weakest.priority
+                or (
+                    slot.priority == weakest.priority
+                    and slot.sequence < weakest.sequence
+                )
+            ):
+                weakest = slot
+
+        target = free
+        if target is None:
+            if weakest.priority >= priority:
+                return False
+            target = weakest
+
+        self._sequence += 1
+        target.queued = True
+        target.key = key
+        target.payload = payload
+        target.priority = priority
+        target.duration = duration
+        target.expires = now + ttl * 1_000_000_000
+        target.sequence = self._sequence
+        return True
+
+    def pop(self, now):
+        """
+        Remove and return the next Interrupt to show, or None if the queue
+        is empty. Expired items are discarded along the way.
+
+        :param now: timesource.monotonic_ns()
+        """
+        best = None
+        for slot in self._slots:
+            if not slot.queued:
+                continue
+            if slot.expires <= now:
+                InterruptQueue._free(slot)
+                continue
+            if (
+                best is None
+                or slot.priority > best.priority
+                or (slot.priority == best.priority and slot.sequence < best.sequence)
+            ):
+                best = slot
+
+        if best is not None:
+            # payload stays readable until a push() reuses the slot
+            best.queued = False
+        return best
+
+    def clear(self) -> None:
+        """Drop everything that's waiting"""
+        for slot in self._slots:
+            InterruptQueue._free(slot)
@@ -33,10 +33,13 @@ class Message:
 
         self._app = app
 
-    def show(self) -> bool:
+    def show(self, message=None) -> bool:
         """
         Display the message on the screen
 
+        :param message: the message to show; if None, the one stored in
+            Data is shown
+
         The server receives weather conditions them in the Data store under the key "message".
         This class retrieves a message and displays it.
 
@@ -53,9 +56,10 @@ class Message:
         implemented.
         """
 
-        self._app.data.clear_updated(Message.KEY)
+        if message is None:
+            self._app.data.clear_updated(Message.KEY)
+            message = self._app.data.get_item(Message.KEY)
 
-        message = self._app.data.get_item(Message.KEY)
         try:
             text = message["text"]
             # color is optional so HA plain-text "Message Text" works
@@ -11,30 +11,34 @@ give-me-a-sign/mqtt - MQTT support for Give Me A Sign
 import os
 import json
 import time
-import gc
-import sys
-import board
 import microcontroller
 import supervisor
 
-import adafruit_minimqtt.adafruit_minimqtt as MQTT
-
-from .aqi import AQI
 from .clock import Clock
-from .greet import Greet
-from .image import Image
-from .message import Message
-from .pollen import Pollen
-from .tones import Tones
-from .trimet import Trimet
-from .uv import UV
-from .weather import Weather
+from .playlist import Playlist
+from .pressure import MemoryPressure
 from .home_assistant import HomeAssistant
+from .outbox import Outbox
+from .transfer import Transfer
+from . import coldpath
+from . import timesource
 
 MQTT_RETRY_MIN_S = 5
 MQTT_RETRY_MAX_S = 120
 MQTT_FAILURES_BEFORE_RESET = 20
 
+# seconds between <base>/diagnostics reports, and between <base>/info
+# reports after the one sent on connecting (0: only on connecting)
+DIAGNOSTICS_INTERVAL_S = 60
+INFO_INTERVAL_S = 0
+# the shortest diagnostics interval allowed
+DIAGNOSTICS_MIN_INTERVAL_S = 5
+
+# messages the broker held for a persistent session handled per loop pass
+# after reconnecting, and the most held back at once
+CATCH_UP_PER_PASS = 2
+CATCH_UP_MAX = 32
+
 
 def _get_setting(key, default):
     """
@@ -67,28 +71,34 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
     that map to modules that display the data.
     """
 
+    # stored whatever modules are enabled; each enabled module's own keys
+    # come from the registry (see Registry.keys)
     STORE_ENDPOINTS = [
-        AQI.KEY,
         "debug",
-        "forecast",
-        Greet.KEY,
-        Image.KEY,
         "lunar",
-        Message.KEY,
-        Pollen.KEY,
+        Playlist.KEY,
         Clock.KEY_SOLAR,
         Clock.KEY_TIMEZONE,
-        Tones.KEY,
-        Trimet.KEY,
-        UV.KEY,
-        Weather.KEY,
     ]
 
+    # endpoints whose payloads aren't JSON; the module with the key
+    # decodes them with receive() and says what to store in Data
+    BINARY_ENDPOINTS = ["frame"]
+
     def __init__(self, app, platform):
         self._app = app
         self._platform = platform
         self._id = self._platform.wifi_mac_address.replace(":", "_")
         self._next_diagnostic_time = 0
+        self._diagnostics_interval = max(
+            DIAGNOSTICS_MIN_INTERVAL_S,
+            _get_setting("DIAGNOSTICS_INTERVAL", DIAGNOSTICS_INTERVAL_S),
+        )
+        self._info_interval = max(
+            0, _get_setting("DIAGNOSTICS_INFO_INTERVAL", INFO_INTERVAL_S)
+        )
+        # None -> not until the next connect
+        self._next_info_time = 0
         self._topic_prefix = os.getenv("MQTT_TOPIC_PREFIX") or "givemeasign"
         self._ha_sign_base = f"{self._topic_prefix}/sign/{self._id}"
         self._display_state_topic = f"{self._ha_sign_base}/display/state"
@@ -97,9 +107,36 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
         self._time_command_topic = f"{self._ha_sign_base}/time/set"
         self._data_state_topic = f"{self._ha_sign_base}/data/state"
         self._data_publish_topic = f"{self._ha_sign_base}/data/publish"
+        self._perf_topic = f"{self._ha_sign_base}/perf"
+        self._perf_state_topic = f"{self._ha_sign_base}/perf/state"
+        self._perf_command_topic = f"{self._ha_sign_base}/perf/set"
+        self._boot_topic = f"{self._ha_sign_base}/boot"
+        self._diagnostics_topic = f"{self._ha_sign_base}/diagnostics"
+        self._diagnostics_command_topic = f"{self._ha_sign_base}/diagnostics/set"
+        self._info_topic = f"{self._ha_sign_base}/info"
+        self._transfer_status_topic = f"{self._ha_sign_base}/transfer/status"
+        self._boot_published = False
 
         self._mqtt = None
         self._mqtt_loop_timeout = 1
+        # everything the sign publishes goes through here; it outlives
+        # the client, so state changed while disconnected still goes out
+        self._outbox = Outbox()
+        # large payloads arriving in chunks; kept across reconnects so a
+        # transfer can carry on where it stopped
+        self._transfer = Transfer(
+            app, self._outbox, self._transfer_status_topic, self._store_transferred
+        )
+
+        # with a persistent session the broker keeps the subscriptions and
+        # holds QoS 1 messages while the sign is away (see connect.py)
+        self._persistent = _get_setting("MQTT_PERSISTENT_SESSION", False)
+        self._subscribe_qos = 1 if self._persistent else 0
+        self._session_present = False
+        self._subscribed = False
+        # messages held back while catching up after a reconnect, or None
+        self._inbox = None
+        self._inbox_added = False
         self._home_assistant = None
         self._mqtt_failures = 0
         self._mqtt_next_retry_at = 0
@@ -114,93 +151,146 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
         self._maybe_retry_mqtt()
 
     def _build_mqtt_client(self):
-        socket = self._platform.get_socket()
-
-        # A small socket timeout keeps loop() from stalling the display
-        # loop for seconds at a time. It's also used as the TCP connect
-        # timeout, so don't make it too small.
-        self._mqtt = MQTT.MQTT(
-            broker=os.getenv("MQTT_BROKER"),
-            port=_get_setting("MQTT_PORT", 1883),
-            is_ssl=_get_setting("MQTT_SSL", False),
-            client_id=os.getenv("MQTT_CLIENTID"),
-            username=os.getenv("MQTT_USERNAME"),
-            password=os.getenv("MQTT_PASSWORD"),
-            socket_pool=socket,
-            socket_timeout=0.25,
-            # a single bounded attempt per connect() call; otherwise
-            # MiniMQTT retries internally with sleeps of up to ~30s each,
-            # freezing the display. SignMQTT owns the retry/backoff policy.
-            connect_retries=1,
-        )
+        self._mqtt = coldpath.call("connect", "build_client", self)
+        # short, so loop() doesn't stall the display (see build_client)
         self._mqtt_loop_timeout = 0.25
 
-        print("MQTT Connect")
-        self._mqtt.will_set(
-            f"{self._ha_sign_base}/available", "offline", retain=True, qos=1
+    def _add_handler(self, topic, name, callback) -> None:
+        """
+        Handle topic's messages with callback; the profiler accounts for
+        what the callback allocates under name
+        """
+        handler = (name, callback)
+        self._mqtt.add_topic_callback(
+            topic,
+            lambda client, topic, message: self._deliver(
+                handler, client, topic, message
+            ),
         )
 
+    def _subscribe(self, topics) -> None:
+        """Subscribe to topics, which a resumed session already is"""
+        if self._session_present:
+            return
+        for topic in topics:
+            self._mqtt.subscribe(topic, self._subscribe_qos)
+
+    def _deliver(self, handler, client, topic, message) -> None:
+        """
+        Handle a message now, or hold it back while catching up
+
+        :param handler: (name, callback) as given to _add_handler()
+        """
+        if self._inbox is None:
+            profiler = self._app.profiler
+            if profiler.enabled:
+                profiler.track(handler[0], handler[1], client, topic, message)
+            else:
+                # every message comes through here; skip the extra call
+                handler[1](client, topic, message)
+            return
+        if len(self._inbox) >= CATCH_UP_MAX:
+            dropped = self._inbox.pop(0)
+            self._app.logger.error(f"mqtt:catch up dropped {dropped[2]}")
+        self._inbox.append((handler, client, topic, message))
+        self._inbox_added = True
+
+    def _catch_up(self) -> None:
+        """
+        Handle a few of the messages held for the session while the sign
+        was away, so a backlog can't stall the display; back to handling
+        messages as they come once no more are arriving
+        """
+        if self._inbox is None:
+            return
+        for _ in range(CATCH_UP_PER_PASS):
+            if not self._inbox:
+                break
+            (name, callback), client, topic, message = self._inbox.pop(0)
+            self._app.profiler.track(name, callback, client, topic, message)
+        if not self._inbox and not self._inbox_added:
+            self._inbox = None
+            print("MQTT caught up")
+        self._inbox_added = False
+
     def _subscribe_all_topics(self):
-        for endpoint in self.STORE_ENDPOINTS:
-            # broadcast topic (all signs) and per-device topic (used by the
-            # Home Assistant text entities)
-            for topic in (
-                f"{self._topic_prefix}/all/module/{endpoint}",
-                f"{self._ha_sign_base}/module/{endpoint}",
-            ):
-                self._mqtt.subscribe(topic)
-                self._mqtt.add_topic_callback(
-                    topic,
-                    lambda client, topic, message, key=endpoint: self.store_data(
-                        key, message
-                    ),
-                )
+        coldpath.call("connect", "subscribe_all", self)
 
-        # matches the Home Assistant reboot button's command_topic
-        topic = f"{self._ha_sign_base}/reboot"
-        self._mqtt.subscribe(topic)
-        self._mqtt.add_topic_callback(
-            topic,
-            lambda client, topic, message, key=None: microcontroller.reset(),
-        )
+    def _store_callback(self, key):
+        """A topic callback storing its messages in Data under key"""
+        return lambda client, topic, message: self.store_data(key, message)
 
-        self._mqtt.subscribe(self._display_command_topic)
-        self._mqtt.add_topic_callback(
-            self._display_command_topic, self._on_display_command
-        )
+    def _on_bulk(self, _client, _topic, message):
+        """Several keys' data in one message"""
+        self.store_bulk(message)
 
-        # Home Assistant datetime entity + programmatic epoch/JSON payloads
-        self._mqtt.subscribe(self._time_command_topic)
-        self._mqtt.add_topic_callback(self._time_command_topic, self._on_time_command)
+    def _on_transfer_manifest(self, _client, _topic, message):
+        """The start of a chunked transfer"""
+        self._transfer.start(message)
 
-        # Home Assistant "Publish Data" button dumps the in-memory store
-        self._mqtt.subscribe(self._data_publish_topic)
-        self._mqtt.add_topic_callback(
-            self._data_publish_topic, self._on_publish_data_command
-        )
+    def _on_transfer_chunk(self, _client, topic, message):
+        """One chunk of a transfer, on <root>/transfer/<id>/<index>"""
+        _, transfer_id, index = topic.rsplit("/", 2)
+        self._transfer.write(transfer_id, index, message)
+
+    def _store_transferred(self, key, buffer):
+        """A transfer's payload for a Data key, handled as if published there"""
+        if key not in self.STORE_ENDPOINTS + self._app.modules.keys():
+            self._app.logger.error("server:transfer for unknown key %s", key)
+            return
+        self.store_data(key, buffer)
+
+    @staticmethod
+    def _on_reboot_command(_client, _topic, _message):
+        """Home Assistant reboot button"""
+        microcontroller.reset()
+
+    def _on_ha_status(self, _client, _topic, message):
+        """Home Assistant's birth message"""
+        self._home_assistant.on_status(self._decode_mqtt_payload(message))
+
+    def _on_ha_legacy_config(self, _client, topic, message):
+        """A per-entity discovery config to migrate to the device config"""
+        self._home_assistant.on_legacy_config(topic, self._decode_mqtt_payload(message))
 
     def _mqtt_connect_and_subscribe(self):
-        self._mqtt.connect()
-        self._subscribe_all_topics()
-        print("MQTT Connected")
+        self._mqtt.connect(clean_session=not self._persistent)
+        # subscribe anyway the first time after boot, in case this
+        # version handles topics the stored session doesn't have
+        self._session_present = self._mqtt.session_present and self._subscribed
+        if self._session_present:
+            print("MQTT session resumed")
+            self._inbox = []
         if self._home_assistant is None:
             self._home_assistant = HomeAssistant(
-                self._app.platform.wifi_mac_address, self._mqtt, self._ha_sign_base
+                self._app.platform.wifi_mac_address,
+                self._outbox,
+                self._ha_sign_base,
+                self._app.profiler.stages,
             )
         else:
-            self._home_assistant.set_mqtt_client(self._mqtt)
+            self._home_assistant.set_mqtt_client(self._outbox)
+        self._subscribe_all_topics()
+        self._subscribed = True
+        print("MQTT Connected")
+        self._app.boot.mark("mqtt")
         # the LWT may have retained "offline"; clear it right away rather than
         # waiting for the hourly advertisement cycle
         self._home_assistant.publish_online_status()
         self.publish_display_state()
+        self.publish_perf_state()
         self.publish_time_state()
+        # SSID, BSSID and address may be new
+        self._next_info_time = 0
         self._mqtt_failures = 0
         self._mqtt_backoff_s = MQTT_RETRY_MIN_S
         self._mqtt_next_retry_at = 0
 
     def _on_mqtt_failure(self):
         # monotonic_ns doesn't lose precision over long uptimes like monotonic does
-        self._mqtt_next_retry_at = time.monotonic_ns() + int(self._mqtt_backoff_s * 1e9)
+        self._mqtt_next_retry_at = timesource.monotonic_ns() + int(
+            self._mqtt_backoff_s * 1e9
+        )
         self._mqtt_backoff_s = min(self._mqtt_backoff_s * 2, MQTT_RETRY_MAX_S)
         self._mqtt_failures += 1
         if self._mqtt_failures >= MQTT_FAILURES_BEFORE_RESET:
@@ -222,7 +312,7 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
         that connects, so a failure can never wedge the caller: it just
         schedules the next attempt.
         """
-        if time.monotonic_ns() < self._mqtt_next_retry_at:
+        if timesource.monotonic_ns() < self._mqtt_next_retry_at:
             return
         try:
             if self._mqtt is None:
@@ -252,11 +342,10 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
 
     @staticmethod
     def _decode_mqtt_payload(message):
-        if isinstance(message, memoryview):
-            message = bytes(message)
-        if isinstance(message, bytes):
-            return message.decode()
-        return str(message)
+        """The payload as a str, decoded straight from MiniMQTT's buffer"""
+        if isinstance(message, str):
+            return message
+        return str(message, "utf-8")
 
     def _on_display_command(self, _client, _topic, message):
         """Home Assistant switch: ON = show content, OFF = blank the matrix."""
@@ -269,6 +358,17 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
             return
         self.publish_display_state()
 
+    def _on_perf_command(self, _client, _topic, message):
+        """Home Assistant switch: ON = profile the loop, OFF = stop."""
+        text = self._decode_mqtt_payload(message).strip().upper()
+        if text == "ON":
+            self._app.profiler.enabled = True
+        elif text == "OFF":
+            self._app.profiler.enabled = False
+        else:
+            return
+        self.publish_perf_state()
+
     @staticmethod
     def _epoch_to_iso_utc(epoch):
         """Format a Unix epoch as ISO 8601 UTC for the HA datetime entity."""
@@ -283,103 +383,18 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
         )
 
     @staticmethod
-    def _parse_iso8601_utc(text):  # pylint: disable=too-many-return-statements
-        """
-        Parse an ISO 8601 UTC datetime string into a Unix epoch.
-
-        Accepts the formats Home Assistant's MQTT datetime entity sends, e.g.
-        2026-07-10T05:00:00, ...Z, ...+00:00, and optional fractional seconds.
-        Non-UTC offsets are applied so the result is still a UTC epoch.
-        """
-        text = text.strip()
-        if not text or text[0] < "0" or text[0] > "9":
-            return None
-
-        # Split timezone suffix: Z / z / ±HH:MM / ±HHMM
-        offset_seconds = 0
-        body = text
-        if body.endswith("Z") or body.endswith("z"):
-            body = body[:-1]
-        elif len(body) >= 6 and (body[-6] in "+-" and body[-3] == ":"):
-            sign = 1 if body[-6] == "+" else -1
-            try:
-                offset_seconds = sign * (int(body[-5:-3]) * 3600 + int(body[-2:]) * 60)
-            except ValueError:
-                return None
-            body = body[:-6]
-        elif len(body) >= 5 and body[-5] in "+-":
-            sign = 1 if body[-5] == "+" else -1
-            try:
-                offset_seconds = sign * (int(body[-4:-2]) * 3600 + int(body[-2:]) * 60)
-            except ValueError:
-                return None
-            body = body[:-5]
-
-        # Drop fractional seconds if present
-        if "." in body:
-            body = body.split(".", 1)[0]
-
-        # YYYY-MM-DDTHH:MM:SS or YYYY-MM-DD HH:MM:SS
-        body = body.replace(" ", "T", 1)
-        parts = body.split("T")
-        if len(parts) != 2:
-            return None
-        try:
-            year_s, month_s, day_s = parts[0].split("-")
-            time_parts = parts[1].split(":")
-            if len(time_parts) < 2:
-                return None
-            hour_s = time_parts[0]
-            minute_s = time_parts[1]
-            second_s = time_parts[2] if len(time_parts) > 2 else "0"
-            struct = time.struct_time(
-                (
-                    int(year_s),
-                    int(month_s),
-                    int(day_s),
-                    int(hour_s),
-                    int(minute_s),
-                    int(float(second_s)),
-                    0,
-                    0,
-                    -1,
-                )
-            )
-            # RTC/time source is UTC; mktime treats the struct as local (= UTC here)
-            return int(time.mktime(struct)) - offset_seconds
-        except (ValueError, OverflowError, TypeError):
-            return None
+    def _parse_iso8601_utc(text):
+        """ISO 8601 UTC datetime text as a Unix epoch, or None (see timeparse)"""
+        return coldpath.call("timeparse", "parse_iso8601_utc", text)
 
     def _parse_time_payload(self, message):
         """
         Accept HA ISO datetime strings, a bare epoch, or JSON {"epoch": ...}.
         Returns a Unix epoch int, or None if the payload is unusable.
         """
-        text = self._decode_mqtt_payload(message).strip()
-        if not text:
-            return None
-
-        try:
-            data = json.loads(text)
-        except ValueError:
-            data = None
-
-        if isinstance(data, (int, float)):
-            return int(data)
-        if isinstance(data, dict) and "epoch" in data:
-            try:
-                return int(data["epoch"])
-            except (TypeError, ValueError):
-                return None
-        if isinstance(data, str):
-            text = data.strip()
-
-        try:
-            return int(float(text))
-        except ValueError:
-            pass
-
-        return self._parse_iso8601_utc(text)
+        return coldpath.call(
+            "timeparse", "parse_time_payload", self._decode_mqtt_payload(message)
+        )
 
     def _on_time_command(self, _client, _topic, message):
         """Set the device RTC from an MQTT time payload (HA datetime or epoch)."""
@@ -408,16 +423,40 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
         if not self.is_connected_to_broker():
             return
         payload = "ON" if self._app.display_enabled else "OFF"
-        self._mqtt.publish(self._display_state_topic, payload, retain=True, qos=1)
+        self._outbox.publish(self._display_state_topic, payload, retain=True, qos=1)
+
+    def publish_perf_state(self):
+        """Publish retained profiler switch state for Home Assistant."""
+        if not self.is_connected_to_broker():
+            return
+        payload = "ON" if self._app.profiler.enabled else "OFF"
+        self._outbox.publish(self._perf_state_topic, payload, retain=True, qos=1)
+
+    def _publish_perf(self):
+        """Publish per-stage loop timings gathered since the last report"""
+        profiler = self._app.profiler
+        if not profiler.enabled:
+            return
+        self._outbox.publish(self._perf_topic, json.dumps(profiler.summary()))
+        profiler.reset()
+
+    def _publish_boot(self):
+        """Publish the retained boot milestones once the clock is up"""
+        if self._boot_published or not self._app.boot.done:
+            return
+        self._outbox.publish(
+            self._boot_topic, json.dumps(self._app.boot.report()), retain=True, qos=1
+        )
+        self._boot_published = True
 
     def publish_time_state(self, epoch=None):
         """Publish retained ISO 8601 UTC time for the Home Assistant datetime entity."""
         if not self.is_connected_to_broker():
             return
         if epoch is None:
-            epoch = time.time()
+            epoch = self._app.clock.snapshot().utc
         payload = self._epoch_to_iso_utc(epoch)
-        self._mqtt.publish(self._time_state_topic, payload, retain=True, qos=1)
+        self._outbox.publish(self._time_state_topic, payload, retain=True, qos=1)
 
     def publish_data_store(self):
         """Publish the full Data store JSON to the data/state topic."""
@@ -428,43 +467,134 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
         except (TypeError, ValueError) as error:
             print("mqtt:data/publish serialize failed:", error)
             return
-        self._mqtt.publish(self._data_state_topic, payload, retain=True, qos=1)
+        self._outbox.publish(self._data_state_topic, payload, retain=True, qos=1)
         print("mqtt: published full data store")
 
     def store_data(self, key, message):
         """
         Generic endpoint used to store a received message using the specified key. Attempts to
         parse the message as JSON and stores it on success. Logs an error on failure.
+        BINARY_ENDPOINTS' payloads go to their module instead of the JSON parser.
+
+        message is the buffer MiniMQTT received, which runs in binary mode:
+        the JSON is parsed straight from it, and only the plain-text
+        fallbacks decode it to a str. Log lines are formatted by the logger,
+        so the payload is only turned into text when the log level shows it.
+        """
+        logger = self._app.logger
+        logger.debug("mqtt store_data! %s %s", key, message)
+        memory = self._app.memory
+        if memory.refuses(len(message)):
+            logger.error(
+                "server:store_data(%s) refused %d bytes, memory tier %s",
+                key,
+                len(message),
+                memory.name,
+            )
+            return
+        if (
+            memory.tier >= MemoryPressure.DROP_DATA
+            and key in MemoryPressure.NON_ESSENTIAL_KEYS
+        ):
+            return
+
+        if key in self.BINARY_ENDPOINTS:
+            module = self._app.modules.get(key)
+            data = None if module is None else module.receive(message)
+        else:
+            try:
+                data = json.loads(message)
+            except ValueError:
+                data = None
+            data = self._store_value(key, data, message)
+        if data is None:
+            logger.error("server:store_data(%s) store_data failed: %s", key, message)
+            return
+
+        self._app.data.set_item(key, data)
+
+        logger.info("server:store_data(%s) got JSON", key)
+        logger.debug("%s", data)
+
+    @staticmethod
+    def _store_value(key, data, message):
+        """
+        What to store under key, given a payload decoded from JSON (None if
+        it wasn't JSON) and the payload as it arrived; None if there's
+        nothing usable
 
         Home Assistant text entities for greet/message publish plain text (not JSON).
         Fall back to {"person": ...} / {"text": ...} for those keys so typing a name
         or message in HA works without requiring a JSON object.
         """
-        print(f"mqtt store_data! {key}", message)
-        try:
-            data = json.loads(message)
-        except ValueError:
-            data = None
-
         if key in ("message", "greet") and not isinstance(data, dict):
-            text = message if data is None else data
+            text = SignMQTT._decode_mqtt_payload(message) if data is None else data
             if not isinstance(text, str):
                 text = str(text)
-            data = {"text": text} if key == "message" else {"person": text}
-        elif key == "message" and isinstance(data, dict):
+            return {"text": text} if key == "message" else {"person": text}
+        if key == "message":
             # HA notify payloads commonly use {"message": "..."}.
             if "text" not in data and isinstance(data.get("message"), str):
-                data = {"text": data["message"]}
-        elif data is None:
-            self._app.logger.error(
-                f"server:store_data({key}) store_data failed: {message}"
+                return {"text": data["message"]}
+        return data
+
+    def store_bulk(self, message):
+        """
+        Store several keys from one JSON object of key -> payload, e.g.
+        {"weather": {...}, "aqi": {...}, "message": "hello"}
+
+        The object is parsed once and stored in one go, so the sign
+        rebuilds its playlist and redraws once rather than once per key.
+        Payloads are what store_data() would take for the key, already
+        decoded; a string is parsed as JSON for keys other than greet and
+        message. Keys the sign doesn't store are logged and skipped.
+        """
+        logger = self._app.logger
+        logger.debug("mqtt store_bulk! %s", message)
+        memory = self._app.memory
+        if memory.refuses(len(message)):
+            logger.error(
+                "server:store_bulk refused %d bytes, memory tier %s",
+                len(message),
+                memory.name,
             )
             return
 
-        self._app.data.set_item(key, data)
+        try:
+            bulk = json.loads(message)
+        except ValueError:
+            bulk = None
+        if not isinstance(bulk, dict):
+            logger.error("server:store_bulk failed: %s", message)
+            return
 
-        self._app.logger.info(f"server:store_data({key}) got JSON")
-        self._app.logger.info(data)
+        keys = self.STORE_ENDPOINTS + self._app.modules.keys()
+        drop = memory.tier >= MemoryPressure.DROP_DATA
+        items = {}
+        for key, payload in bulk.items():
+            if key not in keys:
+                logger.error("server:store_bulk unknown key %s", key)
+                continue
+            if drop and key in MemoryPressure.NON_ESSENTIAL_KEYS:
+                continue
+            if key in self.BINARY_ENDPOINTS:
+                logger.error("server:store_bulk(%s) needs a message of its own", key)
+                continue
+
+            data = payload
+            if isinstance(payload, str) and key not in ("message", "greet"):
+                try:
+                    data = json.loads(payload)
+                except ValueError:
+                    data = None
+            data = self._store_value(key, data, payload)
+            if data is None:
+                logger.error("server:store_bulk(%s) failed: %s", key, payload)
+                continue
+            items[key] = data
+
+        self._app.data.set_items(items)
+        logger.info("server:store_bulk stored %s", ", ".join(items))
 
     def _publish_diagnostics(self):
         """
@@ -474,37 +604,43 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
             print("MQTT - disconnected, not publishing diagnostics")
             return
 
-        flash = os.statvfs("/")
-        flash_size = flash[0] * flash[2]
-        flash_free = flash[0] * flash[3]
-
-        now_utc = time.time()
-
-        info = {
-            "uptime": time.monotonic_ns() / 1e9,
-            "time_utc": now_utc,
-            "time_utc_iso": self._epoch_to_iso_utc(now_utc),
-            "timezone_offset": self._app.clock.timezone_offset,
-            "free_memory": gc.mem_free(),  # pylint: disable=no-member
-            "flash_free": flash_free,
-            "flash_size": flash_size,
-            "rtc": "software"
-            if self._app.rtc.__class__.__name__ == "RTC"
-            else self._app.rtc.__class__.__name__,
-            "wifi_ssid": self._app.platform.wifi_ssid,
-            "wifi_bssid": self._app.platform.wifi_bssid,
-            "wifi_rssi": self._app.platform.wifi_rssi,
-            "mac_address": self._app.platform.wifi_mac_address,
-            "ipv4address": str(self._app.platform.wifi_ip_address),
-            "python_version": sys.version,
-            "circuitpython_version": ".".join([str(i) for i in sys.implementation[1]]),
-            "platform": sys.platform,
-            "board": board.board_id,
-            "display_height": self._app.display.height,
-            "display_width": self._app.display.width,
-        }
-
-        self._mqtt.publish(f"{self._ha_sign_base}/diagnostics", json.dumps(info))
+        now = self._app.clock.snapshot()
+        info = coldpath.call("diagnostics", "collect", self._app, now)
+        info["time_utc_iso"] = self._epoch_to_iso_utc(now.utc)
+        info["mqtt_backlog"] = len(self._outbox)
+        info["mqtt_coalesced"] = self._outbox.coalesced
+        self._outbox.publish(self._diagnostics_topic, json.dumps(info))
+
+    def _publish_info(self):
+        """Publish the retained facts about the sign that don't change while connected"""
+        info = coldpath.call("diagnostics", "info", self._app)
+        info["diagnostics_interval"] = self._diagnostics_interval
+        info["info_interval"] = self._info_interval
+        self._outbox.publish(self._info_topic, json.dumps(info), retain=True, qos=1)
+
+    def _on_diagnostics_command(self, _client, _topic, message):
+        """
+        Change the reporting intervals: JSON with "interval" (seconds
+        between diagnostics) and/or "info_interval" (seconds between
+        info reports, 0 for only on connecting)
+        """
+        try:
+            command = json.loads(message)
+            interval = command.get("interval", self._diagnostics_interval)
+            info_interval = command.get("info_interval", self._info_interval)
+            if interval < DIAGNOSTICS_MIN_INTERVAL_S or info_interval < 0:
+                raise ValueError("interval out of range")
+        except (ValueError, TypeError, AttributeError) as error:
+            print("bad diagnostics command:", error)
+            self._app.logger.error("mqtt:diagnostics/set bad payload: %s", message)
+            return
+
+        self._diagnostics_interval = interval
+        self._info_interval = info_interval
+        now = timesource.monotonic_ns()
+        self._next_diagnostic_time = now + int(interval * 1e9)
+        # republish info now so it shows the new intervals
+        self._next_info_time = 0
 
     def loop(self):
         """
@@ -528,14 +664,31 @@ class SignMQTT:  # pylint: disable=too-many-instance-attributes
 
         try:
             self._home_assistant.loop()
+            self._publish_boot()
 
-            if time.monotonic_ns() > self._next_diagnostic_time:
+            if (
+                self._next_info_time is not None
+                and timesource.monotonic_ns() >= self._next_info_time
+            ):
+                self._publish_info()
+                self._next_info_time = None
+                if self._info_interval:
+                    self._next_info_time = timesource.monotonic_ns() + int(
+                        self._info_interval * 1e9
+                    )
+
+            if timesource.monotonic_ns() > self._next_diagnostic_time:
                 print("MQTT publishing diagnostics")
                 self._publish_diagnostics()
+                self._publish_perf()
                 # keep the HA datetime entity aligned with NTP/RTC drift
                 self.publish_time_state()
-                self._next_diagnostic_time = time.monotonic_ns() + int(60e9)
+                self._next_diagnostic_time = timesource.monotonic_ns() + int(
+                    self._diagnostics_interval * 1e9
+                )
 
+            self._outbox.drain(self._mqtt)
+            self._catch_up()
             self._mqtt.loop(self._mqtt_loop_timeout)
         except Exception as error:  # pylint: disable=broad-exception-caught
             # Any failure here (dead socket, wedged client, bad ap_info race)
@@ -0,0 +1,112 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/outbox - outgoing MQTT messages, coalesced and rate limited
+====================================================
+
+* Author: John Romkey
+"""
+
+from . import timesource
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class Outbox:
+    """
+    Holds the sign's outgoing MQTT messages until the loop sends them
+
+    Publishing at QoS 1 waits for the broker's acknowledgement, so
+    publishing wherever a state change happens lets a slow broker hold up
+    the display. Instead publish() just queues the message and drain()
+    sends from the queue at one point in the loop:
+
+    * only the newest message for each topic is kept, so ten display
+      toggles from Home Assistant in one pass send one state update.
+      Topics go out in the order they were first queued.
+    * drain() stops once BUDGET_NS has gone by, leaving the rest for the
+      next pass.
+    * a token bucket holds the sign to RATE messages a second, in bursts
+      of up to BURST.
+
+    publish() takes the same arguments as MiniMQTT's, so the Outbox can
+    stand in for the client.
+    """
+
+    # messages per second, and the most sent back to back
+    RATE = 5
+    BURST = 10
+    # sending time per drain()
+    BUDGET_NS = 20_000_000
+
+    def __init__(self, rate=RATE, burst=BURST):
+        """
+        :param rate: messages per second allowed on average
+        :param burst: messages that can go out at once after a quiet spell
+        """
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._refilled = timesource.monotonic_ns()
+        # topic -> (payload, retain, qos), in the order first queued
+        self._queue = {}
+        # messages replaced by a newer one for the same topic before going out
+        self.coalesced = 0
+        self.sent = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    @property
+    def full(self) -> bool:
+        """
+        True while anything is waiting; a producer with a lot to send
+        (Home Assistant discovery) adds the next message only once the
+        last has gone out, so nothing it sends gets coalesced away
+        """
+        return bool(self._queue)
+
+    def publish(self, topic, payload, retain=False, qos=0) -> None:
+        """Queue payload for topic, replacing anything still waiting for it"""
+        if topic in self._queue:
+            self.coalesced += 1
+        self._queue[topic] = (payload, retain, qos)
+
+    def clear(self) -> None:
+        """Forget everything waiting"""
+        self._queue = {}
+
+    def _refill(self, now) -> None:
+        tokens = self._tokens + (now - self._refilled) * self._rate / NS_PER_SECOND
+        self._tokens = min(self._burst, tokens)
+        self._refilled = now
+
+    def drain(self, client) -> int:
+        """
+        Send what's waiting through client while the time budget and the
+        rate limit allow; returns how many were sent
+
+        A message that fails to send stays queued, unless a newer one for
+        its topic has been queued meanwhile, and the error is raised.
+        """
+        now = timesource.monotonic_ns()
+        self._refill(now)
+        deadline = now + Outbox.BUDGET_NS
+        sent = 0
+        while self._queue and self._tokens >= 1:
+            topic = next(iter(self._queue))
+            payload, retain, qos = self._queue.pop(topic)
+            try:
+                client.publish(topic, payload, retain=retain, qos=qos)
+            except Exception:
+                if topic not in self._queue:
+                    self._queue[topic] = (payload, retain, qos)
+                raise
+            self._tokens -= 1
+            sent += 1
+            if timesource.monotonic_ns() >= deadline:
+                break
+        self.sent += sent
+        return sent
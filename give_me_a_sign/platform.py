@@ -10,13 +10,13 @@ give-me-a-sign/platform - networking for native-WiFi LED matrix boards
 """
 
 import os
-import time
 import wifi
 import socketpool
 
 import adafruit_ntp
 
 from .mqtt import SignMQTT
+from . import timesource
 
 WIFI_RETRY_MIN_S = 5
 WIFI_RETRY_MAX_S = 90
@@ -46,58 +46,51 @@ class Platform:
         # its duration (default would be 10 seconds)
         self._ntp = adafruit_ntp.NTP(self._socket_pool, tz_offset=0, socket_timeout=5)
 
-    def wifi_connect(self) -> None:
-        """
-        Attempt to connect to wifi
-
-        Just return if already connected
-        """
-        if not wifi.radio.connected:
-            ssid = os.getenv("wifi_ssid")
-            password = os.getenv("wifi_password")
-
-            if ssid is None or password is None:
-                print("wifi_ssid or wifi_password not set in secrets.toml")
-                return
-
-            # Catch broadly: if any connect error escaped, the caller's loop
-            # would retry with no backoff and the blocking connect calls
-            # would effectively freeze the display.
-            try:
-                wifi.radio.connect(ssid, password, timeout=WIFI_CONNECT_TIMEOUT_S)
-            except (OSError, RuntimeError) as error:
-                print("wifi failure:", error)
-                return
-
+    def _wifi_joined(self) -> None:
+        """Set up for a new WiFi session"""
         self._refresh_socket_pool_and_ntp()
         self._wifi_backoff_s = WIFI_RETRY_MIN_S
         self._wifi_next_retry_at = 0
+        self._app.boot.mark("wifi")
 
-    def _try_wifi_reconnect(self) -> None:
+    def _try_wifi_connect(self) -> None:
+        """
+        Join WiFi, backing off between failed attempts; the first attempt
+        after boot is a connect, any after that a reconnect
+        """
         # monotonic_ns doesn't lose precision over long uptimes like monotonic does
-        now = time.monotonic_ns()
+        now = timesource.monotonic_ns()
         if now < self._wifi_next_retry_at:
             return
 
+        # a socket pool is only ever made once WiFi has been up
+        verb = "connect" if self._socket_pool is None else "reconnect"
         ssid = os.getenv("wifi_ssid")
         password = os.getenv("wifi_password")
         if ssid is None or password is None:
+            print("wifi_ssid or wifi_password not set in secrets.toml")
+            self._wifi_retry_later(now)
             return
 
-        print("WiFi reconnect attempt")
+        print(f"WiFi {verb} attempt")
+        # Catch broadly: if any connect error escaped, the loop would retry
+        # with no backoff and the blocking connect calls would effectively
+        # freeze the display.
         try:
             wifi.radio.connect(ssid, password, timeout=WIFI_CONNECT_TIMEOUT_S)
         except (OSError, RuntimeError) as error:
-            print("wifi reconnect failed:", error)
-            self._wifi_next_retry_at = now + int(self._wifi_backoff_s * 1e9)
-            self._wifi_backoff_s = min(self._wifi_backoff_s * 2, WIFI_RETRY_MAX_S)
+            print(f"wifi {verb} failed:", error)
+            self._wifi_retry_later(now)
             return
 
-        self._refresh_socket_pool_and_ntp()
-        self._wifi_backoff_s = WIFI_RETRY_MIN_S
-        self._wifi_next_retry_at = 0
-        self._wifi_restored_flag = True
-        print("WiFi reconnected")
+        self._wifi_joined()
+        # nothing to rebuild if MQTT hasn't been started yet
+        self._wifi_restored_flag = self._mqtt is not None
+        print(f"WiFi {verb}ed")
+
+    def _wifi_retry_later(self, now) -> None:
+        self._wifi_next_retry_at = now + int(self._wifi_backoff_s * 1e9)
+        self._wifi_backoff_s = min(self._wifi_backoff_s * 2, WIFI_RETRY_MAX_S)
 
     def wifi_just_restored(self) -> bool:
         """One-shot for MQTT to rebuild its client with a fresh socket pool."""
@@ -187,9 +180,25 @@ class Platform:
         Each subsystem is isolated so one failure can't starve the display
         state machine (an exception escaping here aborts the whole app loop
         iteration, every iteration, freezing the sign).
+
+        This is also what brings the network up after start(): a pass
+        that joins WiFi returns, and MQTT is started on the next one. A
+        connect still blocks for as long as it takes, but the clock is on
+        the display by then and gets a pass between steps. The clock
+        syncs NTP itself once WiFi is up.
         """
         if not self.wifi_is_connected:
-            self._try_wifi_reconnect()
+            self._try_wifi_connect()
+            return
+
+        if self._socket_pool is None:
+            # CircuitPython joined the network itself before code.py ran
+            # (CIRCUITPY_WIFI_SSID in settings.toml)
+            self._wifi_joined()
+            return
+
+        if self._mqtt is None:
+            self.start_mqtt()
+            return
 
-        if self._mqtt:
-            self._mqtt.loop()
+        self._mqtt.loop()
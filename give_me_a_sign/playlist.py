@@ -0,0 +1,228 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/playlist - screen rotation for LED Matrix display
+====================================================
+
+* Author: John Romkey
+"""
+
+
+class Screen:  # pylint: disable=too-few-public-methods
+    """
+    One entry in the playlist: which screen to show, for how long, and
+    when to skip it
+    """
+
+    def __init__(
+        self, name, duration, max_age=0, condition=None, key=None
+    ):  # pylint: disable=too-many-arguments
+        """
+        :param name: screen name registered with GiveMeASign.add_screen()
+        :param duration: seconds to show the screen
+        :param max_age: skip the screen when its data is older than this many
+            seconds; 0 never skips on age
+        :param condition: optional condition name (e.g. "daylight") that must
+            hold for the screen to be shown
+        :param key: Data key the screen displays, if any
+        """
+        self.name = name
+        self.duration = duration
+        self.max_age = max_age
+        self.condition = condition
+        self.key = key
+
+
+class Playlist:
+    """
+    The ordered list of screens the sign rotates through when nothing
+    else (a greeting, message, image...) has its attention
+
+    The playlist can be replaced at runtime by publishing to the
+    "playlist" module topic:
+
+    .. code-block:: python
+       { "screens": [
+           { "screen": "clock", "duration": 20 },
+           { "screen": "weather", "duration": 10, "max_age": 3600 },
+           { "screen": "uvi", "duration": 10, "condition": "daylight" }
+         ]
+       }
+
+    ``max_age`` defaults to one hour, ``condition`` to none.
+
+    Which entries have fresh data is kept as a bitmap that's only
+    recomputed when Data changes or the next piece of data goes stale, so
+    the rotation can jump straight past screens with nothing to show
+    without checking ages on every loop pass.
+    """
+
+    KEY = "playlist"
+
+    DEFAULT_MAX_AGE = 60 * 60
+    # the eligibility bitmap stays a small int on CircuitPython
+    MAX_SCREENS = 30
+
+    DEFAULT = [
+        {"screen": "clock", "duration": 20},
+        {"screen": "weather", "duration": 10},
+        {"screen": "aqi", "duration": 10},
+        {"screen": "uvi", "duration": 10, "condition": "daylight"},
+        {"screen": "pollen", "duration": 10},
+    ]
+
+    def __init__(self, screens):
+        """
+        :param screens: non-empty list of Screen
+        """
+        self._screens = screens
+        self._index = 0
+        self._eligible = 0
+        self._expires_at = None
+        # Data.generation the bitmap was computed from; None forces a refresh
+        self._generation = None
+
+    @staticmethod
+    def parse(payload, screens, conditions):
+        """
+        Build a Playlist from a payload (a list of entries, or a dict with
+        a "screens" list). Raises ValueError describing the first problem.
+
+        :param screens: dict of the screens that can be shown, mapping each
+            name to the Data key it displays (or None)
+        :param conditions: names of the conditions that can be tested
+        """
+        if isinstance(payload, dict):
+            payload = payload.get("screens")
+        if not isinstance(payload, list) or len(payload) == 0:
+            raise ValueError("playlist needs a non-empty list of screens")
+        if len(payload) > Playlist.MAX_SCREENS:
+            raise ValueError(f"playlist is limited to {Playlist.MAX_SCREENS} screens")
+
+        entries = []
+        for entry in payload:
+            try:
+                name = entry["screen"]
+                duration = int(entry["duration"])
+                max_age = int(entry.get("max_age", Playlist.DEFAULT_MAX_AGE))
+                condition = entry.get("condition")
+            except (
+                KeyError,
+                TypeError,
+                ValueError,
+                AttributeError,
+                OverflowError,
+            ) as error:
+                raise ValueError(f"bad playlist entry {entry}") from error
+            # anything else can't be looked up in screens or conditions
+            if not isinstance(name, str) or not (
+                condition is None or isinstance(condition, str)
+            ):
+                raise ValueError(f"bad playlist entry {entry}")
+
+            if name not in screens:
+                raise ValueError(f"unknown screen {name}")
+            if condition is not None and condition not in conditions:
+                raise ValueError(f"unknown condition {condition}")
+            if duration <= 0 or max_age < 0:
+                raise ValueError(f"bad playlist timing {entry}")
+
+            entries.append(Screen(name, duration, max_age, condition, screens[name]))
+
+        return Playlist(entries)
+
+    def __len__(self) -> int:
+        return len(self._screens)
+
+    def __getitem__(self, index) -> Screen:
+        return self._screens[index]
+
+    @property
+    def index(self) -> int:
+        """Position of the current screen"""
+        return self._index
+
+    @property
+    def current(self) -> Screen:
+        """The screen the rotation is on"""
+        return self._screens[self._index]
+
+    def is_stale(self, data, now) -> bool:
+        """True if refresh() is needed: Data changed or something expired"""
+        return data.generation != self._generation or (
+            self._expires_at is not None and now >= self._expires_at
+        )
+
+    def refresh(self, data, now) -> None:
+        """
+        Recompute which screens have data to show and when the
+        next of them goes stale
+
+        :param data: the sign's Data store
+        :param now: current Unix time, the basis of Data.last_updated()
+        """
+        eligible = 0
+        expires_at = None
+        for index, screen in enumerate(self._screens):
+            if screen.key is not None:
+                if not data.has_item(screen.key):
+                    continue
+                if screen.max_age > 0:
+                    expires = data.last_updated(screen.key) + screen.max_age
+                    if expires <= now:
+                        continue
+                    if expires_at is None or expires < expires_at:
+                        expires_at = expires
+            eligible |= 1 << index
+
+        self._eligible = eligible
+        self._expires_at = expires_at
+        self._generation = data.generation
+
+    def is_eligible(self, index=None) -> bool:
+        """True if the screen at index (default: current) has something to show"""
+        if index is None:
+            index = self._index
+        return bool(self._eligible & (1 << index))
+
+    def mark_empty(self) -> None:
+        """
+        The current screen turned out to have nothing to show (e.g. bad
+        data); skip it until Data changes
+        """
+        self._eligible &= ~(1 << self._index)
+
+    def advance(self, ready=None):
+        """
+        Move on to the next eligible screen, wrapping around, and return it
+
+        Returns None and stays put if no screen is eligible.
+
+        :param ready: optional function called with a Screen; returning
+            False skips it (used for conditions like "daylight")
+        """
+        count = len(self._screens)
+        index = self._index
+        for _ in range(count):
+            index += 1
+            if index == count:
+                index = 0
+            if not self._eligible & (1 << index):
+                continue
+            screen = self._screens[index]
+            if ready is not None and not ready(screen):
+                continue
+            self._index = index
+            return screen
+
+        return None
+
+    def restart(self, ready=None):
+        """
+        Go back to the first eligible screen and return it (or None, as
+        for advance())
+        """
+        self._index = len(self._screens) - 1
+        return self.advance(ready)
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/pressure - memory pressure tiers
+====================================================
+
+* Author: John Romkey
+"""
+
+
+class MemoryPressure:
+    """
+    Tracks how short of memory the sign is as a tier from NORMAL to
+    DROP_DATA, based on the free heap measured right after a collection
+
+    Each tier sheds more so the sign keeps running instead of bouncing
+    off MemoryError:
+
+    * DROP_CACHES - cached images (e.g. the weather icon) are released and
+      not cached again
+    * DROP_FONTS - the mini clock font is unloaded in favor of the built
+      in font, and large MQTT payloads are refused
+    * DROP_DATA - non-essential Data keys are dropped
+
+    A tier is left once free memory climbs HYSTERESIS bytes above the
+    threshold that entered it, so a heap hovering at a threshold doesn't
+    flap between tiers. Recovery needs nothing more than that: caches
+    refill and fonts reload on demand, and dropped data comes back the
+    next time it's published.
+    """
+
+    NORMAL = 0
+    DROP_CACHES = 1
+    DROP_FONTS = 2
+    DROP_DATA = 3
+
+    NAMES = ("normal", "drop_caches", "drop_fonts", "drop_data")
+
+    # free bytes below which each tier (after NORMAL) is entered
+    THRESHOLDS = (48 * 1024, 32 * 1024, 16 * 1024)
+    HYSTERESIS = 8 * 1024
+
+    # Data keys nothing depends on
+    NON_ESSENTIAL_KEYS = ("debug", "lunar", "trimet")
+
+    # MQTT payloads larger than this are refused from DROP_FONTS on: the
+    # largest raw frame for the 64x32 canvas (header, 256 colors, pixels;
+    # see frame.py), which goes into a bitmap the sign already has.
+    # Frames the size of a larger display are refused.
+    LARGE_PAYLOAD = 8 + 3 * 256 + 64 * 32
+
+    def __init__(self, thresholds=THRESHOLDS, hysteresis=HYSTERESIS):
+        self._thresholds = thresholds
+        self._hysteresis = hysteresis
+        self.tier = MemoryPressure.NORMAL
+        # number of tier changes since boot
+        self.changes = 0
+
+    @property
+    def name(self) -> str:
+        """Name of the current tier"""
+        return MemoryPressure.NAMES[self.tier]
+
+    def update(self, free) -> bool:
+        """
+        Move to the tier for free bytes of heap; returns True if it changed
+
+        :param free: gc.mem_free() right after a collection
+        """
+        tier = self.tier
+        # go down as far as the free heap requires...
+        while tier < len(self._thresholds) and free < self._thresholds[tier]:
+            tier += 1
+        # ...or back up while it's comfortably above the tier's threshold
+        while (
+            tier > MemoryPressure.NORMAL
+            and free >= self._thresholds[tier - 1] + self._hysteresis
+        ):
+            tier -= 1
+
+        if tier == self.tier:
+            return False
+
+        self.tier = tier
+        self.changes += 1
+        return True
+
+    def refuses(self, size) -> bool:
+        """True if a payload of size bytes should be refused right now"""
+        return (
+            self.tier >= MemoryPressure.DROP_FONTS
+            and size > MemoryPressure.LARGE_PAYLOAD
+        )
@@ -0,0 +1,158 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/profiler - per-stage loop timing and allocation accounting
+====================================================
+
+* Author: John Romkey
+"""
+
+import gc
+
+from .stats import Histogram
+from . import timesource
+
+NS_PER_MINUTE = 60 * 1_000_000_000
+
+
+class Profiler:
+    """
+    Times each stage of the main loop into its own histogram and counts
+    the bytes each one allocates
+
+    Stages are named up front and their histograms allocated once, so
+    recording a sample doesn't allocate. The sign only calls into the
+    profiler while it's enabled; turned off it costs one attribute check
+    per loop pass.
+
+    Stages are timed back to back, each ending where the next begins:
+
+    .. code-block:: python
+       start = profiler.begin()
+       first_stage()
+       start = profiler.record("first", start)
+       second_stage()
+       profiler.record("second", start)
+
+    Allocations are the growth of gc.mem_alloc() across the stage. A
+    stage that triggers a collection shrinks the heap, and that sample is
+    dropped rather than counted as negative.
+
+    Other code, such as MQTT callbacks, can be accounted for by name with
+    track(). Those calls usually run inside a loop stage, so their bytes
+    are counted there as well.
+    """
+
+    # number of entries in top_allocators()
+    TOP_ALLOCATORS = 5
+
+    def __init__(self, stages, mem_alloc=None):
+        """
+        :param stages: names of the stages that will be recorded
+        :param mem_alloc: function returning bytes allocated, default gc.mem_alloc
+        """
+        self.stages = stages
+        self._mem_alloc = mem_alloc or gc.mem_alloc  # pylint: disable=no-member
+        self._histograms = {}
+        self._allocated = {}
+        for stage in stages:
+            self._histograms[stage] = Histogram()
+            self._allocated[stage] = 0
+        self._alloc_mark = 0
+        self._since = timesource.monotonic_ns()
+        self._enabled = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the loop is being profiled"""
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, enabled) -> None:
+        if enabled and not self._enabled:
+            # don't report samples from an earlier profiling session
+            self.reset()
+        self._enabled = enabled
+
+    def begin(self) -> int:
+        """Start timing the first stage of a pass; returns its start time"""
+        self._alloc_mark = self._mem_alloc()
+        return timesource.monotonic_ns()
+
+    def record(self, stage, start) -> int:
+        """
+        Record the time and allocations since start against stage and
+        return the current time, which is the start of the next stage
+
+        :param start: timesource.monotonic_ns() when the stage began
+        """
+        now = timesource.monotonic_ns()
+        self._histograms[stage].record((now - start) // 1000)
+
+        allocated = self._mem_alloc()
+        if allocated > self._alloc_mark:
+            self._allocated[stage] += allocated - self._alloc_mark
+        self._alloc_mark = allocated
+        return now
+
+    def track(self, name, function, *args):
+        """
+        Call function(*args), counting what it allocates against name
+        while the profiler is enabled, and return its result
+        """
+        if not self._enabled:
+            return function(*args)
+
+        before = self._mem_alloc()
+        try:
+            return function(*args)
+        finally:
+            allocated = self._mem_alloc() - before
+            if allocated > 0:
+                self._allocated[name] = self._allocated.get(name, 0) + allocated
+
+    def _per_minute(self, allocated, now) -> int:
+        elapsed = now - self._since
+        if elapsed <= 0:
+            return 0
+        return allocated * NS_PER_MINUTE // elapsed
+
+    def top_allocators(self) -> list:
+        """
+        The stages and tracked names allocating the most, as
+        [name, bytes per minute] pairs, largest first
+        """
+        now = timesource.monotonic_ns()
+        ranked = sorted(self._allocated.items(), key=lambda item: -item[1])
+        top = []
+        for name, allocated in ranked[: Profiler.TOP_ALLOCATORS]:
+            if allocated:
+                top.append([name, self._per_minute(allocated, now)])
+        return top
+
+    def summary(self) -> dict:
+        """
+        p50/p95/max in milliseconds and bytes allocated per minute for
+        every stage; zeros for a stage that didn't run
+        """
+        now = timesource.monotonic_ns()
+        report = {}
+        for stage in self.stages:
+            histogram = self._histograms[stage]
+            report[stage] = {
+                "p50": histogram.percentile(0.5) / 1000,
+                "p95": histogram.percentile(0.95) / 1000,
+                "max": histogram.max / 1000,
+                "alloc_per_min": self._per_minute(self._allocated[stage], now),
+            }
+        return report
+
+    def reset(self) -> None:
+        """Forget all samples"""
+        for histogram in self._histograms.values():
+            histogram.reset()
+        for name in self._allocated:
+            self._allocated[name] = 0
+        self._since = timesource.monotonic_ns()
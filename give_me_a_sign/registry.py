@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/registry - display modules, imported and built on first use
+====================================================
+
+* Author: John Romkey
+"""
+
+import os
+
+# module name -> (Data keys it displays, "package.module.Class")
+#
+# The keys are spelled out rather than read from each class's KEY so the
+# MQTT subscriptions can be set up without importing the modules.
+BUILTIN = {
+    "greet": (("greet",), "give_me_a_sign.greet.Greet"),
+    "weather": (("weather", "forecast"), "give_me_a_sign.weather.Weather"),
+    "message": (("message",), "give_me_a_sign.message.Message"),
+    "uv": (("uv",), "give_me_a_sign.uv.UV"),
+    "aqi": (("aqi",), "give_me_a_sign.aqi.AQI"),
+    "pollen": (("pollen",), "give_me_a_sign.pollen.Pollen"),
+    "image": (("image",), "give_me_a_sign.image.Image"),
+    "frame": (("frame",), "give_me_a_sign.frame.Frame"),
+    "tones": (("tones",), "give_me_a_sign.tones.Tones"),
+    "trimet": (("trimet",), "give_me_a_sign.trimet.Trimet"),
+    "ip": ((), "give_me_a_sign.ip.IP"),
+}
+
+
+class Registry:
+    """
+    The sign's display modules, by name
+
+    A module's Python code isn't imported until the module is first
+    asked for, so a sign that never shows the weather never pays for
+    weather.py. Deployments turn modules off with a comma separated list
+    in settings.toml:
+
+    .. code-block:: toml
+       DISABLED_MODULES = "pollen,trimet,uv"
+
+    A disabled module is never imported, its Data keys aren't subscribed
+    to over MQTT and its screens drop out of the playlist.
+
+    Modules from outside the package are added with register(). A module
+    is a class taking the GiveMeASign object, like the built in ones.
+    """
+
+    def __init__(self, app, disabled=None):
+        """
+        :param app: the GiveMeASign object this belongs to
+        :param disabled: names of modules to turn off; read from the
+            DISABLED_MODULES setting by default
+        """
+        self._app = app
+        self._specs = dict(BUILTIN)
+        if disabled is None:
+            disabled = (os.getenv("DISABLED_MODULES") or "").split(",")
+        self._disabled = [name.strip() for name in disabled if name.strip()]
+        self._modules = {}
+
+    def register(self, name, path, keys=()) -> None:
+        """
+        Add a module, or replace a built in one
+
+        :param name: what the module is asked for by
+        :param path: "package.module.Class" to import when it's first needed
+        :param keys: Data keys it displays, subscribed to over MQTT
+        """
+        self._specs[name] = (tuple(keys), path)
+        self._modules.pop(name, None)
+
+    def enabled(self, name) -> bool:
+        """True if name is a module that hasn't been turned off"""
+        return name in self._specs and name not in self._disabled
+
+    def get(self, name):
+        """
+        The module called name, imported and built the first time it's
+        asked for; None if it's turned off or couldn't be loaded
+        """
+        module = self._modules.get(name)
+        if module is not None:
+            return module
+        if not self.enabled(name):
+            return None
+
+        path = self._specs[name][1]
+        module_name, _, class_name = path.rpartition(".")
+        try:
+            python_module = __import__(module_name, None, None, (class_name,))
+            module = getattr(python_module, class_name)(self._app)
+        except (ImportError, AttributeError) as error:
+            print(f"can't load module {name}:", error)
+            self._app.logger.error(f"registry:can't load {name} {error}")
+            # don't try again on every loop pass
+            self._disabled.append(name)
+            return None
+
+        self._modules[name] = module
+        return module
+
+    def loaded(self, name):
+        """The module called name if it's been built already, otherwise None"""
+        return self._modules.get(name)
+
+    def keys(self) -> list:
+        """The Data keys of every enabled module"""
+        keys = []
+        for name, spec in self._specs.items():
+            if self.enabled(name):
+                keys.extend(spec[0])
+        return keys
@@ -0,0 +1,37 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/session - MiniMQTT, knowing whether a session was resumed
+====================================================
+
+* Author: John Romkey
+"""
+
+import adafruit_minimqtt.adafruit_minimqtt as MQTT
+
+
+class SessionMQTT(MQTT.MQTT):
+    """
+    MiniMQTT client that keeps the session present flag from the broker's
+    CONNACK
+
+    connect() returns the flag and passes it to on_connect, but MiniMQTT
+    takes it from the CONNACK's remaining length byte, which is always 2,
+    so it never reports a session. The flag is in the second of the three
+    bytes MiniMQTT reads after the CONNACK's packet type: the only three
+    byte read it makes before marking itself connected.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # whether the broker resumed a session at the last connect()
+        self.session_present = False
+
+    def _sock_exact_recv(self, bufsize, *args, **kwargs):
+        data = super()._sock_exact_recv(bufsize, *args, **kwargs)
+        if bufsize == 3 and not self._is_connected:
+            # remaining length, acknowledge flags, return code
+            self.session_present = bool(data[1] & 1)
+        return data
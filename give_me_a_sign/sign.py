@@ -30,8 +30,6 @@ def _require_circuitpython_version():
 
 _require_circuitpython_version()
 
-import time
-import gc
 import board
 import displayio
 import digitalio
@@ -49,21 +47,39 @@ from .data import Data
 from ._paths import ASSETS_DIR
 
 from .clock import Clock
-from .greet import Greet
 from .splash import Splash
-from .weather import Weather
-from .image import Image
-from .ip import IP
-from .tones import Tones
-from .message import Message
-from .uv import UV
-from .aqi import AQI
-from .pollen import Pollen
+from .playlist import Playlist
+from .registry import Registry
+from .boot import BootTimer
+from .collector import Collector
+from .interrupts import InterruptQueue
+from .pressure import MemoryPressure
+from .profiler import Profiler
+from .stats import Histogram
+from . import timesource
 
 FREE_MEMORY_LIMIT = 10000
-GC_INTERVAL_NS = 5 * 1_000_000_000
 LOW_MEMORY_LOG_INTERVAL_NS = 30 * 1_000_000_000
-DEBUG = False
+# with nothing in the playlist to show, how often to look again (seconds)
+IDLE_RECHECK_INTERVAL = 10
+# greetings, messages and images that can wait their turn at once
+INTERRUPT_QUEUE_SIZE = 8
+# Data key -> (default priority, seconds on screen, seconds it may wait)
+# (these keys are also the names of the modules that show them)
+INTERRUPT_DEFAULTS = {
+    "greet": (2, 15, 60),
+    "message": (1, 15, 5 * 60),
+    "image": (1, 15, 5 * 60),
+}
+# built in playlist screens besides the clock:
+# name -> (module, Data key, whether it shows the mini clock)
+SCREENS = {
+    "weather": ("weather", "weather", False),
+    "aqi": ("aqi", "aqi", True),
+    "uvi": ("uv", "uv", True),
+    "pollen": ("pollen", "pollen", True),
+    "frame": ("frame", "frame", False),
+}
 
 # All modules lay out their content on a virtual 64x32 canvas (one standard
 # panel). On larger displays - chained/tiled multiples of 64x32 - the canvas
@@ -76,19 +92,27 @@ class States:  # pylint: disable=too-few-public-methods
     """
     Simple class to just encapsulate the state variables used by the
     sign's state machine in loop()
+
+    The regular rotation (clock, weather, AQI...) is a single PLAYLIST
+    state; which screen it's on is tracked by the Playlist.
     """
 
-    CLOCK = 1
     IP_ADDRESS = 2
     SPLASH = 3
     GREET = 4
     MESSAGE = 5
-    WEATHER = 6
-    UVI = 7
-    AQI = 8
-    POLLEN = 9
-    TRIMET = 10
     IMAGE = 11
+    PLAYLIST = 12
+
+    # profiler stage names for each state's handler
+    NAMES = {
+        IP_ADDRESS: "ip_address",
+        SPLASH: "splash",
+        GREET: "greet",
+        MESSAGE: "message",
+        IMAGE: "image",
+        PLAYLIST: "playlist",
+    }
 
 
 class GiveMeASign:  # pylint: disable=too-many-instance-attributes
@@ -101,6 +125,8 @@ class GiveMeASign:  # pylint: disable=too-many-instance-attributes
     """
 
     def __init__(self, display):
+        # timed from power-on; marks are added as start() gets through them
+        self.boot = BootTimer()
         self._platform = Platform(self)
 
         self.display = display
@@ -120,17 +146,51 @@ class GiveMeASign:  # pylint: disable=too-many-instance-attributes
         self._setup_rtc()
 
         self.data = Data()
+        self._interrupts = InterruptQueue(INTERRUPT_QUEUE_SIZE)
+        self.data.add_listener(self._on_data_changed)
         self.logger = Logger.getLogger("default")
         self.logger.addHandler(Logger.StreamHandler())
         self.logger.setLevel(Logger.INFO)
         self.logger.info("Logger set up")
 
         self._countdown_time = 0
-        self._loop_state = States.CLOCK
+        self._loop_state = States.PLAYLIST
+        self._state_handlers = {
+            States.IP_ADDRESS: self._state_ip_address,
+            States.SPLASH: self._state_splash,
+            States.GREET: self._state_greet,
+            States.MESSAGE: self._state_message,
+            States.IMAGE: self._state_image,
+            States.PLAYLIST: self._state_playlist,
+        }
+        # interrupt Data key -> (show function, state while it's up)
+        self._interrupt_screens = {
+            "greet": (self._show_greet, States.GREET),
+            "message": (self._show_message, States.MESSAGE),
+            "image": (self._show_image, States.IMAGE),
+        }
+        # screens a playlist can name: name -> show function returning
+        # False when there's nothing to show, and name -> the Data key it
+        # displays (or None)
+        self._screens = {}
+        self._screen_keys = {}
+        self._conditions = {"daylight": lambda: not self.clock.is_sundown}
+        # display modules, imported and built when first needed
+        self.modules = Registry(self)
+        self._playlist = None
+        self._screen = None
         self.display_enabled = True
         self._blank_group = None
-        self._next_gc_time = 0
+        self.collector = Collector()
+        self.memory = MemoryPressure()
+        self.profiler = Profiler(
+            ("platform", "tones", "buttons", "gc") + tuple(States.NAMES.values())
+        )
         self._next_low_memory_log_time = 0
+        # time between display updates, published with the diagnostics
+        self.render_latency = Histogram()
+        self._last_render_time = 0
+        self.boot.mark("init")
 
     @property
     def canvas_width(self) -> int:
@@ -191,41 +251,106 @@ class GiveMeASign:  # pylint: disable=too-many-instance-attributes
     def start(self):
         """
         Kicks off the software side of things
+
+        Only the clock is set up here, showing the time from the RTC and
+        the timezone table saved in flash, so the sign is useful right
+        away. loop() brings up WiFi, NTP and MQTT afterwards (see
+        Platform.loop), and every other module is built the first time
+        it's needed.
         """
-        print("Splash screen...")
-        splash = Splash(self, ASSETS_DIR + "/wifi.bmp")
-        splash.show()
-        self._platform.wifi_connect()
-        print(f"IP address {self._platform.wifi_ip_address}")
+        self.clock = Clock(self)  # pylint: disable=attribute-defined-outside-init
+        self.boot.mark("clock")
+        self.clock.update_time()
+        self.boot.mark("first_clock")
 
-        self.ip_screen = IP(self)  # pylint: disable=attribute-defined-outside-init
+        self.add_screen("clock", self._show_clock)
+        for name, (module, key, mini_clock) in SCREENS.items():
+            if self.modules.enabled(module):
+                self.add_screen(name, self._module_screen(module, mini_clock), key)
+        self._load_playlist()
+        self.boot.mark("started")
 
-        if DEBUG:
-            self.ip_screen.show()
+    @property
+    def greeter(self):
+        """The greeting screen, or None if it's turned off"""
+        return self.modules.get("greet")
 
-            show_until = time.monotonic_ns() + 20 * 1e9
-            while True:
-                self.ip_screen.loop()
-                if time.monotonic_ns() > show_until:
-                    break
+    @property
+    def weather(self):
+        """The weather screen, or None if it's turned off"""
+        return self.modules.get("weather")
 
-            splash = Splash(self, ASSETS_DIR + "/nyan-16.bmp")
-            splash.show()
-            time.sleep(10)
+    @property
+    def message(self):
+        """The message screen, or None if it's turned off"""
+        return self.modules.get("message")
 
-        self.clock = Clock(self)  # pylint: disable=attribute-defined-outside-init
+    @property
+    def uv_index(self):
+        """The UV index screen, or None if it's turned off"""
+        return self.modules.get("uv")
 
-        self._platform.start_mqtt()
+    @property
+    def aqi(self):
+        """The air quality screen, or None if it's turned off"""
+        return self.modules.get("aqi")
 
-        self.greeter = Greet(self)  # pylint: disable=attribute-defined-outside-init
-        self.weather = Weather(self)  # pylint: disable=attribute-defined-outside-init
-        self.message = Message(self)  # pylint: disable=attribute-defined-outside-init
-        self.uv_index = UV(self)  # pylint: disable=attribute-defined-outside-init
-        self.aqi = AQI(self)  # pylint: disable=attribute-defined-outside-init
-        self.tones = Tones(self)  # pylint: disable=attribute-defined-outside-init
-        self.pollen = Pollen(self)  # pylint: disable=attribute-defined-outside-init
-        self.image = Image(self)  # pylint: disable=attribute-defined-outside-init
-        self._next_up(States.CLOCK, 20)
+    @property
+    def pollen(self):
+        """The pollen screen, or None if it's turned off"""
+        return self.modules.get("pollen")
+
+    @property
+    def image(self):
+        """The image screen, or None if it's turned off"""
+        return self.modules.get("image")
+
+    @property
+    def ip_screen(self):
+        """The IP address screen, or None if it's turned off"""
+        return self.modules.get("ip")
+
+    @property
+    def tones(self):
+        """The tone player, or None if it's turned off"""
+        return self.modules.get("tones")
+
+    def register_screen(self, name, path, key=None) -> None:
+        """
+        Add a screen of your own to the playlist, without changing the
+        library; call before start()
+
+        .. code-block:: python
+           sign = GiveMeASign(display)
+           sign.register_screen("bus", "bus_screen.BusScreen", "bus")
+           sign.start()
+
+        The class is imported the first time the screen comes up and
+        built with the GiveMeASign object. Its show() is called on every
+        loop pass while it's up and returns False when there's nothing to
+        show, as the weather screen's does.
+
+        :param name: the module and screen name playlists refer to it by
+        :param path: "module.Class" to import, e.g. from /lib
+        :param key: Data key it displays, if any; subscribed to over MQTT as
+            {prefix}/all/module/{key}, and the screen is skipped when the
+            data is older than the playlist entry's max_age
+        """
+        self.modules.register(name, path, () if key is None else (key,))
+        self.add_screen(name, self._module_screen(name), key)
+
+    def add_screen(self, name, show, key=None) -> None:
+        """
+        Make a screen available to the playlist
+
+        :param name: name playlist entries refer to it by
+        :param show: called on every loop pass while the screen is up;
+            returns False when there's nothing to show, which skips ahead
+        :param key: optional Data key; the screen is skipped when that
+            data is older than the playlist entry's max_age
+        """
+        self._screens[name] = show
+        self._screen_keys[name] = key
 
     def _setup_buttons(self):
         """
@@ -286,25 +411,92 @@ class GiveMeASign:  # pylint: disable=too-many-instance-attributes
 
         It services MQTT, checks the state of the buttons, and runs the
         state machine that decides what to display on the LED matrix
+
+        Each stage is also available on its own so an alternative runtime
+        (see AsyncRunner) can schedule them independently.
         """
-        self._platform.loop()
-        self.tones.loop()
+        if self.profiler.enabled:
+            self._profiled_loop()
+            return
 
-        now = time.monotonic_ns()
-        if now > self._next_gc_time:
-            self._next_gc_time = now + GC_INTERVAL_NS
-            gc.collect()
+        self._platform.loop()
+        self._tones_loop()
+        self.update_buttons()
+        self.render()
+        # right after a frame is committed is the least visible time to pause
+        self.collect_garbage()
+
+    def _profiled_loop(self) -> None:
+        """loop(), timing each stage and counting what it allocates"""
+        profiler = self.profiler
+        start = profiler.begin()
+        self._platform.loop()
+        start = profiler.record("platform", start)
+        self._tones_loop()
+        start = profiler.record("tones", start)
+        self.update_buttons()
+        start = profiler.record("buttons", start)
+        # charge the pass to the state that was handling it
+        state = States.NAMES[self._loop_state]
+        self.render()
+        start = profiler.record(state, start)
+        self.collect_garbage()
+        profiler.record("gc", start)
+
+    def _tones_loop(self) -> None:
+        """Advance the tones, if any have been played"""
+        tones = self.modules.loaded("tones")
+        if tones is not None:
+            tones.loop()
+
+    def collect_garbage(self) -> None:
+        """Offer the collector a chance to run, then check for low memory"""
+        now = timesource.monotonic_ns()
+        # a pause is visible while scrolling the IP address or playing tones
+        tones = self.modules.loaded("tones")
+        idle = self._loop_state != States.IP_ADDRESS and (
+            tones is None or tones.next_change() is None
+        )
+        if self.collector.poll(now, idle):
+            free = self.collector.free_after
+            if self.memory.update(free):
+                self._apply_memory_tier(free)
 
-            if gc.mem_free() < FREE_MEMORY_LIMIT:  # pylint: disable=no-member
+            if free < FREE_MEMORY_LIMIT:
                 if now > self._next_low_memory_log_time:
                     self._next_low_memory_log_time = now + LOW_MEMORY_LOG_INTERVAL_NS
-                    self.logger.error(
-                        f"give_me_a_sign:low memory {gc.mem_free()}"  # pylint: disable=no-member
-                    )
-
+                    self.logger.error(f"give_me_a_sign:low memory {free}")
+
+    def _apply_memory_tier(self, free) -> None:
+        """Shed (or stop shedding) memory to match the new pressure tier"""
+        tier = self.memory.tier
+        self.logger.info(f"give_me_a_sign:memory tier {self.memory.name} free {free}")
+
+        weather = self.modules.loaded("weather")
+        if weather is not None:
+            weather.cache_icons = tier < MemoryPressure.DROP_CACHES
+        self.clock.mini_font_enabled = tier < MemoryPressure.DROP_FONTS
+        if tier >= MemoryPressure.DROP_DATA:
+            for key in MemoryPressure.NON_ESSENTIAL_KEYS:
+                self.data.remove_item(key)
+
+    def update_buttons(self) -> None:
+        """Feed the button debouncers"""
         self.button1.update()
         self.button2.update()
 
+    def render(self) -> None:
+        """
+        Run the display state machine once
+
+        Records the time since the previous call in render_latency, which
+        is how long the display went without attention.
+        """
+        now = timesource.monotonic_ns()
+        if self._last_render_time:
+            self.render_latency.record((now - self._last_render_time) // 1000)
+        self._last_render_time = now
+
         try:
             self._loop_body()
         finally:
@@ -317,7 +509,7 @@ class GiveMeASign:  # pylint: disable=too-many-instance-attributes
         State machine and display updates; wrapped by loop() so display-off applies
         after every iteration.
         """
-        if self.data.is_updated(Tones.KEY):
+        if self.data.is_updated("tones") and self.tones is not None:
             self.tones.play()
 
         if self.button1.long_press:
@@ -348,10 +540,10 @@ class GiveMeASign:  # pylint: disable=too-many-instance-attributes
             group.append(line)
             self.show_group(group)
 
-            time.sleep(2)
+            timesource.sleep(2)
             microcontroller.reset()
 
-        if not self.button1.value:
+        if not self.button1.value and self.ip_screen is not None:
             self.ip_screen.show()
             self._next_up(States.IP_ADDRESS, 10)
             return
@@ -362,140 +554,210 @@ class GiveMeASign:  # pylint: disable=too-many-instance-attributes
             self._next_up(States.SPLASH, 10)
             return
 
-        if self.data.is_updated(Greet.KEY):
-            if self.greeter.show():
-                self.greeter.loop()
-                self._next_up(States.GREET, 15)
-                return
-
-        if self.data.is_updated(Message.KEY):
-            if self.message.show():
-                self.message.loop()
-                self._next_up(
-                    States.MESSAGE, self._data_duration(Message.KEY, 15)
-                )
-                return
-
-        if self.data.is_updated(Image.KEY):
-            if self.image.show():
-                self._next_up(States.IMAGE, self._data_duration(Image.KEY, 15))
-                return
-
-        if self._loop_state == States.MESSAGE:
-            if self._is_time_up():
-                self._next_up(States.CLOCK, 20)
-                return
+        if self.data.is_updated(Playlist.KEY):
+            self._load_playlist()
 
-            self.message.loop()
+        # interrupts wait for the one on screen to finish, but preempt
+        # the playlist and the button screens
+        if (
+            self._loop_state not in (States.GREET, States.MESSAGE, States.IMAGE)
+            or self._is_time_up()
+        ) and self._show_next_interrupt():
             return
 
-        if self._loop_state == States.GREET:
-            if self._is_time_up():
-                self._next_up(States.CLOCK, 20)
-                return
+        self._state_handlers[self._loop_state]()
 
-            self.greeter.loop()
+    def _on_data_changed(self, key) -> None:
+        """Data listener: queue every greeting, message and image as it arrives"""
+        defaults = INTERRUPT_DEFAULTS.get(key)
+        if defaults is None or not self.modules.enabled(key):
             return
 
-        if self._loop_state == States.IMAGE:
-            if self._is_time_up():
-                self._next_up(States.CLOCK, 20)
+        priority, duration, ttl = defaults
+        if not self._interrupts.push(
+            key, self.data.get_item(key), timesource.monotonic_ns(), priority, duration, ttl
+        ):
+            self.logger.error(f"give_me_a_sign:interrupt queue full, dropped {key}")
+
+    def _show_next_interrupt(self) -> bool:
+        """
+        Show the next queued interrupt, skipping any that turn out to be
+        invalid. Returns False if there was nothing to show.
+        """
+        while True:
+            item = self._interrupts.pop(timesource.monotonic_ns())
+            if item is None:
+                return False
+
+            show, state = self._interrupt_screens[item.key]
+            self.data.clear_updated(item.key)
+            if show(item.payload):
+                self._next_up(state, item.duration)
+                return True
+
+    def _interrupt_module(self, name):
+        """
+        The module to show an interrupt with, or None if it couldn't be
+        loaded (the interrupt was queued before it failed to)
+        """
+        module = self.modules.get(name)
+        if module is None:
+            self.logger.error(f"give_me_a_sign:no {name} module, dropped interrupt")
+        return module
+
+    def _show_greet(self, greeting) -> bool:
+        greeter = self._interrupt_module("greet")
+        if greeter is None or not greeter.show(greeting):
+            return False
+        greeter.loop()
+        return True
+
+    def _show_message(self, message) -> bool:
+        screen = self._interrupt_module("message")
+        if screen is None or not screen.show(message):
+            return False
+        screen.loop()
+        return True
+
+    def _show_image(self, image) -> bool:
+        screen = self._interrupt_module("image")
+        return screen is not None and screen.show(image)
+
+    def _state_message(self) -> None:
+        screen = self.message
+        if screen is None or self._is_time_up():
+            self._resume_playlist()
             return
 
-        if self._loop_state == States.IP_ADDRESS:
-            if self._is_time_up():
-                self._next_up(States.CLOCK, 20)
-                return
+        screen.loop()
 
-            self.ip_screen.loop()
+    def _state_greet(self) -> None:
+        greeter = self.greeter
+        if greeter is None or self._is_time_up():
+            self._resume_playlist()
             return
 
-        if self._loop_state == States.SPLASH:
-            if self._is_time_up():
-                self._next_up(States.CLOCK, 20)
-            return
+        greeter.loop()
 
-        if self._loop_state == States.CLOCK:
-            if self._is_time_up():
-                self._next_up(States.WEATHER, 10)
-                return
+    def _state_image(self) -> None:
+        if self._is_time_up():
+            self._resume_playlist()
 
-            self.clock.loop()
+    def _state_ip_address(self) -> None:
+        if self._is_time_up():
+            self._resume_playlist()
             return
 
-        if self._loop_state == States.WEATHER:
-            if (
-                self._is_time_up()
-                or self.data.age(Weather.KEY) > 60 * 60
-                or not self.weather.show()
-            ):
-                self._next_up(States.AQI, 10)
+        self.ip_screen.loop()
 
-            return
+    def _state_splash(self) -> None:
+        if self._is_time_up():
+            self._resume_playlist()
 
-        mini_clock = self.clock.mini_clock()
+    def _state_playlist(self) -> None:
+        """
+        Show the playlist's current screen, moving on when its time is up,
+        its data goes stale or it has nothing to show
+        """
+        playlist = self._playlist
+        now = timesource.time()
+        if playlist.is_stale(self.data, now):
+            playlist.refresh(self.data, now)
+
+        if self._is_time_up() or (
+            self._screen is not None and not playlist.is_eligible()
+        ):
+            self._next_screen(playlist.advance(self._screen_ready))
+
+        if self._screen is None:
+            # nothing in the playlist has anything to show
+            self.clock.loop()
+            return
 
-        if self._loop_state == States.AQI:
-            if (
-                self._is_time_up()
-                or self.data.age(AQI.KEY) > 60 * 60
-                or not self.aqi.show(mini_clock)
-            ):
-                self._next_up(States.UVI, 10)
+        if not self._screens[self._screen.name]():
+            playlist.mark_empty()
+            self._next_screen(playlist.advance(self._screen_ready))
 
-            return
+    def _screen_ready(self, screen) -> bool:
+        """Playlist hook: check the entry's condition, if it has one"""
+        return screen.condition is None or self._conditions[screen.condition]()
 
-        if self._loop_state == States.UVI:
-            if self.clock.is_sundown:
-                self._next_up(States.POLLEN, 10)
-            elif (
-                self._is_time_up()
-                or self.data.age(UV.KEY) > 60 * 60
-                or not self.uv_index.show(mini_clock)
-            ):
-                self._next_up(States.POLLEN, 10)
+    def _next_screen(self, screen) -> None:
+        """Put screen (None for the idle clock) up for its duration"""
+        self._screen = screen
+        if screen is None:
+            self._next_up(States.PLAYLIST, IDLE_RECHECK_INTERVAL)
+        else:
+            self._next_up(States.PLAYLIST, screen.duration)
 
-            return
+    def _show_clock(self) -> bool:
+        self.clock.loop()
+        return True
 
-        if self._loop_state == States.POLLEN:
-            if (
-                self._is_time_up()
-                or self.data.age(Pollen.KEY) > 60 * 60
-                or not self.pollen.show(mini_clock)
-            ):
-                self._next_up(States.CLOCK, 20)
+    def _module_screen(self, name, mini_clock=False):
+        """Playlist show function for the module called name"""
 
-            return
+        def show() -> bool:
+            module = self.modules.get(name)
+            if module is None:
+                return False
+            if mini_clock:
+                return module.show(self.clock.mini_clock())
+            return module.show()
 
-        self.clock.loop()
+        return show
 
-    def _data_duration(self, key, default) -> int:
+    def _load_playlist(self) -> None:
         """
-        Return the optional "duration" field (seconds) from the data stored
-        under key, or default if it's missing or invalid
+        (Re)build the playlist from Data, falling back to the default
+        rotation when none has been published or it's invalid
         """
-        item = self.data.get_item(key)
-        try:
-            duration = int(item["duration"])
-        except (KeyError, TypeError, ValueError):
-            return default
+        self.data.clear_updated(Playlist.KEY)
+        payload = self.data.get_item(Playlist.KEY)
+        if payload is not None:
+            try:
+                self._playlist = Playlist.parse(
+                    payload, self._screen_keys, self._conditions
+                )
+                self._resume_playlist()
+                return
+            except ValueError as error:
+                self.logger.error(f"give_me_a_sign:playlist rejected: {error}")
+
+        if self._playlist is None:
+            # leaving out screens that are turned off
+            default = [
+                entry
+                for entry in Playlist.DEFAULT
+                if entry["screen"] in self._screen_keys
+            ]
+            self._playlist = Playlist.parse(
+                default, self._screen_keys, self._conditions
+            )
+            self._resume_playlist()
 
-        return duration if duration > 0 else default
+    def _resume_playlist(self) -> None:
+        """Go back to the start of the regular rotation"""
+        playlist = self._playlist
+        now = timesource.time()
+        if playlist.is_stale(self.data, now):
+            playlist.refresh(self.data, now)
+        self._next_screen(playlist.restart(self._screen_ready))
 
     def _set_countdown(self, seconds) -> None:
         """
         Sets the state machine's countdown in seconds
 
-        Uses the monotonic clock: time.time() jumps when NTP corrects the
+        Uses the monotonic clock: timesource.time() jumps when NTP corrects the
         RTC, which could freeze the sign on one screen for hours
         """
-        self._countdown_time = time.monotonic_ns() + seconds * 1_000_000_000
+        self._countdown_time = timesource.monotonic_ns() + seconds * 1_000_000_000
 
     def _is_time_up(self) -> bool:
         """
         Returns whether the state machine's current countdown has completed
         """
-        return time.monotonic_ns() > self._countdown_time
+        return timesource.monotonic_ns() > self._countdown_time
 
     def _next_up(self, state, duration) -> None:
         """
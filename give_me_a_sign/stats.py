@@ -0,0 +1,97 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/stats - lightweight timing statistics
+====================================================
+
+* Author: John Romkey
+"""
+
+# bucket upper bounds in microseconds, roughly 1-2.5-5 per decade from
+# 100us to 5s; anything slower lands in the overflow bucket
+BUCKETS_US = (
+    100,
+    250,
+    500,
+    1_000,
+    2_500,
+    5_000,
+    10_000,
+    25_000,
+    50_000,
+    100_000,
+    250_000,
+    500_000,
+    1_000_000,
+    2_500_000,
+    5_000_000,
+)
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of durations in microseconds
+
+    Recording a sample only increments a preallocated counter, so it's
+    cheap enough to use on every loop pass. Percentiles are reported as
+    the upper bound of the bucket the sample falls in, which is plenty to
+    tell a 2 ms pass from a 200 ms stall.
+    """
+
+    def __init__(self, bounds=BUCKETS_US):
+        self._bounds = bounds
+        # one extra bucket for samples beyond the last bound
+        self._counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.max = 0
+
+    def record(self, value_us) -> None:
+        """Add one sample"""
+        bounds = self._bounds
+        index = 0
+        last = len(bounds)
+        while index < last and value_us > bounds[index]:
+            index += 1
+        self._counts[index] += 1
+        self.count += 1
+        if value_us > self.max:
+            self.max = value_us
+
+    def percentile(self, fraction) -> int:
+        """
+        Upper bound (microseconds) of the bucket holding the given fraction
+        of samples, e.g. 0.99 for p99; the largest sample if it's in the
+        overflow bucket, 0 with no samples
+        """
+        if self.count == 0:
+            return 0
+
+        target = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if count and seen >= target:
+                if index == len(self._bounds):
+                    return self.max
+                return min(self._bounds[index], self.max)
+        return self.max
+
+    def summary(self) -> dict:
+        """p50/p95/p99/max in milliseconds plus the sample count"""
+        return {
+            "p50": self.percentile(0.5) / 1000,
+            "p95": self.percentile(0.95) / 1000,
+            "p99": self.percentile(0.99) / 1000,
+            "max": self.max / 1000,
+            "count": self.count,
+        }
+
+    def reset(self) -> None:
+        """Forget all samples"""
+        counts = self._counts
+        for index, _ in enumerate(counts):
+            counts[index] = 0
+        self.count = 0
+        self.max = 0
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/timeparse - parsing time/set payloads
+====================================================
+
+Only ever reached through coldpath.call(); a time/set command is rare.
+
+* Author: John Romkey
+"""
+
+import json
+import time
+
+
+def parse_iso8601_utc(text):  # pylint: disable=too-many-return-statements
+    """
+    Parse an ISO 8601 UTC datetime string into a Unix epoch.
+
+    Accepts the formats Home Assistant's MQTT datetime entity sends, e.g.
+    2026-07-10T05:00:00, ...Z, ...+00:00, and optional fractional seconds.
+    Non-UTC offsets are applied so the result is still a UTC epoch.
+    """
+    text = text.strip()
+    if not text or text[0] < "0" or text[0] > "9":
+        return None
+
+    # Split timezone suffix: Z / z / ±HH:MM / ±HHMM
+    offset_seconds = 0
+    body = text
+    if body.endswith("Z") or body.endswith("z"):
+        body = body[:-1]
+    elif len(body) >= 6 and (body[-6] in "+-" and body[-3] == ":"):
+        sign = 1 if body[-6] == "+" else -1
+        try:
+            offset_seconds = sign * (int(body[-5:-3]) * 3600 + int(body[-2:]) * 60)
+        except ValueError:
+            return None
+        body = body[:-6]
+    elif len(body) >= 5 and body[-5] in "+-":
+        sign = 1 if body[-5] == "+" else -1
+        try:
+            offset_seconds = sign * (int(body[-4:-2]) * 3600 + int(body[-2:]) * 60)
+        except ValueError:
+            return None
+        body = body[:-5]
+
+    # Drop fractional seconds if present
+    if "." in body:
+        body = body.split(".", 1)[0]
+
+    # YYYY-MM-DDTHH:MM:SS or YYYY-MM-DD HH:MM:SS
+    body = body.replace(" ", "T", 1)
+    parts = body.split("T")
+    if len(parts) != 2:
+        return None
+    try:
+        year_s, month_s, day_s = parts[0].split("-")
+        time_parts = parts[1].split(":")
+        if len(time_parts) < 2:
+            return None
+        hour_s = time_parts[0]
+        minute_s = time_parts[1]
+        second_s = time_parts[2] if len(time_parts) > 2 else "0"
+        struct = time.struct_time(
+            (
+                int(year_s),
+                int(month_s),
+                int(day_s),
+                int(hour_s),
+                int(minute_s),
+                int(float(second_s)),
+                0,
+                0,
+                -1,
+            )
+        )
+        # RTC/time source is UTC; mktime treats the struct as local (= UTC here)
+        return int(time.mktime(struct)) - offset_seconds
+    except (ValueError, OverflowError, TypeError):
+        return None
+
+
+def parse_time_payload(text):
+    """
+    Accept HA ISO datetime strings, a bare epoch, or JSON {"epoch": ...}.
+    Returns a Unix epoch int, or None if the payload is unusable.
+    """
+    text = text.strip()
+    if not text:
+        return None
+
+    try:
+        data = json.loads(text)
+    except ValueError:
+        data = None
+
+    if isinstance(data, (int, float)):
+        return int(data)
+    if isinstance(data, dict) and "epoch" in data:
+        try:
+            return int(data["epoch"])
+        except (TypeError, ValueError):
+            return None
+    if isinstance(data, str):
+        text = data.strip()
+
+    try:
+        return int(float(text))
+    except ValueError:
+        pass
+
+    return parse_iso8601_utc(text)
@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/timesource - the one clock the sign reads
+====================================================
+
+* Author: John Romkey
+"""
+
+# pylint: disable=invalid-name,global-statement
+
+import time as _time
+
+# The sign reads the time only through these, never through the time
+# module directly, so a test or the host simulator can swap a virtual
+# clock in for the whole package with use(). They're module globals bound
+# straight to the time module's functions, so reading the real clock
+# costs one extra attribute lookup.
+monotonic_ns = _time.monotonic_ns
+monotonic = _time.monotonic
+# UTC epoch seconds, as kept by the RTC
+time = _time.time
+sleep = _time.sleep
+
+
+def use(source=None) -> None:
+    """
+    Read the time from source from now on, or from the time module again
+    if source is None
+
+    :param source: object with monotonic_ns(), monotonic(), time() and
+        sleep(seconds), e.g. a virtual clock
+    """
+    global monotonic_ns, monotonic, time, sleep
+    if source is None:
+        source = _time
+    monotonic_ns = source.monotonic_ns
+    monotonic = source.monotonic
+    time = source.time
+    sleep = source.sleep
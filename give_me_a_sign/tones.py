@@ -12,10 +12,11 @@ See https://docs.circuitpython.org/en/latest/shared-bindings/pwmio/index.html
 and https://learn.adafruit.com/using-piezo-buzzers-with-circuitpython-arduino/circuitpython
 """
 
-import time
 import board
 import pwmio
 
+from . import timesource
+
 
 class Tones:
     """
@@ -76,7 +77,7 @@ class Tones:
 
         self._tones = normalized
         self._current_index = -1
-        self._play_until = time.monotonic()
+        self._play_until = timesource.monotonic()
 
         return True
 
@@ -89,7 +90,7 @@ class Tones:
         if self._current_index is None:
             return
 
-        if self._play_until > time.monotonic():
+        if self._play_until > timesource.monotonic():
             return
 
         self._current_index += 1
@@ -102,4 +103,13 @@ class Tones:
         frequency, duration, volume = self._tones[self._current_index]
         self._pwm.frequency = frequency
         self._pwm.duty_cycle = int((volume / 100.0) * Tones.FULL_ON)
-        self._play_until = time.monotonic() + duration
+        self._play_until = timesource.monotonic() + duration
+
+    def next_change(self):
+        """
+        Seconds until loop() next has something to do, or None while
+        nothing is playing
+        """
+        if self._current_index is None:
+            return None
+        return max(0, self._play_until - timesource.monotonic())
@@ -0,0 +1,295 @@
+# SPDX-FileCopyrightText: 2023-2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+give-me-a-sign/transfer - large payloads sent over MQTT in numbered chunks
+====================================================
+
+* Author: John Romkey
+"""
+
+import os
+import json
+import binascii
+import storage
+
+
+class Transfer:
+    """
+    Receives a file or a large data payload in pieces
+
+    MiniMQTT reads each message whole into RAM, so an image or a big
+    timezone table sent as one message needs that much free heap at once.
+    A transfer instead starts with a JSON manifest on <root>/transfer:
+
+    .. code-block:: json
+       {"id": "sunset", "size": 5230, "crc32": 1234567890,
+        "chunk_size": 1024, "name": "sunset.bmp"}
+
+    then the data follows in chunks of chunk_size bytes (the last may be
+    shorter), chunk n published raw to <root>/transfer/<id>/<n>. Each
+    chunk goes straight to its destination:
+
+    * "name": a file in DIRECTORY, written to <name>.part and renamed
+      once all of it has arrived, e.g. an image to show with
+      {"filename": "/transfers/sunset.bmp"}
+    * "key": a buffer of size bytes allocated up front, stored under
+      that Data key once complete, as if it had been published to the
+      key's endpoint
+
+    The CRC-32 of the whole payload is checked before anything is used.
+
+    Progress is published retained to the status topic as {"id", "state",
+    "next", "received", "size"}, state being "receiving", "done" or
+    "failed" (with "error"). Only chunk <next> is accepted; a duplicate
+    or a chunk after a gap is dropped. The transfer survives a lost
+    connection, so the publisher resumes by sending the manifest again,
+    unchanged, and continuing from the status's next chunk.
+    """
+
+    # where named transfers are saved
+    DIRECTORY = "/transfers"
+    CHUNK_SIZE = 1024
+    MAX_CHUNK_SIZE = 4096
+    MAX_ID_LENGTH = 32
+
+    def __init__(self, app, client, status_topic, store):
+        """
+        :param app: the GiveMeASign object
+        :param client: publishes the status, the sign's Outbox
+        :param status_topic: where progress is published
+        :param store: store(key, buffer) handles a completed "key" transfer
+        """
+        self._app = app
+        self._client = client
+        self._status_topic = status_topic
+        self._store = store
+
+        self._manifest = None
+        self._path = None
+        self._buffer = None
+        self._next = 0
+        self._received = 0
+        self._crc = 0
+
+    @property
+    def active(self) -> bool:
+        """True while a transfer is waiting for chunks"""
+        return self._manifest is not None
+
+    def start(self, message) -> None:
+        """Begin the transfer described by a manifest, or resume it"""
+        try:
+            manifest = self._check_manifest(json.loads(message))
+        except (ValueError, TypeError, AttributeError, KeyError) as error:
+            print("bad transfer manifest:", error)
+            self._app.logger.error("transfer:bad manifest %s", error)
+            return
+
+        if manifest == self._manifest:
+            print(f"transfer {manifest['id']} resumed at chunk {self._next}")
+            self._publish_status("receiving")
+            return
+
+        self._abandon()
+        self._next = 0
+        self._received = 0
+        self._crc = 0
+        size = manifest["size"]
+        memory = self._app.memory
+        try:
+            if "key" in manifest:
+                if memory.refuses(size):
+                    raise MemoryError(f"memory tier {memory.name}")
+                self._buffer = bytearray(size)
+            else:
+                self._path = f"{Transfer.DIRECTORY}/{manifest['name']}"
+                self._create_part_file(size)
+        except (MemoryError, OSError) as error:
+            self._manifest = manifest
+            self._fail(f"can't receive {size} bytes: {error}")
+            return
+
+        self._manifest = manifest
+        print(f"transfer {manifest['id']} started, {size} bytes")
+        self._publish_status("receiving")
+
+    def write(self, transfer_id, index, chunk) -> None:
+        """Take chunk number index of transfer_id, if it's the one expected"""
+        manifest = self._manifest
+        if manifest is None or transfer_id != manifest["id"]:
+            return
+        try:
+            index = int(index)
+        except ValueError:
+            return
+        if index != self._next:
+            # a redelivered chunk, or one after a gap: say where to go on from
+            self._publish_status("receiving")
+            return
+
+        size = manifest["size"]
+        length = len(chunk)
+        last = self._received + length >= size
+        if self._received + length > size or (
+            not last and length != manifest["chunk_size"]
+        ):
+            self._fail(f"chunk {index} is {length} bytes")
+            return
+
+        try:
+            if self._buffer is not None:
+                self._buffer[self._received : self._received + length] = chunk
+            else:
+                self._writable(self._append, chunk)
+        except OSError as error:
+            self._fail(f"can't write chunk {index}: {error}")
+            return
+
+        self._crc = binascii.crc32(chunk, self._crc)
+        self._received += length
+        self._next += 1
+        if last:
+            self._finish()
+        else:
+            self._publish_status("receiving")
+
+    @staticmethod
+    def _check_manifest(manifest) -> dict:
+        """The manifest with defaults filled in; raises ValueError if it's unusable"""
+        transfer_id = manifest["id"]
+        if (
+            not isinstance(transfer_id, str)
+            or not 0 < len(transfer_id) <= Transfer.MAX_ID_LENGTH
+            or "/" in transfer_id
+            or "+" in transfer_id
+            or "#" in transfer_id
+        ):
+            raise ValueError("bad id")
+
+        size = manifest["size"]
+        chunk_size = manifest.get("chunk_size", Transfer.CHUNK_SIZE)
+        # JSON numbers can be floats, and True is an int to isinstance()
+        for number in (size, chunk_size):
+            if not isinstance(number, int) or isinstance(number, bool):
+                raise ValueError("bad size")
+        if size <= 0 or not 0 < chunk_size <= Transfer.MAX_CHUNK_SIZE:
+            raise ValueError("bad size")
+
+        checked = {
+            "id": transfer_id,
+            "size": size,
+            "crc32": manifest["crc32"] & 0xFFFFFFFF,
+            "chunk_size": chunk_size,
+        }
+        if "key" in manifest:
+            checked["key"] = str(manifest["key"])
+        else:
+            name = manifest["name"]
+            if not isinstance(name, str) or not name or "/" in name or name[0] == ".":
+                raise ValueError("bad name")
+            checked["name"] = name
+        return checked
+
+    @staticmethod
+    def _writable(function, *args):
+        """
+        Return function(*args), run with the filesystem writable as in
+        Data._save(); OSError if it can't be remounted, e.g. while USB has it
+        """
+        try:
+            storage.remount("/", False)
+        except RuntimeError as error:
+            raise OSError(f"read-only filesystem: {error}") from error
+        try:
+            return function(*args)
+        finally:
+            storage.remount("/", True)
+
+    def _create_part_file(self, size) -> None:
+        """Make an empty <path>.part, if there's room for size bytes"""
+        flash = os.statvfs("/")
+        if size > flash[0] * flash[3]:
+            raise OSError("not enough flash")
+        self._writable(self._truncate)
+
+    def _truncate(self) -> None:
+        try:
+            os.mkdir(Transfer.DIRECTORY)
+        except OSError:
+            pass  # already there
+        with open(self._path + ".part", "wb"):
+            pass
+
+    def _append(self, chunk) -> None:
+        with open(self._path + ".part", "ab") as file:
+            file.write(chunk)
+
+    def _replace(self) -> None:
+        try:
+            os.remove(self._path)
+        except OSError:
+            pass  # nothing to replace
+        os.rename(self._path + ".part", self._path)
+
+    def _remove_part_file(self) -> None:
+        try:
+            os.remove(self._path + ".part")
+        except OSError:
+            pass  # never created
+
+    def _finish(self) -> None:
+        """Check the CRC and put the payload where it goes"""
+        manifest = self._manifest
+        if self._crc != manifest["crc32"]:
+            self._fail("crc32 mismatch")
+            return
+
+        if self._buffer is not None:
+            buffer = self._buffer
+            self._buffer = None
+            self._store(manifest["key"], buffer)
+        else:
+            try:
+                self._writable(self._replace)
+            except OSError as error:
+                self._fail(f"can't save {self._path}: {error}")
+                return
+
+        print(f"transfer {manifest['id']} done")
+        self._app.logger.info("transfer:%s done", manifest["id"])
+        self._publish_status("done")
+        self._manifest = None
+        self._path = None
+
+    def _fail(self, error) -> None:
+        """Give up on the current transfer"""
+        print(f"transfer failed: {error}")
+        self._app.logger.error("transfer:%s failed %s", self._manifest["id"], error)
+        self._publish_status("failed", error)
+        self._abandon()
+
+    def _abandon(self) -> None:
+        """Drop the current transfer and whatever of it has arrived"""
+        if self._path is not None:
+            try:
+                self._writable(self._remove_part_file)
+            except OSError:
+                pass  # left for the next transfer of the same name
+        self._manifest = None
+        self._path = None
+        self._buffer = None
+
+    def _publish_status(self, state, error=None) -> None:
+        manifest = self._manifest
+        status = {
+            "id": manifest["id"],
+            "state": state,
+            "next": self._next,
+            "received": self._received,
+            "size": manifest["size"],
+        }
+        if error is not None:
+            status["error"] = error
+        self._client.publish(self._status_topic, json.dumps(status), retain=True)
@@ -15,6 +15,7 @@ import displayio
 import terminalio
 
 from ._paths import ASSETS_DIR
+from .pressure import MemoryPressure
 
 # OpenWeatherMap ``weather[].id`` -> icon filename stem.
 # See openweathermap.org/weather-conditions.
@@ -121,6 +122,39 @@ class Weather:
         :param app: the GiveMeASign object this belongs to
         """
         self._app = app
+        # the last icon loaded, (stem, bitmap, palette); show() runs on
+        # every loop pass so reloading the BMP each time is wasteful
+        self._icon = None
+        # built lazily, maybe after memory got tight; later tier changes
+        # come through the setter
+        self._cache_icons = app.memory.tier < MemoryPressure.DROP_CACHES
+
+    @property
+    def cache_icons(self) -> bool:
+        """Whether the last icon is kept; turning it off releases it"""
+        return self._cache_icons
+
+    @cache_icons.setter
+    def cache_icons(self, enabled) -> None:
+        self._cache_icons = enabled
+        if not enabled:
+            self._icon = None
+
+    def _load_icon(self, stem):
+        """Return (bitmap, palette) for the icon, from the cache if possible"""
+        if self._icon is not None and self._icon[0] == stem:
+            return self._icon[1], self._icon[2]
+
+        # let go of the old icon before loading the new one
+        self._icon = None
+        bitmap, palette = adafruit_imageload.load(
+            f"{ASSETS_DIR}/w/{stem}.bmp",
+            bitmap=displayio.Bitmap,
+            palette=displayio.Palette,
+        )
+        if self._cache_icons:
+            self._icon = (stem, bitmap, palette)
+        return bitmap, palette
 
     @staticmethod
     def _image_stem(current) -> str:
@@ -227,14 +261,11 @@ class Weather:
 
         group = displayio.Group()
 
-        image_filename = f"{ASSETS_DIR}/w/{Weather._image_stem(current)}.bmp"
+        stem = Weather._image_stem(current)
+        image_filename = f"{ASSETS_DIR}/w/{stem}.bmp"
 
         try:
-            bitmap, palette = adafruit_imageload.load(
-                image_filename,
-                bitmap=displayio.Bitmap,
-                palette=displayio.Palette,
-            )
+            bitmap, palette = self._load_icon(stem)
             tile_group = displayio.TileGrid(bitmap, pixel_shader=palette)
 
             group.append(tile_group)
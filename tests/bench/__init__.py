@@ -0,0 +1,5 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Micro-benchmarks for the package's hot pure functions; see runner.py."""
@@ -0,0 +1,11 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Run the micro-benchmarks; see runner.py for options."""
+
+import sys
+
+from .runner import main
+
+sys.exit(main())
@@ -0,0 +1,339 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Benchmark cases: name -> setup function returning the call to time.
+
+Each setup builds its object the way the unit tests do (``__new__`` plus
+the attributes the method needs, tests/sim/hal for hardware modules) with
+inputs shaped like what the sign sees in service.
+"""
+
+import importlib.util
+import json
+import py_compile
+from types import SimpleNamespace
+
+from encode_frame import encode
+
+from give_me_a_sign import discovery, timeparse
+from give_me_a_sign.aqi import AQI
+from give_me_a_sign.clock import Clock, TimeSnapshot
+from give_me_a_sign.data import Data
+from give_me_a_sign.frame import Frame
+from give_me_a_sign.home_assistant import HomeAssistant
+from give_me_a_sign.mqtt import SignMQTT
+from give_me_a_sign.outbox import Outbox
+from give_me_a_sign.pressure import MemoryPressure
+from give_me_a_sign.weather import Weather
+
+# Thursday 2026-03-05 12:00 UTC
+NOW = 1772712000
+HOUR = 3600
+
+STAGES = (
+    "platform",
+    "tones",
+    "buttons",
+    "gc",
+    "ip_address",
+    "splash",
+    "greet",
+    "message",
+    "image",
+    "playlist",
+)
+
+
+class _Logger:
+    def debug(self, message, *args):
+        pass
+
+    def error(self, message, *args):
+        pass
+
+    def info(self, message, *args):
+        pass
+
+
+class _MQTT:  # pylint: disable=too-few-public-methods
+    def publish(self, *args, **kwargs):
+        pass
+
+
+class _Data(Data):
+    """Never touches flash"""
+
+    def _restore(self) -> bool:
+        return False
+
+    def _save(self) -> bool:
+        return True
+
+
+def _clock():
+    app = SimpleNamespace(data=_Data(), logger=_Logger())
+    clock = Clock.__new__(Clock)
+    clock._app = app  # pylint: disable=protected-access
+    clock._timezone_breaks = None  # pylint: disable=protected-access
+    clock._timezone_cache_until = 0  # pylint: disable=protected-access
+    clock._timezone_cached_offset = 0  # pylint: disable=protected-access
+    clock._solar_prev_sunrise = None  # pylint: disable=protected-access
+    clock._snapshot = TimeSnapshot()  # pylint: disable=protected-access
+    return clock
+
+
+def _mqtt():
+    mqtt = SignMQTT.__new__(SignMQTT)
+    mqtt._app = SimpleNamespace(  # pylint: disable=protected-access
+        data=_Data(),
+        logger=_Logger(),
+        display_enabled=True,
+        memory=MemoryPressure(),
+        modules=SimpleNamespace(keys=lambda: ["aqi", "message", "weather"]),
+    )
+    return mqtt
+
+
+def clock_calculate_color():
+    """Solar color for a time between HA-style next sunset and next sunrise"""
+    clock = _clock()
+    clock._app.data.set_item(  # pylint: disable=protected-access
+        Clock.KEY_SOLAR, {"sunrise": NOW + 20 * HOUR, "sunset": NOW + 8 * HOUR}
+    )
+    return lambda: clock._calculate_color(NOW)  # pylint: disable=protected-access
+
+
+def clock_check_timezone_offset():
+    """A full scan of a year and a half of DST transitions"""
+    clock = _clock()
+    transitions = []
+    for year in range(2020, 2040):
+        spring = NOW + (year - 2026) * 365 * 24 * HOUR - 4 * 24 * HOUR
+        transitions.append({"timestamp": spring, "offset": -7 * HOUR})
+        transitions.append({"timestamp": spring + 238 * 24 * HOUR, "offset": -8 * HOUR})
+    clock._app.data.set_item(  # pylint: disable=protected-access
+        Clock.KEY_TIMEZONE, {"transitions": transitions}
+    )
+
+    def check():
+        # the cache would turn every call after the first into a comparison
+        clock._timezone_cache_until = 0  # pylint: disable=protected-access
+        clock._check_timezone_offset(NOW)  # pylint: disable=protected-access
+
+    return check
+
+
+def weather_image_stem():
+    """Icon lookup from an OpenWeatherMap condition id"""
+    current = {"condition_id": 500, "temperature": 61}
+    return lambda: Weather._image_stem(current)  # pylint: disable=protected-access
+
+
+def weather_forecast_text():
+    """Humidity and today's low/high"""
+    forecast = {"low": 55, "high": 79}
+    return lambda: Weather._forecast_text(  # pylint: disable=protected-access
+        forecast, 45
+    )
+
+
+def aqi_color():
+    """Color for an unhealthy-for-sensitive-groups AQI"""
+    return lambda: AQI._aqi_color(137)  # pylint: disable=protected-access
+
+
+def timeparse_parse_iso8601_utc():
+    """An HA datetime entity value with an offset"""
+    text = "2026-03-08T02:30:00-08:00"
+    return lambda: timeparse.parse_iso8601_utc(text)
+
+
+def timeparse_parse_time_payload():
+    """A time/set payload as MiniMQTT delivers it"""
+    message = "2026-03-08T10:30:00+00:00"
+    return lambda: timeparse.parse_time_payload(message)
+
+
+def _compiled(name) -> None:
+    """
+    Write the cold module's bytecode cache, which PYTHONDONTWRITEBYTECODE
+    would leave unwritten, so each coldpath.call() loads compiled code as
+    the sign loads a .mpy, rather than compiling the source every time
+    """
+    module = importlib.import_module(f"give_me_a_sign.{name}")
+    source = module.__file__
+    py_compile.compile(
+        source, cfile=importlib.util.cache_from_source(source), doraise=True
+    )
+
+
+def mqtt_parse_time_payload():
+    """The same payload through SignMQTT, which imports and unloads timeparse"""
+    _compiled("timeparse")
+    mqtt = _mqtt()
+    message = "2026-03-08T10:30:00+00:00"
+    return lambda: mqtt._parse_time_payload(message)  # pylint: disable=protected-access
+
+
+def mqtt_store_data():
+    """A typical weather publish, as the bytearray MiniMQTT hands over"""
+    mqtt = _mqtt()
+    message = bytearray(
+        json.dumps(
+            {
+                "temperature": 61,
+                "humidity": 45,
+                "condition_id": 500,
+                "icon": "10d",
+                "wind_speed": 7,
+            }
+        ).encode()
+    )
+    return lambda: mqtt.store_data("weather", message)
+
+
+def mqtt_store_timezone():
+    """A timezone table with five years of DST transitions"""
+    mqtt = _mqtt()
+    transitions = []
+    for year in range(5):
+        start = NOW + year * 365 * 24 * HOUR
+        transitions.append({"timestamp": start, "offset": -7 * HOUR})
+        transitions.append({"timestamp": start + 238 * 24 * HOUR, "offset": -8 * HOUR})
+    message = bytearray(
+        json.dumps(
+            {"timezone": "America/Los_Angeles", "transitions": transitions}
+        ).encode()
+    )
+    return lambda: mqtt.store_data("timezone", message)
+
+
+def mqtt_store_bulk():
+    """Weather, AQI and a message in one bulk publish"""
+    mqtt = _mqtt()
+    message = json.dumps(
+        {
+            "weather": {
+                "temperature": 61,
+                "humidity": 45,
+                "condition_id": 500,
+                "icon": "10d",
+                "wind_speed": 7,
+            },
+            "aqi": {"aqi": 42},
+            "message": "Back at 3",
+        }
+    )
+    return lambda: mqtt.store_bulk(message)
+
+
+def discovery_create_autodiscovery_config():
+    """Every discovery config for a sign with the profiler's stages"""
+    return lambda: list(
+        discovery.create_autodiscovery_config(
+            "givemeasign_aabbccddeeff",
+            "GiveMeASign - aa:bb:cc:dd:ee:ff",
+            "aa:bb:cc:dd:ee:ff",
+            "givemeasign/sign/aa_bb",
+            STAGES,
+        )
+    )
+
+
+def discovery_create_device_config():
+    """The single device discovery payload for the same sign"""
+    return lambda: discovery.create_device_config(
+        "givemeasign_aabbccddeeff",
+        "GiveMeASign - aa:bb:cc:dd:ee:ff",
+        "aa:bb:cc:dd:ee:ff",
+        "givemeasign/sign/aa_bb",
+        STAGES,
+    )
+
+
+def ha_create_autodiscovery_config():
+    """The same through HomeAssistant, which imports and unloads discovery"""
+    _compiled("discovery")
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", _MQTT(), "givemeasign/sign/aa_bb", STAGES)
+    return lambda: list(ha.create_autodiscovery_config())
+
+
+def ha_advertisements():
+    """Every per-entity advertisement serialized, one at a time as they're sent"""
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", _MQTT(), "givemeasign/sign/aa_bb", STAGES)
+
+    def advertise():
+        for _ in ha._advertisements():  # pylint: disable=protected-access
+            pass
+
+    return advertise
+
+
+def outbox_publish_drain():
+    """A diagnostics pass: three state topics, one toggled twice, then sent"""
+    outbox = Outbox(rate=1e9, burst=1e9)
+    client = _MQTT()
+
+    def publish_drain():
+        outbox.publish("givemeasign/sign/aa_bb/display/state", "OFF", True, 1)
+        outbox.publish("givemeasign/sign/aa_bb/diagnostics", "{}")
+        outbox.publish("givemeasign/sign/aa_bb/display/state", "ON", True, 1)
+        outbox.publish("givemeasign/sign/aa_bb/time/state", "2026-03-05T12:00:00+00:00")
+        outbox.drain(client)
+
+    return publish_drain
+
+
+def _frame_payload(rle):
+    """A 64x32 bar chart in 8 colors over a black background"""
+    pixels = bytearray(64 * 32)
+    for x in range(64):
+        height = 4 + (x * 5) % 26
+        for y in range(32 - height, 32):
+            pixels[y * 64 + x] = 1 + x // 8
+    palette = [(index * 28, 255 - index * 28, 128) for index in range(9)]
+    return bytearray(encode(64, 32, palette, bytes(pixels), rle=rle))
+
+
+def frame_receive_raw():
+    """A raw 64x32 frame copied into the Bitmap"""
+    app = SimpleNamespace(
+        canvas_width=64, canvas_height=32, display=SimpleNamespace(width=64, height=32)
+    )
+    frame = Frame(app)
+    payload = _frame_payload(rle=False)
+    return lambda: frame.receive(payload)
+
+
+def frame_receive_rle():
+    """The same frame run-length encoded"""
+    app = SimpleNamespace(
+        canvas_width=64, canvas_height=32, display=SimpleNamespace(width=64, height=32)
+    )
+    frame = Frame(app)
+    payload = _frame_payload(rle=True)
+    return lambda: frame.receive(payload)
+
+
+CASES = {
+    "clock_calculate_color": clock_calculate_color,
+    "clock_check_timezone_offset": clock_check_timezone_offset,
+    "weather_image_stem": weather_image_stem,
+    "weather_forecast_text": weather_forecast_text,
+    "aqi_color": aqi_color,
+    "timeparse_parse_iso8601_utc": timeparse_parse_iso8601_utc,
+    "timeparse_parse_time_payload": timeparse_parse_time_payload,
+    "mqtt_parse_time_payload": mqtt_parse_time_payload,
+    "mqtt_store_data": mqtt_store_data,
+    "mqtt_store_timezone": mqtt_store_timezone,
+    "mqtt_store_bulk": mqtt_store_bulk,
+    "discovery_create_autodiscovery_config": discovery_create_autodiscovery_config,
+    "discovery_create_device_config": discovery_create_device_config,
+    "ha_create_autodiscovery_config": ha_create_autodiscovery_config,
+    "ha_advertisements": ha_advertisements,
+    "outbox_publish_drain": outbox_publish_drain,
+    "frame_receive_raw": frame_receive_raw,
+    "frame_receive_rle": frame_receive_rle,
+}
@@ -0,0 +1,108 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+What keeping the cold modules out of RAM saves, and what it costs.
+
+    python -m tests.bench.coldpath
+
+For each module reached through give_me_a_sign.coldpath, reports:
+
+* resident_bytes - heap the module holds while it's imported, measured
+  with tracemalloc after a full collection, with everything the resident
+  code imports anyway already loaded. This is what unloading it saves
+  between uses.
+* left_bytes - heap still held after coldpath.unload(); should be ~0.
+* reimport_us - best time to import it again from a warm file cache,
+  the price of each use.
+
+Host bytecode and objects are bigger than CircuitPython's, so the bytes
+are a comparison between modules rather than a device figure; on the
+sign, gc.mem_free() before and after an import gives that.
+"""
+
+import contextlib
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from .runner import _use_hal
+
+# the cold modules; see coldpath.py
+MODULES = ("discovery", "timeparse", "diagnostics", "connect")
+
+REPEATS = 20
+
+
+def _heap() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def measure(name) -> dict:
+    """Resident and leftover bytes and re-import time for one cold module"""
+    # pylint: disable=import-outside-toplevel
+    from give_me_a_sign import coldpath
+
+    full_name = f"give_me_a_sign.{name}"
+    coldpath.unload(name)
+    tracemalloc.start()
+    try:
+        before = _heap()
+        __import__(full_name)
+        loaded = _heap()
+        coldpath.unload(name)
+        left = _heap()
+    finally:
+        tracemalloc.stop()
+
+    best = None
+    for _ in range(REPEATS):
+        start = time.perf_counter_ns()
+        __import__(full_name)
+        elapsed = time.perf_counter_ns() - start
+        coldpath.unload(name)
+        if best is None or elapsed < best:
+            best = elapsed
+
+    return {
+        "resident_bytes": loaded - before,
+        "left_bytes": left - before,
+        "reimport_us": round(best / 1000, 1),
+    }
+
+
+def report() -> dict:
+    """measure() for every cold module"""
+    _use_hal()
+    # pylint: disable=import-outside-toplevel,unused-import
+    # what the resident code has loaded by the time a cold module is used
+    import adafruit_minimqtt.adafruit_minimqtt
+    import board
+    import give_me_a_sign._version  # the package __init__ imports it on the sign
+    import give_me_a_sign.home_assistant
+    import give_me_a_sign.mqtt
+
+    return {name: measure(name) for name in MODULES}
+
+
+def main() -> None:
+    """Command line entry point"""
+    with open(os.devnull, "w", encoding="utf-8") as null:
+        with contextlib.redirect_stdout(null):
+            results = report()
+    print(f"{'module':14} {'resident B':>11} {'left B':>8} {'reimport us':>12}")
+    for name, result in results.items():
+        print(
+            f"{name:14} {result['resident_bytes']:>11} {result['left_bytes']:>8}"
+            f" {result['reimport_us']:>12}"
+        )
+    print(json.dumps(results), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
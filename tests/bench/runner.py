@@ -0,0 +1,222 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Runs the benchmark cases and compares them with the stored baseline.
+
+    python -m tests.bench                   # run and check against baseline.json
+    python -m tests.bench --margin 0.5      # allow 50% regressions
+    python -m tests.bench --update          # record a new baseline
+    python -m tests.bench --allocations-only  # report times, gate on peaks
+    python -m tests.bench --only aqi_color  # run one case
+
+Each case is timed as the best of several repeats, each long enough to
+swamp timer resolution, and has its peak allocation for one call measured
+with tracemalloc. Host timings don't carry over between machines, so time
+is compared as a ratio to a fixed pure-Python reference workload measured
+in the same run; allocations are compared in bytes. A case regresses when
+either grows by more than the margin. The exit status is 1 if any did.
+With --allocations-only, slower times are still reported but only
+allocation regressions fail the run: allocations are deterministic, while
+timings on a shared CI runner are not.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+import types
+from pathlib import Path
+
+_TESTS = Path(__file__).resolve().parent.parent
+_REPO = _TESTS.parent
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+# allowed growth over the baseline, as a fraction; BENCH_MARGIN overrides
+MARGIN = 0.25
+# allocation differences this small are noise from the interpreter
+ALLOC_SLACK = 64
+
+REPEATS = 7
+MIN_REPEAT_NS = 20_000_000
+
+
+def _use_hal() -> None:
+    """Import the package against tests/sim/hal, as tests/conftest.py does"""
+    for path in (_TESTS / "sim" / "hal", _REPO, _REPO / "extras" / "frame"):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+    if "give_me_a_sign" not in sys.modules:
+        package = types.ModuleType("give_me_a_sign")
+        package.__path__ = [str(_REPO / "give_me_a_sign")]
+        sys.modules["give_me_a_sign"] = package
+
+
+def _reference() -> int:
+    """A fixed mix of arithmetic, dict and string work"""
+    table = {}
+    total = 0
+    for index in range(200):
+        total += index * index % 7
+        table[index & 15] = str(index)
+    return total + len(table)
+
+
+def _time_ns(function, number) -> int:
+    start = time.perf_counter_ns()
+    for _ in range(number):
+        function()
+    return time.perf_counter_ns() - start
+
+
+def _calibrate(function) -> int:
+    number = 1
+    while _time_ns(function, number) < MIN_REPEAT_NS:
+        number *= 2
+    return number
+
+
+def time_per_call(function) -> tuple:
+    """
+    Best of REPEATS nanoseconds per call for function and for the
+    reference workload, timed alternately so both see the same machine
+    """
+    number = _calibrate(function)
+    reference_number = _calibrate(_reference)
+    best = best_reference = None
+    for _ in range(REPEATS):
+        elapsed = _time_ns(_reference, reference_number) / reference_number
+        if best_reference is None or elapsed < best_reference:
+            best_reference = elapsed
+        elapsed = _time_ns(function, number) / number
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, best_reference
+
+
+def peak_allocation(function) -> int:
+    """Peak bytes allocated during one call, after a warm-up call"""
+    function()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        function()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+
+def run(names=None) -> dict:
+    """Measure the named cases (all by default)"""
+    _use_hal()
+    from .cases import CASES  # pylint: disable=import-outside-toplevel
+
+    results = {}
+    with open(os.devnull, "w", encoding="utf-8") as null:
+        # store_data and friends print as they work
+        with contextlib.redirect_stdout(null):
+            reference = None
+            for name, setup in CASES.items():
+                if names and name not in names:
+                    continue
+                function = setup()
+                per_call, case_reference = time_per_call(function)
+                if reference is None or case_reference < reference:
+                    reference = case_reference
+                results[name] = {
+                    "ns": round(per_call),
+                    "relative": round(per_call / case_reference, 4),
+                    "peak_bytes": peak_allocation(function),
+                }
+    return {
+        "python": sys.version.split()[0],
+        "reference_ns": round(reference or 0),
+        "cases": results,
+    }
+
+
+def compare(baseline, current, margin=MARGIN, timings=True) -> list:
+    """
+    Descriptions of every case in current that regressed from baseline;
+    leaves out time regressions when timings is False
+    """
+    regressions = []
+    for name, result in current["cases"].items():
+        before = baseline["cases"].get(name)
+        if before is None:
+            continue
+        if timings and result["relative"] > before["relative"] * (1 + margin):
+            regressions.append(
+                f"{name}: time {result['relative']:.3f}x reference,"
+                f" baseline {before['relative']:.3f}x"
+            )
+        allowed = before["peak_bytes"] * (1 + margin) + ALLOC_SLACK
+        if result["peak_bytes"] > allowed:
+            regressions.append(
+                f"{name}: peak {result['peak_bytes']} bytes, baseline {before['peak_bytes']}"
+            )
+    return regressions
+
+
+def _report(results, baseline) -> None:
+    print(
+        f"{'case':38} {'ns/call':>10} {'x ref':>8} {'base':>8} {'peak B':>8} {'base':>8}"
+    )
+    for name, result in results["cases"].items():
+        before = baseline["cases"].get(name, {}) if baseline else {}
+        print(
+            f"{name:38} {result['ns']:>10} {result['relative']:>8.3f}"
+            f" {before.get('relative', float('nan')):>8.3f}"
+            f" {result['peak_bytes']:>8} {before.get('peak_bytes', '-'):>8}"
+        )
+
+
+def main(argv=None) -> int:
+    """Command line entry point; returns the exit status"""
+    parser = argparse.ArgumentParser(prog="python -m tests.bench", description=__doc__)
+    parser.add_argument(
+        "--margin",
+        type=float,
+        default=float(os.getenv("BENCH_MARGIN", str(MARGIN))),
+        help="allowed fractional regression (default 0.25, or $BENCH_MARGIN)",
+    )
+    parser.add_argument("--update", action="store_true", help="write baseline.json")
+    parser.add_argument("--only", action="append", help="run just this case")
+    parser.add_argument(
+        "--allocations-only",
+        action="store_true",
+        help="report time regressions but fail only on allocation ones",
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.only)
+    baseline = None
+    if BASELINE.exists():
+        baseline = json.loads(BASELINE.read_text(encoding="utf-8"))
+    _report(results, baseline)
+
+    if args.update:
+        if args.only and baseline:
+            baseline["cases"].update(results["cases"])
+            results["cases"] = baseline["cases"]
+        BASELINE.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written to {BASELINE}")
+        return 0
+
+    if baseline is None:
+        print("no baseline; run with --update to record one")
+        return 1
+
+    regressions = compare(baseline, results, args.margin)
+    failing = regressions
+    if args.allocations_only:
+        failing = compare(baseline, results, args.margin, timings=False)
+    for regression in regressions:
+        print("REGRESSION" if regression in failing else "SLOWER", regression)
+    return 1 if failing else 0
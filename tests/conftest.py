@@ -2,17 +2,22 @@
 #
 # SPDX-License-Identifier: MIT
 
-"""Pytest configuration: CircuitPython stubs and shared fixtures."""
+"""Pytest configuration: the host CircuitPython modules and shared fixtures."""
 
 import sys
 import types
 from pathlib import Path
 
-_STUBS = Path(__file__).resolve().parent / "stubs"
+import pytest
+
+# the simulator's host CircuitPython modules, which the unit tests share
+_HAL = Path(__file__).resolve().parent / "sim" / "hal"
 _REPO = Path(__file__).resolve().parent.parent
 _PKG = _REPO / "give_me_a_sign"
+# the frame encoder, which test_frame.py uses to build frames
+_FRAME_ENCODER = _REPO / "extras" / "frame"
 
-for _path in (_STUBS, _REPO):
+for _path in (_HAL, _REPO, _FRAME_ENCODER):
     _text = str(_path)
     if _text not in sys.path:
         sys.path.insert(0, _text)
@@ -23,3 +28,15 @@ if "give_me_a_sign" not in sys.modules:
     _package = types.ModuleType("give_me_a_sign")
     _package.__path__ = [str(_PKG)]
     sys.modules["give_me_a_sign"] = _package
+
+
+@pytest.fixture
+def virtual_clock():
+    """A VirtualClock that the whole package reads the time from during the test"""
+    from give_me_a_sign import timesource  # pylint: disable=import-outside-toplevel
+    from tests.sim.clock import VirtualClock  # pylint: disable=import-outside-toplevel
+
+    clock = VirtualClock()
+    timesource.use(clock)
+    yield clock
+    timesource.use(None)
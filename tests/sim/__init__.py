@@ -0,0 +1,7 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Headless host simulator; see simulator.py and docs/TEST_PLAN.md."""
+
+from .simulator import Simulator, SimFrame
@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Run the sign headless and dump frames:
+
+    python -m tests.sim --seconds 120 --capture-every 10 --out /tmp/frames \\
+        --publish 'givemeasign/all/module/message={"text": "hello"}'
+
+``--publish`` takes ``[SECONDS@]TOPIC=PAYLOAD`` and may be repeated;
+SECONDS is when, in simulated time after boot, to publish it.
+"""
+
+import argparse
+import calendar
+import os
+import time
+
+from .simulator import Simulator
+
+
+def _when(text) -> int:
+    return calendar.timegm(time.strptime(text, "%Y-%m-%dT%H:%M:%S"))
+
+
+def _publication(text):
+    when = 0.0
+    head, _, payload = text.partition("=")
+    if "@" in head:
+        seconds, head = head.split("@", 1)
+        when = float(seconds)
+    return when, head, payload
+
+
+def main(argv=None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(prog="python -m tests.sim", description=__doc__)
+    parser.add_argument(
+        "--seconds", type=float, default=60, help="simulated seconds to run"
+    )
+    parser.add_argument("--width", type=int, default=64)
+    parser.add_argument("--height", type=int, default=32)
+    parser.add_argument("--bit-depth", type=int, default=2)
+    parser.add_argument(
+        "--start", type=_when, help="UTC start time, YYYY-MM-DDTHH:MM:SS"
+    )
+    parser.add_argument("--out", default="sim-frames", help="directory for frames")
+    parser.add_argument(
+        "--capture-every", type=float, default=5, help="seconds between frames"
+    )
+    parser.add_argument("--scale", type=int, default=8, help="PNG pixels per LED")
+    parser.add_argument(
+        "--raw", action="store_true", help="write raw RGB888 instead of PNG"
+    )
+    parser.add_argument("--publish", action="append", type=_publication, default=[])
+    args = parser.parse_args(argv)
+
+    options = {"width": args.width, "height": args.height, "bit_depth": args.bit_depth}
+    if args.start is not None:
+        options["start"] = args.start
+    sim = Simulator(**options)
+    sim.boot()
+
+    os.makedirs(args.out, exist_ok=True)
+    pending = sorted(args.publish, key=lambda publication: publication[0])
+    elapsed = 0.0
+    next_capture = 0.0
+    count = 0
+    while elapsed < args.seconds:
+        while pending and pending[0][0] <= elapsed:
+            _, topic, payload = pending.pop(0)
+            sim.publish(topic, payload)
+        sim.step()
+        elapsed += 0.05
+        if elapsed >= next_capture:
+            frame = sim.frame()
+            name = os.path.join(args.out, f"frame-{count:05d}")
+            if args.raw:
+                frame.save_raw(name + ".rgb")
+            else:
+                frame.save_png(name + ".png", args.scale)
+            count += 1
+            next_capture += args.capture_every
+
+    print(f"{count} frames in {args.out}, {sim.passes} loop passes")
+
+
+if __name__ == "__main__":
+    main()
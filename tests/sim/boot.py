@@ -0,0 +1,150 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Cold start benchmark: boot the sign in the simulator until the clock is
+showing and MQTT is up, and report when each boot milestone was reached.
+
+    python -m tests.sim.boot --runs 5
+
+Every run is a fresh interpreter, so imports and font loading are paid
+for as on a real power-on. Two timelines come back per milestone:
+
+* virtual - milliseconds on the virtual clock, the same numbers the sign
+  publishes on <base>/boot. The host network answers instantly, so WiFi,
+  NTP and MQTT are given device-like latencies (--wifi, --ntp, --mqtt)
+  that are slept on the virtual clock; only waits show up here.
+* wall - real milliseconds the host spent getting there, which is where
+  imports, font parsing and module construction show up.
+
+The report holds the median of each across runs.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .simulator import Simulator
+
+_REPO = Path(__file__).resolve().parent.parent.parent
+
+# device-like network latencies, seconds
+WIFI_SECONDS = 3.0
+NTP_SECONDS = 0.4
+MQTT_SECONDS = 0.5
+
+# simulated seconds of loop after start() to wait for the boot to finish
+DONE_WITHIN = 60
+
+
+def boot_once(wifi=WIFI_SECONDS, ntp=NTP_SECONDS, mqtt=MQTT_SECONDS) -> dict:
+    """Boot the sign once in this process; milestones on both timelines"""
+    # pylint: disable=import-outside-toplevel
+    wall_start = time.perf_counter_ns()
+    sim = Simulator()
+    sim.install()
+
+    import adafruit_ntp
+    import wifi as host_wifi
+    from adafruit_minimqtt import adafruit_minimqtt
+    from give_me_a_sign.boot import BootTimer
+
+    # a cold start, not a soft reload with the radio still joined
+    host_wifi.radio.connected = False
+    host_wifi.CONNECT_SECONDS = wifi
+    adafruit_ntp.RESPONSE_SECONDS = ntp
+    adafruit_minimqtt.CONNECT_SECONDS = mqtt
+
+    wall = {}
+    mark = BootTimer.mark
+
+    def timed_mark(timer, name):
+        if name not in wall:
+            wall[name] = (time.perf_counter_ns() - wall_start) // 1_000_000
+        mark(timer, name)
+
+    BootTimer.mark = timed_mark
+    try:
+        sim.boot(settle=0)
+        deadline = sim.clock.monotonic() + DONE_WITHIN
+        while not sim.app.boot.done and sim.clock.monotonic() < deadline:
+            sim.step()
+    finally:
+        BootTimer.mark = mark
+
+    return {"virtual": sim.app.boot.report(), "wall": wall}
+
+
+def _run_child(args) -> dict:
+    command = [
+        sys.executable,
+        "-m",
+        "tests.sim.boot",
+        "--child",
+        "--wifi",
+        str(args.wifi),
+        "--ntp",
+        str(args.ntp),
+        "--mqtt",
+        str(args.mqtt),
+    ]
+    result = subprocess.run(
+        command, cwd=_REPO, capture_output=True, text=True, timeout=300, check=False
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stdout + result.stderr)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _medians(runs, timeline) -> dict:
+    """Median per milestone, in the order the first run reached them"""
+    return {
+        name: int(statistics.median(run[timeline][name] for run in runs))
+        for name in runs[0][timeline]
+        if all(name in run[timeline] for run in runs)
+    }
+
+
+def benchmark(args) -> dict:
+    """Boot args.runs times, each in its own interpreter"""
+    runs = [_run_child(args) for _ in range(args.runs)]
+    return {
+        "runs": args.runs,
+        "latency": {"wifi": args.wifi, "ntp": args.ntp, "mqtt": args.mqtt},
+        "virtual_ms": _medians(runs, "virtual"),
+        "wall_ms": _medians(runs, "wall"),
+    }
+
+
+def main(argv=None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.sim.boot",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--wifi", type=float, default=WIFI_SECONDS)
+    parser.add_argument("--ntp", type=float, default=NTP_SECONDS)
+    parser.add_argument("--mqtt", type=float, default=MQTT_SECONDS)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        with open(os.devnull, "w", encoding="utf-8") as null:
+            with contextlib.redirect_stdout(null):
+                report = boot_once(args.wifi, args.ntp, args.mqtt)
+    else:
+        report = benchmark(args)
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Virtual clock for the simulator.
+
+Simulated time only moves when the simulator advances it or the sign
+sleeps, so a run is deterministic and a day of sign time takes as long as
+the work done in it, not a day. VirtualEventLoop runs asyncio on the same
+clock.
+"""
+
+import asyncio
+import math
+import selectors
+import time
+
+NS_PER_SECOND = 1_000_000_000
+
+# 2026-01-01T00:00:00Z
+DEFAULT_EPOCH = 1767225600
+
+
+class VirtualClock:
+    """Replaces time.monotonic(), monotonic_ns(), time() and sleep()"""
+
+    def __init__(self, epoch=DEFAULT_EPOCH):
+        """
+        :param epoch: UTC epoch seconds the wall clock starts at
+        """
+        # monotonic time starts well above zero, as it does on a board
+        # that's been up a few seconds by the time code.py runs
+        self._monotonic_ns = 5 * NS_PER_SECOND
+        self._epoch_ns = epoch * NS_PER_SECOND - self._monotonic_ns
+        self._saved = None
+        # host nanoseconds are charged to simulated time times this; 0 so
+        # only sleeping and advance() move time on
+        self._cpu_scale = 0
+        self._charged_at = 0
+
+    def charge_cpu(self, scale) -> None:
+        """
+        From now on, move time on by the host time that passes between
+        readings, times scale, so code that's slow on the host is slow on
+        the sign too; 0 to stop
+        """
+        self._cpu_scale = scale
+        self._charged_at = time.perf_counter_ns()
+
+    def _charge(self) -> None:
+        if self._cpu_scale:
+            now = time.perf_counter_ns()
+            self._monotonic_ns += int((now - self._charged_at) * self._cpu_scale)
+            self._charged_at = now
+
+    def monotonic_ns(self) -> int:
+        """Nanoseconds since boot"""
+        self._charge()
+        return self._monotonic_ns
+
+    def monotonic(self) -> float:
+        """Seconds since boot"""
+        self._charge()
+        return self._monotonic_ns / NS_PER_SECOND
+
+    def time(self) -> float:
+        """UTC epoch seconds"""
+        self._charge()
+        return (self._epoch_ns + self._monotonic_ns) / NS_PER_SECOND
+
+    def sleep(self, seconds) -> None:
+        """Sleeping just moves time on"""
+        self.advance(seconds)
+
+    def advance(self, seconds) -> None:
+        """Move time on by seconds"""
+        self.advance_ns(int(seconds * NS_PER_SECOND))
+
+    def advance_ns(self, nanoseconds) -> None:
+        """Move time on by nanoseconds"""
+        self._charge()
+        if nanoseconds > 0:
+            self._monotonic_ns += nanoseconds
+
+    def set_time(self, epoch) -> None:
+        """Set the wall clock, as setting the RTC does; monotonic time is untouched"""
+        self._epoch_ns = int(epoch * NS_PER_SECOND) - self._monotonic_ns
+
+    def install(self) -> None:
+        """Replace the time module's clocks with this one"""
+        if self._saved is None:
+            self._saved = (time.monotonic, time.monotonic_ns, time.time, time.sleep)
+        time.monotonic = self.monotonic
+        time.monotonic_ns = self.monotonic_ns
+        time.time = self.time
+        time.sleep = self.sleep
+
+    def uninstall(self) -> None:
+        """Put the real clocks back"""
+        if self._saved is not None:
+            time.monotonic, time.monotonic_ns, time.time, time.sleep = self._saved
+            self._saved = None
+
+
+class _VirtualSelector(selectors.SelectSelector):
+    """Waiting for I/O that never comes just moves the clock on"""
+
+    def __init__(self, clock):
+        super().__init__()
+        self._clock = clock
+
+    def select(self, timeout=None) -> list:
+        if timeout is None:
+            raise RuntimeError("every task is waiting on something besides time")
+        # rounded up, or a timer due in less than a nanosecond never is
+        self._clock.advance_ns(math.ceil(timeout * NS_PER_SECOND))
+        return []
+
+
+class VirtualEventLoop(asyncio.SelectorEventLoop):
+    """
+    An asyncio event loop on a VirtualClock: asyncio.sleep() moves
+    simulated time on instead of waiting, so tasks run as they would on
+    the sign, only as fast as the host can run them
+    """
+
+    def __init__(self, clock):
+        super().__init__(_VirtualSelector(clock))
+        self._virtual_clock = clock
+
+    def time(self) -> float:
+        return self._virtual_clock.monotonic()
+
+    def run_for(self, seconds, coroutine) -> None:
+        """Run coroutine for seconds of simulated time, then cancel it"""
+
+        async def limited():
+            try:
+                await asyncio.wait_for(coroutine, seconds)
+            except asyncio.TimeoutError:
+                pass
+
+        self.run_until_complete(limited())
@@ -1,5 +1,3 @@
 # SPDX-FileCopyrightText: 2026 John Romkey
 #
 # SPDX-License-Identifier: MIT
-
-"""Minimal ``adafruit_display_text`` stub for host-side unit tests."""
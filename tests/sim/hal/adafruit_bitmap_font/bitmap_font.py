@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``adafruit_bitmap_font.bitmap_font`` for the simulator: reads BDF fonts.
+
+Glyphs are decoded the first time they're asked for, like the real
+library's lazy loading.
+"""
+
+import displayio
+
+
+class Glyph:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """One character: its pixels and how it sits on the baseline"""
+
+    def __init__(
+        self, bitmap, width, height, dx, dy, shift_x, shift_y=0
+    ):  # pylint: disable=too-many-arguments
+        self.bitmap = bitmap
+        self.tile_index = 0
+        self.width = width
+        self.height = height
+        self.dx = dx
+        self.dy = dy
+        self.shift_x = shift_x
+        self.shift_y = shift_y
+
+
+class BDF:
+    """A font read from a BDF file"""
+
+    def __init__(self, path):
+        self.path = path
+        self._glyphs = {}
+        self._sources = {}
+        self._box = (0, 0, 0, 0)
+        self.ascent = 0
+        self.descent = 0
+
+        with open(path, "r", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+
+        encoding = None
+        start = None
+        for number, line in enumerate(lines):
+            if line.startswith("FONTBOUNDINGBOX "):
+                self._box = tuple(int(part) for part in line.split()[1:5])
+            elif line.startswith("FONT_ASCENT "):
+                self.ascent = int(line.split()[1])
+            elif line.startswith("FONT_DESCENT "):
+                self.descent = int(line.split()[1])
+            elif line.startswith("STARTCHAR"):
+                start = number
+            elif line.startswith("ENCODING "):
+                encoding = int(line.split()[1])
+            elif line == "ENDCHAR" and start is not None and encoding is not None:
+                self._sources[encoding] = lines[start:number]
+                start = encoding = None
+
+    def get_bounding_box(self) -> tuple:
+        """(width, height, x offset, y offset) enclosing every glyph"""
+        return self._box
+
+    def load_glyphs(self, code_points) -> None:
+        """Decode the glyphs for code_points ahead of time"""
+        for code_point in code_points:
+            self.get_glyph(
+                code_point if isinstance(code_point, int) else ord(code_point)
+            )
+
+    def get_glyph(self, code_point):
+        """The Glyph for code_point, or None if the font lacks it"""
+        if code_point in self._glyphs:
+            return self._glyphs[code_point]
+
+        glyph = None
+        source = self._sources.get(code_point)
+        if source is not None:
+            glyph = BDF._parse(source)
+        self._glyphs[code_point] = glyph
+        return glyph
+
+    @staticmethod
+    def _parse(source) -> Glyph:
+        shift_x = 0
+        width = height = dx = dy = 0
+        rows = None
+        for line in source:
+            if rows is not None:
+                rows.append(line)
+            elif line.startswith("DWIDTH "):
+                shift_x = int(line.split()[1])
+            elif line.startswith("BBX "):
+                width, height, dx, dy = (int(part) for part in line.split()[1:5])
+            elif line == "BITMAP":
+                rows = []
+
+        bitmap = displayio.Bitmap(max(1, width), max(1, height), 2)
+        for y, row in enumerate((rows or [])[:height]):
+            bits = int(row, 16) if row else 0
+            total = len(row) * 4
+            for x in range(width):
+                if bits & (1 << (total - 1 - x)):
+                    bitmap[x, y] = 1
+        return Glyph(bitmap, width, height, dx, dy, shift_x)
+
+
+def load_font(path, bitmap=None):  # pylint: disable=unused-argument
+    """Load a BDF font"""
+    if not path.lower().endswith(".bdf"):
+        raise ValueError("the simulator only reads BDF fonts")
+    return BDF(path)
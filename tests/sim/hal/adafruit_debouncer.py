@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``adafruit_debouncer`` for the simulator.
+
+Button follows the library's semantics closely enough for the sign:
+value, pressed/released edges and a one-shot long_press.
+"""
+
+import time
+
+
+class Button:  # pylint: disable=too-many-instance-attributes
+    """A debounced push button"""
+
+    def __init__(
+        self, pin, short_duration_ms=200, long_duration_ms=500, value_when_pressed=False
+    ):
+        self._pin = pin
+        self._long_duration = long_duration_ms / 1000
+        self._pressed_value = value_when_pressed
+        self.value = pin.value
+        self.pressed = False
+        self.released = False
+        self.long_press = False
+        self.short_count = 0
+        self._pressed_at = None
+        self._long_reported = False
+        self.short_duration_ms = short_duration_ms
+
+    def update(self) -> None:
+        """Sample the pin"""
+        previous = self.value
+        self.value = self._pin.value
+        now = time.monotonic()
+        is_pressed = self.value == self._pressed_value
+
+        self.pressed = is_pressed and previous != self.value
+        self.released = not is_pressed and previous != self.value
+        self.long_press = False
+
+        if self.pressed:
+            self._pressed_at = now
+            self._long_reported = False
+        elif self.released:
+            if not self._long_reported:
+                self.short_count = 1
+            self._pressed_at = None
+        else:
+            self.short_count = 0
+
+        if (
+            is_pressed
+            and self._pressed_at is not None
+            and not self._long_reported
+            and now - self._pressed_at >= self._long_duration
+        ):
+            self.long_press = True
+            self._long_reported = True
@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``adafruit_display_text.label`` for the simulator: renders text into a
+bitmap using the font's glyphs.
+
+Placement follows adafruit_display_text: the label's ``x`` is the left edge
+of the text and its ``y`` the vertical middle of the first line.
+"""
+
+import displayio
+
+
+def _ink(glyph) -> tuple:
+    """(x, y) of the glyph's set pixels, worked out once per glyph"""
+    ink = getattr(glyph, "ink", None)
+    if ink is None:
+        source = glyph.bitmap
+        ink = tuple(
+            (x, y)
+            for y in range(glyph.height)
+            for x in range(glyph.width)
+            if source[x, y]
+        )
+        glyph.ink = ink
+    return ink
+
+
+class Label(displayio.Group):  # pylint: disable=too-many-instance-attributes
+    """A line (or lines) of text in one color"""
+
+    def __init__(
+        self,
+        font,
+        *,
+        text="",
+        color=0xFFFFFF,
+        background_color=None,
+        line_spacing=1.25,
+        scale=1,
+        x=0,
+        y=0,
+        anchor_point=None,
+        anchored_position=None,
+        **kwargs,
+    ):  # pylint: disable=too-many-arguments,unused-argument
+        super().__init__(scale=scale, x=x, y=y)
+        self._font = font
+        self._text = str(text)
+        self._color = color
+        self._background_color = background_color
+        self._line_spacing = line_spacing
+        self._box = (0, 0, 0, 0)
+        self._anchor_point = anchor_point
+        self._ascent, self._descent = self._ascent_descent()
+        self._render()
+        if anchored_position is not None:
+            self.anchored_position = anchored_position
+
+    def _ascent_descent(self) -> tuple:
+        ascent = descent = 0
+        for character in "M j'":
+            glyph = self._font.get_glyph(ord(character))
+            if glyph is None:
+                continue
+            ascent = max(ascent, glyph.height + glyph.dy)
+            descent = max(descent, -glyph.dy)
+        return ascent, descent
+
+    def _layout(self, text):
+        """Glyphs with their top left corners, and the box around them"""
+        line_height = int(self._font.get_bounding_box()[1] * self._line_spacing)
+        baseline = self._ascent // 2
+        placed = []
+        left = top = 0
+        right = bottom = 0
+        cursor = 0
+        first = True
+        for character in text:
+            if character == "\n":
+                cursor = 0
+                baseline += line_height
+                continue
+            glyph = self._font.get_glyph(ord(character))
+            if glyph is None:
+                continue
+            glyph_x = cursor + glyph.dx
+            glyph_y = baseline - glyph.height - glyph.dy
+            placed.append((glyph, glyph_x, glyph_y))
+            if first:
+                left, top = glyph_x, baseline - self._ascent
+                right, bottom = glyph_x, baseline + self._descent
+                first = False
+            left = min(left, glyph_x)
+            top = min(top, glyph_y, baseline - self._ascent)
+            cursor += glyph.shift_x
+            right = max(right, cursor, glyph_x + glyph.width)
+            bottom = max(bottom, glyph_y + glyph.height, baseline + self._descent)
+        return placed, (left, top, right - left, bottom - top)
+
+    @staticmethod
+    def _ink_bitmap(placed, box):
+        """A two value Bitmap of box with the placed glyphs' ink set to 1"""
+        left, top, width, height = box
+        bitmap = displayio.Bitmap(width, height, 2)
+        pixels = bitmap._pixels  # pylint: disable=protected-access
+        for glyph, glyph_x, glyph_y in placed:
+            origin = (glyph_y - top) * width + glyph_x - left
+            for x, y in _ink(glyph):
+                pixels[origin + y * width + x] = 1
+        return bitmap
+
+    def _render(self) -> None:
+        while len(self):
+            self.pop()
+
+        placed, box = self._layout(self._text)
+        self._box = box
+        left, top, width, height = box
+        if width <= 0 or height <= 0:
+            return
+
+        bitmap = self._ink_bitmap(placed, box)
+        palette = displayio.Palette(2)
+        if self._background_color is None:
+            palette.make_transparent(0)
+        else:
+            palette[0] = self._background_color
+        palette[1] = self._color if self._color is not None else 0
+        if self._color is None:
+            palette.make_transparent(1)
+        self._palette = palette
+        self.append(displayio.TileGrid(bitmap, pixel_shader=palette, x=left, y=top))
+
+    @property
+    def bounding_box(self) -> tuple:
+        """(x, y, width, height) of the text relative to the label's position"""
+        return self._box
+
+    @property
+    def text(self) -> str:
+        """The text shown"""
+        return self._text
+
+    @text.setter
+    def text(self, text) -> None:
+        text = str(text)
+        if text != self._text:
+            self._text = text
+            self._render()
+
+    @property
+    def font(self):
+        """The font the text is drawn in"""
+        return self._font
+
+    @font.setter
+    def font(self, font) -> None:
+        self._font = font
+        self._ascent, self._descent = self._ascent_descent()
+        self._render()
+
+    @property
+    def color(self):
+        """Text color"""
+        return self._color
+
+    @color.setter
+    def color(self, color) -> None:
+        if (color is None) == (self._color is None) and len(self):
+            # same transparency; only the palette changes
+            self._palette[1] = color if color is not None else 0
+            self._color = color
+            return
+        self._color = color
+        self._render()
+
+    @property
+    def background_color(self):
+        """Color behind the text, None for transparent"""
+        return self._background_color
+
+    @background_color.setter
+    def background_color(self, color) -> None:
+        self._background_color = color
+        self._render()
+
+    @property
+    def anchor_point(self):
+        """(x, y) fraction of the box that anchored_position refers to"""
+        return self._anchor_point
+
+    @anchor_point.setter
+    def anchor_point(self, point) -> None:
+        self._anchor_point = point
+
+    @property
+    def anchored_position(self):
+        """Where the anchor point is, in the parent's coordinates"""
+        anchor_x, anchor_y = self._anchor_point or (0, 0)
+        left, top, width, height = self._box
+        return (
+            self.x + (left + round(anchor_x * width)) * self.scale,
+            self.y + (top + round(anchor_y * height)) * self.scale,
+        )
+
+    @anchored_position.setter
+    def anchored_position(self, position) -> None:
+        anchor_x, anchor_y = self._anchor_point or (0, 0)
+        left, top, width, height = self._box
+        self.x = position[0] - (left + round(anchor_x * width)) * self.scale
+        self.y = position[1] - (top + round(anchor_y * height)) * self.scale
@@ -0,0 +1,73 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``adafruit_display_text.scrolling_label`` for the simulator.
+
+Text longer than max_characters scrolls one character every animate_time
+seconds of (simulated) time, wrapping around with a gap as the real
+ScrollingLabel does.
+"""
+
+import time
+
+from .label import Label
+
+
+class ScrollingLabel(Label):
+    """A label showing a window of max_characters that moves along the text"""
+
+    def __init__(
+        self,
+        font,
+        *,
+        max_characters=10,
+        text="",
+        animate_time=0.3,
+        current_index=0,
+        **kwargs
+    ):  # pylint: disable=too-many-arguments
+        self._full_text = str(text)
+        self.max_characters = max_characters
+        self.animate_time = animate_time
+        self.current_index = current_index
+        self._last_animate_time = -1
+        super().__init__(font, text=self._window(), **kwargs)
+
+    def _window(self) -> str:
+        text = self._full_text
+        if len(text) <= self.max_characters:
+            return text
+        looped = text + "  " + text
+        index = self.current_index % (len(text) + 2)
+        return looped[index : index + self.max_characters]
+
+    def update(self, force=False) -> None:
+        """Move along one character if animate_time has passed"""
+        now = time.monotonic()
+        if not force and self._last_animate_time + self.animate_time > now:
+            return
+        self._last_animate_time = now
+        if len(self._full_text) > self.max_characters:
+            self.current_index += 1
+        Label.text.fset(self, self._window())
+
+    @property
+    def full_text(self) -> str:
+        """All of the text, of which a window is shown"""
+        return self._full_text
+
+    @full_text.setter
+    def full_text(self, text) -> None:
+        self._full_text = str(text)
+        self.current_index = 0
+        Label.text.fset(self, self._window())
+
+    @property
+    def text(self) -> str:
+        return self._full_text
+
+    @text.setter
+    def text(self, text) -> None:
+        self.full_text = text
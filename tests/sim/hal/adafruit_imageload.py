@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``adafruit_imageload`` for the simulator: reads uncompressed BMPs.
+
+Indexed (1, 4 and 8 bit) images load into a Bitmap and Palette; 24 bit
+images into an RGB565 Bitmap and ColorConverter, as on the device.
+"""
+
+import struct
+
+import displayio
+
+
+class _Header:
+    """What a BMP's headers say about its pixels"""
+
+    def __init__(self, path, data):
+        if data[:2] != b"BM":
+            raise NotImplementedError(f"{path}: only BMP images are supported")
+
+        self.pixel_offset = struct.unpack_from("<I", data, 10)[0]
+        self.size = struct.unpack_from("<I", data, 14)[0]
+        width, height, _, depth, compression = struct.unpack_from("<iiHHI", data, 18)
+        self.colors_used = (
+            struct.unpack_from("<I", data, 46)[0] if self.size >= 40 else 0
+        )
+        if compression not in (0, 3) or depth not in (1, 4, 8, 24):
+            raise NotImplementedError(
+                f"{path}: unsupported BMP ({depth} bit, {compression})"
+            )
+
+        self.width = width
+        self.height = abs(height)
+        self.depth = depth
+        self._bottom_up = height > 0
+        self._stride = ((width * depth + 31) // 32) * 4
+
+    def row(self, y) -> int:
+        """Offset of row y's pixels in the file"""
+        if self._bottom_up:
+            y = self.height - 1 - y
+        return self.pixel_offset + y * self._stride
+
+
+def load(path, *, bitmap=None, palette=None):
+    """Load the BMP at path, returning (bitmap, palette)"""
+    with open(path, "rb") as file:
+        data = file.read()
+
+    header = _Header(path, data)
+    if header.depth == 24:
+        return _load_rgb(data, header, bitmap or displayio.Bitmap)
+    return _load_indexed(
+        data, header, bitmap or displayio.Bitmap, palette or displayio.Palette
+    )
+
+
+def _load_rgb(data, header, bitmap_type):
+    image = bitmap_type(header.width, header.height, 65536)
+    shader = displayio.ColorConverter(input_colorspace=displayio.Colorspace.RGB565)
+    for y in range(header.height):
+        row = header.row(y)
+        for x in range(header.width):
+            blue, green, red = data[row + x * 3 : row + x * 3 + 3]
+            image[x, y] = ((red >> 3) << 11) | ((green >> 2) << 5) | (blue >> 3)
+    return image, shader
+
+
+def _read_palette(data, header, palette_type):
+    count = header.colors_used or (1 << header.depth)
+    shader = palette_type(count)
+    table = 14 + header.size
+    for index in range(count):
+        blue, green, red = data[table + index * 4 : table + index * 4 + 3]
+        shader[index] = (red << 16) | (green << 8) | blue
+    return shader, count
+
+
+def _load_indexed(data, header, bitmap_type, palette_type):
+    shader, count = _read_palette(data, header, palette_type)
+    depth = header.depth
+    image = bitmap_type(header.width, header.height, count)
+    mask = (1 << depth) - 1
+    for y in range(header.height):
+        row = header.row(y)
+        for x in range(header.width):
+            bit = x * depth
+            byte = data[row + bit // 8]
+            value = (byte >> (8 - depth - bit % 8)) & mask
+            image[x, y] = min(value, count - 1)
+    return image, shader
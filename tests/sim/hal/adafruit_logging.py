@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Host ``adafruit_logging`` for the simulator: prints and keeps recent records."""
+
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+CRITICAL = 50
+
+_NAMES = {
+    DEBUG: "DEBUG",
+    INFO: "INFO",
+    WARNING: "WARNING",
+    ERROR: "ERROR",
+    CRITICAL: "CRITICAL",
+}
+
+_LOGGERS = {}
+
+
+class StreamHandler:  # pylint: disable=too-few-public-methods
+    """Prints records"""
+
+    def emit(self, level, message) -> None:  # pylint: disable=no-self-use
+        print(f"{_NAMES.get(level, level)} - {message}")
+
+
+# records each logger keeps
+RECORDS = 200
+
+
+class Logger:
+    """Keeps the latest records in records as (level, message)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.level = INFO
+        self.records = deque((), RECORDS)
+        self._handlers = []
+
+    def addHandler(self, handler) -> None:  # pylint: disable=invalid-name
+        """Send records to handler as well"""
+        self._handlers.append(handler)
+
+    def setLevel(self, level) -> None:  # pylint: disable=invalid-name
+        """Ignore records below level"""
+        self.level = level
+
+    def log(self, level, message, *args) -> None:
+        """Record message at level"""
+        if level < self.level:
+            return
+        if args:
+            message = message % args
+        self.records.append((level, message))
+        for handler in self._handlers:
+            handler.emit(level, message)
+
+    def debug(self, message, *args) -> None:
+        """Record at DEBUG"""
+        self.log(DEBUG, message, *args)
+
+    def info(self, message, *args) -> None:
+        """Record at INFO"""
+        self.log(INFO, message, *args)
+
+    def warning(self, message, *args) -> None:
+        """Record at WARNING"""
+        self.log(WARNING, message, *args)
+
+    def error(self, message, *args) -> None:
+        """Record at ERROR"""
+        self.log(ERROR, message, *args)
+
+    def critical(self, message, *args) -> None:
+        """Record at CRITICAL"""
+        self.log(CRITICAL, message, *args)
+
+
+def getLogger(name="default"):  # pylint: disable=invalid-name
+    """The logger called name"""
+    if name not in _LOGGERS:
+        _LOGGERS[name] = Logger(name)
+    return _LOGGERS[name]
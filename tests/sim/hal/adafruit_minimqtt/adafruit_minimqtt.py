@@ -0,0 +1,272 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``adafruit_minimqtt`` for the simulator: clients talk to an
+in-process broker instead of a socket.
+
+BROKER routes messages between every client in the process, honoring
+``+``/``#`` wildcards, retained messages, wills and persistent sessions
+(a client that connects with clean_session=False gets its subscriptions
+and the messages that arrived meanwhile back when it reconnects under the
+same client id). The simulator
+publishes to it as the outside world would and reads back everything
+the sign published. CONNECT_SECONDS makes connecting take that long on
+the virtual clock, and LOOP_BLOCKS makes loop() wait out its timeout.
+"""
+
+import time
+
+# how long connect() blocks; 0 unless a test models a real network
+CONNECT_SECONDS = 0.0
+# whether loop(timeout) blocks for timeout, as the real one does reading
+# a quiet socket; off unless a test models a real network
+LOOP_BLOCKS = False
+
+
+class MMQTTException(Exception):
+    """MiniMQTT's error"""
+
+
+def _matches(pattern, topic) -> bool:
+    pattern_levels = pattern.split("/")
+    topic_levels = topic.split("/")
+    for index, level in enumerate(pattern_levels):
+        if level == "#":
+            return True
+        if index >= len(topic_levels):
+            return False
+        if level not in ("+", topic_levels[index]):
+            return False
+    return len(pattern_levels) == len(topic_levels)
+
+
+class Broker:
+    """Routes messages between the clients in this process"""
+
+    def __init__(self):
+        self.clients = []
+        self.retained = {}
+        # every message published, as (time.monotonic(), topic, payload, retain);
+        # turn keep_log off for long runs and rely on counts
+        self.log = []
+        self.keep_log = True
+        # topic -> number of messages published to it
+        self.counts = {}
+        # set False to refuse connections
+        self.available = True
+        # client id -> (subscriptions, queued messages) of persistent
+        # sessions whose client is away
+        self.sessions = {}
+
+    def reset(self) -> None:
+        """Forget clients, retained messages and the log"""
+        vars(self).update(vars(Broker()))
+
+    def publish(self, topic, payload, retain=False, sender=None) -> None:
+        """Deliver payload to every subscriber of topic"""
+        if isinstance(payload, (bytes, bytearray)):
+            payload = bytes(payload)
+            try:
+                payload = payload.decode()
+            except UnicodeError:
+                pass  # binary, e.g. a transfer chunk; kept as bytes
+        else:
+            payload = str(payload)
+        self.counts[topic] = self.counts.get(topic, 0) + 1
+        if self.keep_log:
+            self.log.append((time.monotonic(), topic, payload, retain))
+        if retain:
+            if payload:
+                self.retained[topic] = payload
+            else:
+                self.retained.pop(topic, None)
+        for client in self.clients:
+            if client is not sender and client.subscribed(topic):
+                client.queue.append((topic, payload))
+        for subscriptions, queue in self.sessions.values():
+            if any(_matches(pattern, topic) for pattern in subscriptions):
+                queue.append((topic, payload))
+
+    def published(self, topic_filter="#") -> list:
+        """(topic, payload) for every logged message matching topic_filter"""
+        return [
+            (topic, payload)
+            for _, topic, payload, _ in self.log
+            if _matches(topic_filter, topic)
+        ]
+
+    def last(self, topic):
+        """The last payload published to topic, or None"""
+        for _, logged_topic, payload, _ in reversed(self.log):
+            if logged_topic == topic:
+                return payload
+        return None
+
+
+BROKER = Broker()
+
+
+class MQTT:  # pylint: disable=too-many-instance-attributes
+    """A client of BROKER"""
+
+    def __init__(self, *, broker=None, port=1883, client_id=None, **kwargs):
+        self.broker = broker
+        self.port = port
+        self.client_id = client_id
+        self.use_binary_mode = kwargs.get("use_binary_mode", False)
+        self.on_connect = None
+        self.on_message = None
+        self.queue = []
+        self._subscriptions = []
+        self._callbacks = {}
+        self._will = None
+        self._is_connected = False
+        self._clean_session = True
+        # bytes from the broker not read yet
+        self._incoming = bytearray()
+
+    def will_set(self, topic, msg, retain=False, qos=0) -> None:
+        """Message the broker publishes if the client vanishes"""
+        # pylint: disable=unused-argument
+        self._will = (topic, msg, retain)
+
+    def connect(self, clean_session=True, host=None, port=None, keep_alive=None):
+        """
+        Join the broker, reading its CONNACK the way MiniMQTT does: what
+        it returns and passes on_connect as the session present flag is
+        the CONNACK's length byte
+        """
+        # pylint: disable=unused-argument
+        if not BROKER.available:
+            raise MMQTTException("Connection refused")
+        if CONNECT_SECONDS:
+            time.sleep(CONNECT_SECONDS)
+        session = BROKER.sessions.pop(self.client_id, None)
+        self._clean_session = clean_session
+        if clean_session or session is None:
+            present = False
+        else:
+            subscriptions, queue = session
+            for pattern in subscriptions:
+                if pattern not in self._subscriptions:
+                    self._subscriptions.append(pattern)
+            self.queue = queue + self.queue
+            present = True
+        if self not in BROKER.clients:
+            BROKER.clients.append(self)
+        # after the packet type: remaining length, flags, return code
+        self._incoming = bytearray((0x02, present, 0x00))
+        connack = self._sock_exact_recv(3)
+        self._is_connected = True
+        result = connack[0] & 1
+        if self.on_connect is not None:
+            # pylint: disable-next=not-callable
+            self.on_connect(self, None, result, connack[2])
+        return result
+
+    def _sock_exact_recv(self, bufsize, timeout=None):
+        """The next bufsize bytes from the broker"""
+        # pylint: disable=unused-argument
+        data = self._incoming[:bufsize]
+        del self._incoming[:bufsize]
+        return data
+
+    def disconnect(self) -> None:
+        """Leave the broker cleanly"""
+        self._leave()
+
+    def deinit(self) -> None:
+        """Same as disconnect()"""
+        self._leave()
+
+    def drop(self) -> None:
+        """The connection died: the broker publishes the will"""
+        self._leave()
+        if self._will is not None:
+            topic, msg, retain = self._will
+            BROKER.publish(topic, msg, retain)
+
+    def _leave(self) -> None:
+        if self in BROKER.clients:
+            BROKER.clients.remove(self)
+            if not self._clean_session and self.client_id:
+                # undelivered messages stay with the session
+                BROKER.sessions[self.client_id] = (
+                    list(self._subscriptions),
+                    self.queue,
+                )
+                self.queue = []
+        self._is_connected = False
+
+    def is_connected(self) -> bool:
+        """Whether the client is connected"""
+        if not self._is_connected:
+            raise MMQTTException("not connected")
+        return True
+
+    def subscribed(self, topic) -> bool:
+        """Whether any subscription matches topic"""
+        for pattern in self._subscriptions:
+            if _matches(pattern, topic):
+                return True
+        return False
+
+    def subscribe(self, topic, qos=0) -> None:
+        """Receive messages published to topic"""
+        # pylint: disable=unused-argument
+        self._require_connection()
+        if topic not in self._subscriptions:
+            self._subscriptions.append(topic)
+        for retained_topic, payload in BROKER.retained.items():
+            if _matches(topic, retained_topic):
+                self.queue.append((retained_topic, payload))
+
+    def unsubscribe(self, topic) -> None:
+        """Stop receiving messages published to topic"""
+        self._require_connection()
+        if topic in self._subscriptions:
+            self._subscriptions.remove(topic)
+
+    def add_topic_callback(self, topic, method) -> None:
+        """Handle messages matching topic with method"""
+        self._callbacks[topic] = method
+
+    def remove_topic_callback(self, topic) -> None:
+        """Stop handling topic specially"""
+        self._callbacks.pop(topic, None)
+
+    def publish(self, topic, msg, retain=False, qos=0) -> None:
+        """Send msg to topic"""
+        # pylint: disable=unused-argument
+        self._require_connection()
+        BROKER.publish(topic, msg, retain, sender=self)
+
+    def loop(self, timeout=0):
+        """Deliver everything queued for this client"""
+        self._require_connection()
+        delivered = []
+        while self.queue:
+            topic, payload = self.queue.pop(0)
+            if self.use_binary_mode:
+                message = bytearray(
+                    payload if isinstance(payload, bytes) else payload.encode()
+                )
+            else:
+                message = payload
+            handled = False
+            for pattern, method in list(self._callbacks.items()):
+                if _matches(pattern, topic):
+                    method(self, topic, message)
+                    handled = True
+            if not handled and self.on_message is not None:
+                self.on_message(self, topic, message)  # pylint: disable=not-callable
+            delivered.append(topic)
+        if LOOP_BLOCKS:
+            time.sleep(timeout)
+        return delivered or None
+
+    def _require_connection(self) -> None:
+        if not self._is_connected:
+            raise MMQTTException("not connected")
@@ -0,0 +1,34 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``adafruit_ntp`` for the simulator: answers with the simulated time,
+after RESPONSE_SECONDS of round trip on the virtual clock.
+"""
+
+import time
+
+# how long a request blocks; 0 unless a test models a real network
+RESPONSE_SECONDS = 0.0
+
+
+class NTP:  # pylint: disable=too-few-public-methods
+    """An NTP client that's never wrong"""
+
+    # number of times any client asked for the time
+    requests = 0
+
+    def __init__(
+        self, socketpool, *, server="pool.ntp.org", tz_offset=0, socket_timeout=10
+    ):
+        # pylint: disable=unused-argument
+        self._tz_offset = tz_offset
+
+    @property
+    def datetime(self):
+        """Current time, offset by tz_offset hours"""
+        NTP.requests += 1
+        if RESPONSE_SECONDS:
+            time.sleep(RESPONSE_SECONDS)
+        return time.gmtime(int(time.time() + self._tz_offset * 3600))
@@ -0,0 +1,35 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Host ``bitmaptools`` for the simulator: the block copies frames use."""
+
+from array import array
+
+
+def arrayblit(
+    bitmap, data, x1=0, y1=0, x2=None, y2=None, skip_index=None
+):  # pylint: disable=too-many-arguments
+    """Copy values from data, row by row, into the rectangle x1,y1 to x2,y2"""
+    x2 = bitmap.width if x2 is None else x2
+    y2 = bitmap.height if y2 is None else y2
+    width = x2 - x1
+    pixels = bitmap._pixels  # pylint: disable=protected-access
+    for row in range(y2 - y1):
+        values = data[row * width : (row + 1) * width]
+        start = (y1 + row) * bitmap.width + x1
+        if skip_index is None:
+            pixels[start : start + width] = array(pixels.typecode, values)
+        else:
+            for column, value in enumerate(values):
+                if value != skip_index:
+                    pixels[start + column] = value
+
+
+def fill_region(bitmap, x1, y1, x2, y2, value):  # pylint: disable=too-many-arguments
+    """Set the rectangle x1,y1 to x2,y2 (exclusive) to value"""
+    pixels = bitmap._pixels  # pylint: disable=protected-access
+    run = array(pixels.typecode, [value]) * (x2 - x1)
+    for y in range(y1, y2):
+        start = y * bitmap.width + x1
+        pixels[start : start + len(run)] = run
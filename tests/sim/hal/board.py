@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``board`` for the simulator: a Matrix Portal S3 with no RTC attached.
+
+Every pin name resolves to a Pin, so code written for the real board
+finds the pins it expects.
+"""
+
+board_id = "simulator"  # pylint: disable=invalid-name
+
+
+class Pin:  # pylint: disable=too-few-public-methods
+    """A named pin"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def __repr__(self):
+        return f"board.{self.name}"
+
+
+class _I2C:
+    """An I2C bus with nothing on it"""
+
+    def try_lock(self) -> bool:  # pylint: disable=no-self-use
+        return True
+
+    def unlock(self) -> None:
+        pass
+
+    def scan(self) -> list:  # pylint: disable=no-self-use
+        return []
+
+
+def I2C():  # pylint: disable=invalid-name
+    """The board's I2C bus"""
+    return _I2C()
+
+
+def __getattr__(name):
+    if name.isupper():
+        pin = Pin(name)
+        globals()[name] = pin
+        return pin
+    raise AttributeError(name)
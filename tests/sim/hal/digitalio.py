@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``digitalio`` for the simulator.
+
+Input levels come from PINS, which the simulator sets to press buttons.
+"""
+
+# pin name -> level; pins not listed read as pulled up
+PINS = {}
+
+
+class Direction:  # pylint: disable=too-few-public-methods
+    """Pin directions"""
+
+    INPUT = "INPUT"
+    OUTPUT = "OUTPUT"
+
+
+class Pull:  # pylint: disable=too-few-public-methods
+    """Pull resistors"""
+
+    UP = "UP"
+    DOWN = "DOWN"
+
+
+class DigitalInOut:
+    """A digital pin"""
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.direction = Direction.INPUT
+        self.pull = None
+        self._value = False
+
+    @property
+    def value(self) -> bool:
+        """The level on the pin"""
+        if self.direction == Direction.OUTPUT:
+            return self._value
+        return PINS.get(self.pin.name, self.pull == Pull.UP)
+
+    @value.setter
+    def value(self, value) -> None:
+        self._value = bool(value)
+
+    def deinit(self) -> None:
+        """Nothing to release on the host"""
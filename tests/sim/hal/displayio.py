@@ -0,0 +1,309 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``displayio`` for the simulator: real pixel storage and compositing.
+
+Covers the parts of the API the sign uses: ``Bitmap``, ``Palette``,
+``ColorConverter``, ``TileGrid`` (tiles, flips, transparency) and ``Group``
+(nesting, ``x``/``y`` offsets, integer ``scale``, ``hidden``). A layer can
+only be in one group at a time, as on the device.
+"""
+
+from array import array
+
+
+class Colorspace:  # pylint: disable=too-few-public-methods
+    """Colorspaces understood by ColorConverter"""
+
+    RGB888 = "RGB888"
+    RGB565 = "RGB565"
+
+
+def release_displays():
+    """Nothing to release on the host"""
+
+
+def _rgb888(color) -> int:
+    if isinstance(color, int):
+        return color & 0xFFFFFF
+    red, green, blue = tuple(color)[:3]
+    return (red << 16) | (green << 8) | blue
+
+
+class Bitmap:
+    """A width x height grid of values below value_count"""
+
+    def __init__(self, width, height, value_count):
+        if value_count < 1 or value_count > 65536:
+            raise ValueError("value_count must be 1-65536")
+        self.width = width
+        self.height = height
+        self._value_count = value_count
+        typecode = "B" if value_count <= 256 else "H"
+        self._pixels = array(typecode, [0]) * (width * height)
+
+    def _index(self, position) -> int:
+        if isinstance(position, tuple):
+            x, y = position
+            if not (0 <= x < self.width and 0 <= y < self.height):
+                raise IndexError("pixel out of bounds")
+            return y * self.width + x
+        if not 0 <= position < self.width * self.height:
+            raise IndexError("pixel out of bounds")
+        return position
+
+    def __getitem__(self, position) -> int:
+        return self._pixels[self._index(position)]
+
+    def __setitem__(self, position, value) -> None:
+        if not 0 <= value < self._value_count:
+            raise ValueError(f"value {value} out of range")
+        self._pixels[self._index(position)] = value
+
+    def fill(self, value) -> None:
+        """Set every pixel to value"""
+        pixels = self._pixels
+        for index, _ in enumerate(pixels):
+            pixels[index] = value
+
+
+class Palette:
+    """Maps bitmap values to colors; entries may be transparent"""
+
+    def __init__(self, color_count, *, dither=False):
+        self._colors = [0] * color_count
+        self._transparent = [False] * color_count
+        self.dither = dither
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def __setitem__(self, index, color) -> None:
+        self._colors[index] = _rgb888(color)
+
+    def __getitem__(self, index) -> int:
+        return self._colors[index]
+
+    def make_transparent(self, index) -> None:
+        """Don't draw pixels with this value"""
+        self._transparent[index] = True
+
+    def make_opaque(self, index) -> None:
+        """Draw pixels with this value again"""
+        self._transparent[index] = False
+
+    def is_transparent(self, index) -> bool:
+        """True if index is transparent"""
+        return self._transparent[index]
+
+    def shade(self, value):
+        """0xRRGGBB for value, or None if it's transparent"""
+        if self._transparent[value]:
+            return None
+        return self._colors[value]
+
+
+class ColorConverter:
+    """Turns bitmap values that are colors into RGB888"""
+
+    def __init__(self, *, input_colorspace=Colorspace.RGB888, dither=False):
+        self._colorspace = input_colorspace
+        self._transparent = None
+        self.dither = dither
+
+    def convert(self, color) -> int:
+        """color in the input colorspace as RGB888"""
+        if self._colorspace == Colorspace.RGB565:
+            red = (color >> 11) & 0x1F
+            green = (color >> 5) & 0x3F
+            blue = color & 0x1F
+            return (
+                ((red << 3) | (red >> 2)) << 16
+                | ((green << 2) | (green >> 4)) << 8
+                | ((blue << 3) | (blue >> 2))
+            )
+        return color & 0xFFFFFF
+
+    def make_transparent(self, color) -> None:
+        """Don't draw pixels of this color"""
+        self._transparent = color
+
+    def make_opaque(self, color) -> None:  # pylint: disable=unused-argument
+        """Draw every color again"""
+        self._transparent = None
+
+    def shade(self, value):
+        """0xRRGGBB for value, or None if it's transparent"""
+        if value == self._transparent:
+            return None
+        return self.convert(value)
+
+
+class _Layer:  # pylint: disable=too-few-public-methods
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+        self.hidden = False
+        self._parent = None
+
+
+class TileGrid(_Layer):  # pylint: disable=too-many-instance-attributes
+    """A grid of tiles cut from a bitmap"""
+
+    def __init__(
+        self,
+        bitmap,
+        *,
+        pixel_shader,
+        width=1,
+        height=1,
+        tile_width=None,
+        tile_height=None,
+        default_tile=0,
+        x=0,
+        y=0,
+    ):  # pylint: disable=too-many-arguments
+        super().__init__(x, y)
+        self.bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self.width = width
+        self.height = height
+        self.tile_width = tile_width or bitmap.width
+        self.tile_height = tile_height or bitmap.height
+        self.flip_x = False
+        self.flip_y = False
+        self.transpose_xy = False
+        self._tiles = [default_tile] * (width * height)
+
+    def _tile_index(self, position) -> int:
+        if isinstance(position, tuple):
+            x, y = position
+            return y * self.width + x
+        return position
+
+    def __getitem__(self, position) -> int:
+        return self._tiles[self._tile_index(position)]
+
+    def __setitem__(self, position, tile) -> None:
+        self._tiles[self._tile_index(position)] = tile
+
+    def draw(self, surface, origin_x, origin_y, scale) -> None:
+        """Paint onto surface with the grid's top left at origin, scaled"""
+        if self.hidden:
+            return
+
+        tiles_across = max(1, self.bitmap.width // self.tile_width)
+        left = origin_x + self.x * scale
+        top = origin_y + self.y * scale
+        for tile_y in range(self.height):
+            for tile_x in range(self.width):
+                tile = self._tiles[tile_y * self.width + tile_x]
+                source = (
+                    (tile % tiles_across) * self.tile_width,
+                    (tile // tiles_across) * self.tile_height,
+                )
+                destination = (
+                    left + tile_x * self.tile_width * scale,
+                    top + tile_y * self.tile_height * scale,
+                )
+                self._draw_tile(surface, source, destination, scale)
+
+    def _draw_tile(self, surface, source, destination, scale) -> None:
+        """Paint the tile at source in the bitmap with its top left at destination"""
+        bitmap = self.bitmap
+        shade = self.pixel_shader.shade
+        for pixel_y in range(self.tile_height):
+            for pixel_x in range(self.tile_width):
+                column, row = self._flipped(pixel_x, pixel_y)
+                color = shade(bitmap[source[0] + column, source[1] + row])
+                if color is None:
+                    continue
+                surface.fill_rect(
+                    destination[0] + pixel_x * scale,
+                    destination[1] + pixel_y * scale,
+                    scale,
+                    color,
+                )
+
+    def _flipped(self, column, row) -> tuple:
+        """Where in its tile the pixel shown at (column, row) comes from"""
+        if self.transpose_xy:
+            column, row = row, column
+        if self.flip_x:
+            column = self.tile_width - 1 - column
+        if self.flip_y:
+            row = self.tile_height - 1 - row
+        return column, row
+
+
+class Group(_Layer):
+    """An ordered collection of layers drawn back to front"""
+
+    def __init__(self, *, scale=1, x=0, y=0):
+        super().__init__(x, y)
+        if scale < 1:
+            raise ValueError("scale must be >= 1")
+        self.scale = scale
+        self._layers = []
+
+    def _adopt(self, layer) -> None:
+        if layer._parent is not None:  # pylint: disable=protected-access
+            raise ValueError("Layer already in a group")
+        layer._parent = self  # pylint: disable=protected-access
+
+    def append(self, layer) -> None:
+        """Add layer on top"""
+        self._adopt(layer)
+        self._layers.append(layer)
+
+    def insert(self, index, layer) -> None:
+        """Add layer at index"""
+        self._adopt(layer)
+        self._layers.insert(index, layer)
+
+    def remove(self, layer) -> None:
+        """Take layer out of the group"""
+        self._layers.remove(layer)
+        layer._parent = None  # pylint: disable=protected-access
+
+    def pop(self, index=-1):
+        """Take out and return the layer at index"""
+        layer = self._layers.pop(index)
+        layer._parent = None  # pylint: disable=protected-access
+        return layer
+
+    def index(self, layer) -> int:
+        """Position of layer"""
+        return self._layers.index(layer)
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def __getitem__(self, index):
+        return self._layers[index]
+
+    def __setitem__(self, index, layer) -> None:
+        self._adopt(layer)
+        self._layers[index]._parent = None  # pylint: disable=protected-access
+        self._layers[index] = layer
+
+    def __delitem__(self, index) -> None:
+        self.pop(index)
+
+    def __contains__(self, layer) -> bool:
+        return layer in self._layers
+
+    def __iter__(self):
+        return iter(self._layers)
+
+    def draw(self, surface, origin_x, origin_y, scale) -> None:
+        """Paint every visible layer onto surface"""
+        if self.hidden:
+            return
+        left = origin_x + self.x * scale
+        top = origin_y + self.y * scale
+        inner = scale * self.scale
+        for layer in self._layers:
+            layer.draw(surface, left, top, inner)
@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``framebufferio`` for the simulator.
+
+The display keeps the group it's showing and composites it into pixels
+only when a frame is captured, so running the sign costs nothing extra
+between captures.
+"""
+
+
+class Frame:
+    """One captured frame: width x height RGB888 pixels, row major"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.pixels = bytearray(width * height * 3)
+
+    def fill_rect(self, x, y, size, color) -> None:
+        """Paint a size x size square of color, clipped to the frame"""
+        red = (color >> 16) & 0xFF
+        green = (color >> 8) & 0xFF
+        blue = color & 0xFF
+        for row in range(max(0, y), min(self.height, y + size)):
+            offset = (row * self.width + max(0, x)) * 3
+            for _ in range(max(0, x), min(self.width, x + size)):
+                self.pixels[offset] = red
+                self.pixels[offset + 1] = green
+                self.pixels[offset + 2] = blue
+                offset += 3
+
+    def __getitem__(self, position) -> int:
+        """0xRRGGBB at (x, y)"""
+        x, y = position
+        offset = (y * self.width + x) * 3
+        pixels = self.pixels
+        return (pixels[offset] << 16) | (pixels[offset + 1] << 8) | pixels[offset + 2]
+
+    def to_list(self) -> list:
+        """Rows of 0xRRGGBB values"""
+        return [[self[x, y] for x in range(self.width)] for y in range(self.height)]
+
+    def lit(self) -> int:
+        """Number of pixels that aren't black"""
+        count = 0
+        for index in range(0, len(self.pixels), 3):
+            if self.pixels[index] or self.pixels[index + 1] or self.pixels[index + 2]:
+                count += 1
+        return count
+
+    def quantize(self, bit_depth) -> None:
+        """Reduce each channel to bit_depth bits, as the matrix shows it"""
+        shift = 8 - bit_depth
+        levels = (1 << bit_depth) - 1
+        for index, value in enumerate(self.pixels):
+            self.pixels[index] = (value >> shift) * 255 // levels
+
+
+class FramebufferDisplay:
+    """Shows root_group on a framebuffer such as an RGBMatrix"""
+
+    def __init__(self, framebuffer, *, rotation=0, auto_refresh=True):
+        if rotation not in (0, 90, 180, 270):
+            raise ValueError("rotation must be 0, 90, 180 or 270")
+        self.framebuffer = framebuffer
+        self.rotation = rotation
+        self.auto_refresh = auto_refresh
+        self.brightness = 1.0
+        self._root_group = None
+        self.refreshes = 0
+
+    @property
+    def width(self) -> int:
+        """Width after rotation"""
+        if self.rotation in (90, 270):
+            return self.framebuffer.height
+        return self.framebuffer.width
+
+    @property
+    def height(self) -> int:
+        """Height after rotation"""
+        if self.rotation in (90, 270):
+            return self.framebuffer.width
+        return self.framebuffer.height
+
+    @property
+    def root_group(self):
+        """The group being shown, or None"""
+        return self._root_group
+
+    @root_group.setter
+    def root_group(self, group) -> None:
+        if (
+            group is not None and group._parent is not None
+        ):  # pylint: disable=protected-access
+            raise ValueError("Group already used")
+        self._root_group = group
+
+    def refresh(self, *, target_frames_per_second=None, minimum_frames_per_second=0):
+        """Count the refresh; frames are composited by capture()"""
+        # pylint: disable=unused-argument
+        self.refreshes += 1
+        return True
+
+    def capture(self) -> Frame:
+        """Composite root_group as the panel would show it right now"""
+        frame = Frame(self.width, self.height)
+        if self._root_group is not None:
+            self._root_group.draw(frame, 0, 0, 1)
+        bit_depth = getattr(self.framebuffer, "bit_depth", 8)
+        if bit_depth < 8:
+            frame.quantize(bit_depth)
+        return frame
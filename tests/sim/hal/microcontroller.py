@@ -0,0 +1,22 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Host ``microcontroller`` for the simulator: a reset stops the run."""
+
+
+class ResetRequested(Exception):
+    """The sign asked to reset the microcontroller"""
+
+
+class _Processor:  # pylint: disable=too-few-public-methods
+    temperature = 40.0
+    frequency = 240_000_000
+
+
+cpu = _Processor()
+
+
+def reset():
+    """Stop the simulation"""
+    raise ResetRequested()
@@ -0,0 +1,43 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``pwmio`` for the simulator.
+
+Every change of duty cycle is logged with the (simulated) time so tones
+can be checked after a run.
+"""
+
+import time
+
+# (time.monotonic(), frequency, duty_cycle) for every change of any output
+LOG = []
+
+
+class PWMOut:
+    """A PWM output"""
+
+    def __init__(self, pin, *, duty_cycle=0, frequency=500, variable_frequency=False):
+        self.pin = pin
+        self.frequency = frequency
+        self.variable_frequency = variable_frequency
+        self._duty_cycle = duty_cycle
+
+    @property
+    def duty_cycle(self) -> int:
+        """16 bit duty cycle"""
+        return self._duty_cycle
+
+    @duty_cycle.setter
+    def duty_cycle(self, duty_cycle) -> None:
+        self._duty_cycle = duty_cycle
+        LOG.append((time.monotonic(), self.frequency, duty_cycle))
+
+    def deinit(self) -> None:
+        """Nothing to release on the host"""
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget the log"""
+        LOG.clear()
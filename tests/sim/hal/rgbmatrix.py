@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``rgbmatrix`` for the simulator.
+
+Pins, tiling and serpentine wiring only matter to the physical panel; the
+simulated matrix keeps the geometry and color depth, which is what shows.
+"""
+
+
+class RGBMatrix:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """A HUB75 matrix of width x height pixels at bit_depth bits per channel"""
+
+    def __init__(
+        self,
+        *,
+        width,
+        height=0,
+        bit_depth,
+        rgb_pins=(),
+        addr_pins=(),
+        clock_pin=None,
+        latch_pin=None,
+        output_enable_pin=None,
+        doublebuffer=True,
+        framebuffer=None,
+        tile=1,
+        serpentine=True,
+    ):  # pylint: disable=too-many-arguments,unused-argument
+        if not 1 <= bit_depth <= 6:
+            raise ValueError("bit_depth must be 1-6")
+        self.width = width
+        self.height = height or 2 ** len(addr_pins) * 2
+        self.bit_depth = bit_depth
+        self.tile = tile
+        self.serpentine = serpentine
+        self.brightness = 1.0
+
+    def deinit(self) -> None:
+        """Nothing to release on the host"""
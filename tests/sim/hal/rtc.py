@@ -0,0 +1,32 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``rtc`` for the simulator: setting the time sets the simulated clock.
+"""
+
+import calendar
+import time
+
+# the simulator's VirtualClock, installed before the sign starts
+CLOCK = None
+
+
+class RTC:  # pylint: disable=too-few-public-methods
+    """The microcontroller's clock"""
+
+    calibration = 0
+
+    @property
+    def datetime(self):
+        """UTC as a struct_time"""
+        return time.gmtime(int(time.time()))
+
+    @datetime.setter
+    def datetime(self, value) -> None:
+        CLOCK.set_time(calendar.timegm(tuple(value)))
+
+
+def set_time_source(source):  # pylint: disable=unused-argument
+    """The simulated clock is the only time source"""
@@ -0,0 +1,12 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Host ``socketpool`` for the simulator; nothing opens real sockets."""
+
+
+class SocketPool:  # pylint: disable=too-few-public-methods
+    """Sockets for a radio"""
+
+    def __init__(self, radio):
+        self.radio = radio
@@ -0,0 +1,23 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``storage``; the filesystem is always writable.
+
+Remounts are noted in remount_calls for tests to check.
+"""
+
+# (path, readonly) for every remount()
+remount_calls = []
+
+
+def remount(path, readonly=False, *, disable_concurrent_write_protection=False):
+    """Nothing to remount on the host; just noted in remount_calls"""
+    # pylint: disable=unused-argument
+    remount_calls.append((path, readonly))
+
+
+def reset():
+    """Forget the remounts so far"""
+    remount_calls.clear()
@@ -2,12 +2,22 @@
 #
 # SPDX-License-Identifier: MIT
 
-"""Minimal ``supervisor`` stub for host-side unit tests."""
+"""Host ``supervisor`` for the simulator; settings come from the environment."""
 
 import os
+import time
+
+
+class _Runtime:  # pylint: disable=too-few-public-methods
+    autoreload = False
+    serial_connected = True
+
+
+runtime = _Runtime()
 
 
 def get_setting(key, default):
+    """Typed settings.toml value, as in CircuitPython 10.2+"""
     value = os.getenv(key)
     if value is None:
         return default
@@ -19,3 +29,8 @@ def get_setting(key, default):
         except ValueError:
             return default
     return value
+
+
+def ticks_ms():
+    """Milliseconds since boot, wrapping at 2**29"""
+    return int(time.monotonic() * 1000) & ((1 << 29) - 1)
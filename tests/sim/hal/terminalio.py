@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``terminalio`` for the simulator.
+
+CircuitPython's built in font isn't available as a file, so FONT draws the
+glyphs of the small font bundled with the sign in terminalio's 6x12
+character cell. Text takes the same room as on the device, even though
+the letters look a little different.
+"""
+
+from pathlib import Path
+
+from adafruit_bitmap_font.bitmap_font import BDF
+
+_FONT_PATH = (
+    Path(__file__).resolve().parents[3]
+    / "give_me_a_sign"
+    / "assets"
+    / "fonts"
+    / "intelone-mono-font-family-regular-6.bdf"
+)
+
+
+class _TerminalFont(BDF):
+    """A BDF font reporting terminalio's fixed metrics"""
+
+    WIDTH = 6
+    HEIGHT = 12
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.ascent = 9
+        self.descent = 3
+
+    def get_bounding_box(self) -> tuple:
+        return (_TerminalFont.WIDTH, _TerminalFont.HEIGHT, 0, -self.descent)
+
+    def get_glyph(self, code_point):
+        glyph = super().get_glyph(code_point)
+        if glyph is not None:
+            glyph.shift_x = _TerminalFont.WIDTH
+        return glyph
+
+
+FONT = _TerminalFont(str(_FONT_PATH))
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Host ``wifi`` for the simulator: an always-available access point.
+
+Set radio.connected to False to simulate losing it, and CONNECT_SECONDS
+to make joining take that long on the virtual clock.
+"""
+
+import time
+
+# how long radio.connect() blocks; 0 unless a test models a real network
+CONNECT_SECONDS = 0.0
+
+
+class _Network:  # pylint: disable=too-few-public-methods
+    ssid = "simulator"
+    bssid = b"\x02\x00\x00\x00\x00\x01"
+    rssi = -50
+    channel = 6
+
+
+class _Radio:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.connected = True
+        self.enabled = True
+        self.ipv4_address = "192.168.4.20"
+        self.mac_address = b"\x02\x00\x00\x5a\x5a\x01"
+        self.ap_info = _Network()
+        self.hostname = "give-me-a-sign"
+
+    def connect(self, ssid, password=None, *, timeout=None):
+        """Joining always works, unless the test took the network away"""
+        # pylint: disable=unused-argument
+        if not self.enabled:
+            raise ConnectionError("No network with that ssid")
+        if CONNECT_SECONDS:
+            time.sleep(CONNECT_SECONDS)
+        self.connected = True
+
+
+radio = _Radio()
@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Display latency of the superloop and the asyncio runtime, side by side.
+
+    python -m tests.sim.latency --seconds 60
+
+Boots the sign once per runtime, each in its own interpreter, and runs it
+for the same simulated time with a message every few seconds: the loop
+at the bottom of examples/code.py, then AsyncRunner. MiniMQTT's loop()
+waits out its timeout as it does reading a quiet socket, and the virtual
+clock is charged for the host time the sign's own code takes, times
+--cpu-scale for a microcontroller being that much slower than the host
+(0 to leave only the waits). Reports render_latency, the gap between
+display updates, for each: p50/p99/max in milliseconds.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import subprocess
+import sys
+
+from .simulator import Simulator
+
+RUNTIMES = ("superloop", "asyncio")
+
+# roughly how much slower CircuitPython on an ESP32-S3 runs the sign's
+# code than CPython on a desktop; a guess, good enough to rank runtimes
+CPU_SCALE = 30
+
+MESSAGE_INTERVAL = 5
+
+# simulated seconds of the superloop a pass costs at least, so it can't
+# spin without time passing when nothing is charged
+PASS_SECONDS = 0.001
+
+
+def latency(runtime, seconds, cpu_scale=CPU_SCALE) -> dict:
+    """Run the sign with runtime for seconds and summarize its render latency"""
+    sim = Simulator()
+    sim.install()
+
+    # pylint: disable=import-outside-toplevel
+    from adafruit_minimqtt import adafruit_minimqtt
+
+    sim.boot()
+    adafruit_minimqtt.LOOP_BLOCKS = True
+    prefix = sim.settings["MQTT_TOPIC_PREFIX"]
+    for when in range(0, int(seconds), MESSAGE_INTERVAL):
+        sim.broker.publish(
+            f"{prefix}/all/module/message",
+            json.dumps({"text": f"at {when}", "duration": 2}),
+        )
+
+    app = sim.app
+    app.render_latency.reset()
+    # the first gap would include the boot
+    app.render()
+    sim.clock.charge_cpu(cpu_scale)
+    try:
+        if runtime == "asyncio":
+            sim.run_async(seconds)
+        else:
+            end = sim.clock.monotonic() + seconds
+            while sim.clock.monotonic() < end:
+                sim.step(PASS_SECONDS)
+    finally:
+        sim.clock.charge_cpu(0)
+    return app.render_latency.summary()
+
+
+def compare(seconds, cpu_scale=CPU_SCALE) -> dict:
+    """latency() of every runtime, each in a fresh interpreter"""
+    report = {}
+    for runtime in RUNTIMES:
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "tests.sim.latency",
+                "--runtime",
+                runtime,
+                "--seconds",
+                str(seconds),
+                "--cpu-scale",
+                str(cpu_scale),
+            ],
+            capture_output=True,
+            text=True,
+            timeout=600,
+            check=True,
+        )
+        report[runtime] = json.loads(result.stdout.strip().splitlines()[-1])
+    return report
+
+
+def main(argv=None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.sim.latency", description=__doc__
+    )
+    parser.add_argument("--seconds", type=float, default=60)
+    parser.add_argument("--cpu-scale", type=float, default=CPU_SCALE)
+    parser.add_argument(
+        "--runtime", choices=RUNTIMES, help="measure just this one, in this process"
+    )
+    parser.add_argument("--verbose", action="store_true", help="show the sign's output")
+    args = parser.parse_args(argv)
+    if args.runtime is None:
+        report = compare(args.seconds, args.cpu_scale)
+    elif args.verbose:
+        report = latency(args.runtime, args.seconds, args.cpu_scale)
+    else:
+        with open(os.devnull, "w", encoding="utf-8") as null:
+            with contextlib.redirect_stdout(null):
+                report = latency(args.runtime, args.seconds, args.cpu_scale)
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Minimal PNG writer for simulator frames; stdlib only."""
+
+import struct
+import zlib
+
+
+def _chunk(kind, data) -> bytes:
+    body = kind + data
+    return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body))
+
+
+def encode(width, height, pixels, scale=1) -> bytes:
+    """
+    PNG of width x height RGB888 pixels (row major bytes), each pixel
+    blown up to a scale x scale square
+    """
+    rows = []
+    stride = width * 3
+    for y in range(height):
+        row = pixels[y * stride : (y + 1) * stride]
+        if scale > 1:
+            row = b"".join(row[x : x + 3] * scale for x in range(0, stride, 3))
+        rows.extend([b"\x00" + bytes(row)] * scale)
+
+    header = struct.pack(">IIBBBBB", width * scale, height * scale, 8, 2, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _chunk(b"IHDR", header)
+        + _chunk(b"IDAT", zlib.compress(b"".join(rows), 9))
+        + _chunk(b"IEND", b"")
+    )
+
+
+def save(path, frame, scale=1) -> None:
+    """Write a captured frame to path as a PNG"""
+    with open(path, "wb") as file:
+        file.write(encode(frame.width, frame.height, frame.pixels, scale))
@@ -0,0 +1,312 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Headless host simulator for Give Me A Sign.
+
+Runs the unmodified ``GiveMeASign.start()``/``loop()`` on Linux against
+the host implementations of the CircuitPython modules in ``hal/``: a
+framebuffer that composites real pixels, a virtual clock, an in-process
+MQTT broker, and WiFi, NTP and buttons that always behave.
+
+.. code-block:: python
+
+   from tests.sim import Simulator
+
+   sim = Simulator(width=64, height=32)
+   sim.boot()
+   sim.publish("givemeasign/all/module/message", '{"text": "hi"}')
+   sim.run(5)           # the superloop, as examples/code.py
+   sim.run_async(5)     # or the asyncio runtime
+   sim.frame().save_png("frame.png", scale=8)
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .clock import DEFAULT_EPOCH, VirtualClock, VirtualEventLoop
+from . import png
+
+HAL_DIR = Path(__file__).resolve().parent / "hal"
+REPO_DIR = Path(__file__).resolve().parents[2]
+
+# seconds of simulated time per loop pass; the real loop spins far
+# faster, but nothing in the sign changes at a finer grain than this
+STEP = 0.05
+
+# most simulated seconds boot() waits for the sign to connect to MQTT
+SETTLE = 30
+
+# heap size reported through gc.mem_free(), about a Matrix Portal S3's
+HEAP_SIZE = 2 * 1024 * 1024
+
+# the host's own gc.collect(), for when a full collection is wanted
+FULL_COLLECT = gc.collect
+
+DEFAULT_SETTINGS = {
+    "wifi_ssid": "simulator",
+    "wifi_password": "simulator",
+    "MQTT_BROKER": "simulator",
+    "MQTT_CLIENTID": "give-me-a-sign-sim",
+    "MQTT_TOPIC_PREFIX": "givemeasign",
+}
+
+
+class _Implementation(tuple):
+    """sys.implementation that CircuitPython code can index like a tuple"""
+
+    def __new__(cls, original, version):
+        implementation = super().__new__(cls, ("circuitpython", version, 0))
+        implementation._original = original
+        return implementation
+
+    def __getattr__(self, name):
+        return getattr(self._original, name)
+
+
+class SimFrame:
+    """A captured frame with ways to save it"""
+
+    def __init__(self, frame):
+        self.width = frame.width
+        self.height = frame.height
+        self.pixels = frame.pixels
+        self._frame = frame
+
+    def __getitem__(self, position) -> int:
+        """0xRRGGBB at (x, y)"""
+        return self._frame[position]
+
+    def lit(self) -> int:
+        """Number of pixels that aren't black"""
+        return self._frame.lit()
+
+    def to_list(self) -> list:
+        """Rows of 0xRRGGBB values"""
+        return self._frame.to_list()
+
+    def save_png(self, path, scale=1) -> None:
+        """Write the frame as a PNG, each pixel scale x scale"""
+        png.save(path, self._frame, scale)
+
+    def save_raw(self, path) -> None:
+        """Write the frame as raw RGB888 bytes, row major"""
+        with open(path, "wb") as file:
+            file.write(bytes(self.pixels))
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, SimFrame) and self.pixels == other.pixels
+
+
+class Simulator:  # pylint: disable=too-many-instance-attributes
+    """
+    Boots the sign on a simulated Matrix Portal S3 and drives its loop
+
+    Everything the simulator replaces is process-wide (sys.path, the time
+    module, gc, sys.implementation), so run one Simulator per process and
+    keep it out of the pytest process.
+    """
+
+    def __init__(
+        self,
+        width=64,
+        height=32,
+        bit_depth=2,
+        start=DEFAULT_EPOCH,
+        settings=None,
+        workdir=None,
+        track_memory=False,
+    ):  # pylint: disable=too-many-arguments
+        """
+        :param width: matrix width in pixels, a multiple of 64
+        :param height: matrix height in pixels
+        :param bit_depth: bits per color channel, as MATRIX_BIT_DEPTH
+        :param start: UTC epoch the wall clock starts at
+        :param settings: settings.toml values added to DEFAULT_SETTINGS
+        :param workdir: where data.json and transfers go; a temporary
+            directory by default
+        :param track_memory: report real allocations through gc.mem_alloc()
+            using tracemalloc, at a large cost in speed
+        """
+        self.width = width
+        self.height = height
+        self.bit_depth = bit_depth
+        self.clock = VirtualClock(start)
+        self.settings = dict(DEFAULT_SETTINGS)
+        self.settings.update(settings or {})
+        self._workdir = workdir
+        self._tempdir = None
+        self._track_memory = track_memory
+        self._installed = False
+        self.display = None
+        self.app = None
+        self.passes = 0
+
+    def install(self) -> None:
+        """Put the host modules and virtual clock in place"""
+        if self._installed:
+            return
+        self._installed = True
+
+        for path in (str(REPO_DIR), str(HAL_DIR)):
+            if path in sys.path:
+                sys.path.remove(path)
+            sys.path.insert(0, path)
+
+        os.environ["TZ"] = "UTC"
+        time.tzset()
+        for key, value in self.settings.items():
+            os.environ[key] = str(value)
+        # the sign reads the virtual clock through timesource; the host
+        # libraries in hal/ (debouncer, scrolling label, NTP) read the time
+        # module as the real ones do, so it's patched to match
+        self.clock.install()
+
+        if self._track_memory:
+            import tracemalloc  # pylint: disable=import-outside-toplevel
+
+            tracemalloc.start()
+
+            def traced():
+                return tracemalloc.get_traced_memory()[0]
+
+            baseline = traced()
+            gc.mem_alloc = lambda: traced() - baseline
+        else:
+            gc.mem_alloc = lambda: HEAP_SIZE // 8
+        gc.mem_free = lambda: max(0, HEAP_SIZE - gc.mem_alloc())
+        # the sign's collections are about a microcontroller heap; sweeping
+        # the whole host heap (simulator included) each time would cost far
+        # more than it tells, so the sign gets a youngest-generation pass
+        gc.collect = lambda generation=0: FULL_COLLECT(generation)
+
+        if not isinstance(sys.implementation, _Implementation):
+            sys.implementation = _Implementation(sys.implementation, (10, 0, 0))
+
+        # pylint: disable=import-outside-toplevel
+        import rtc
+        from give_me_a_sign import timesource
+        from give_me_a_sign.data import Data
+        from give_me_a_sign.transfer import Transfer
+
+        timesource.use(self.clock)
+        rtc.CLOCK = self.clock
+        if self._workdir is None:
+            # pylint: disable-next=consider-using-with
+            self._tempdir = tempfile.TemporaryDirectory()
+            self._workdir = self._tempdir.name
+        Data.SAVE_FILE = os.path.join(self._workdir, "data.json")
+        Transfer.DIRECTORY = os.path.join(self._workdir, "transfers")
+
+    def boot(self, settle=SETTLE):
+        """
+        Build the display as examples/code.py does and start the sign
+
+        :param settle: most simulated seconds to run the loop afterwards
+            while the sign brings up the network, so a scenario starts with
+            MQTT connected; 0 to return as soon as start() does
+        """
+        self.install()
+        # pylint: disable=import-outside-toplevel
+        import board
+        import displayio
+        import framebufferio
+        import rgbmatrix
+        from give_me_a_sign.sign import GiveMeASign
+
+        displayio.release_displays()
+        matrix = rgbmatrix.RGBMatrix(
+            width=self.width,
+            height=self.height,
+            bit_depth=self.bit_depth,
+            rgb_pins=[board.MTX_R1, board.MTX_G1, board.MTX_B1],
+            addr_pins=[board.MTX_ADDRA, board.MTX_ADDRB, board.MTX_ADDRC],
+            clock_pin=board.MTX_CLK,
+            latch_pin=board.MTX_LAT,
+            output_enable_pin=board.MTX_OE,
+        )
+        self.display = framebufferio.FramebufferDisplay(matrix, rotation=0)
+        self.app = GiveMeASign(self.display)
+        self.app.start()
+
+        deadline = self.clock.monotonic() + settle
+        while (
+            not self.app.platform.mqtt_is_connected
+            and self.clock.monotonic() < deadline
+        ):
+            self.step()
+        return self.app
+
+    @property
+    def broker(self):
+        """The in-process MQTT broker"""
+        from adafruit_minimqtt.adafruit_minimqtt import (  # pylint: disable=import-outside-toplevel
+            BROKER,
+        )
+
+        return BROKER
+
+    def step(self, seconds=STEP) -> None:
+        """Advance simulated time by seconds and run one loop pass"""
+        self.clock.advance(seconds)
+        self.app.loop()
+        self.passes += 1
+
+    def run(self, seconds, step=STEP, capture_every=None, on_frame=None) -> None:
+        """
+        Run the loop for seconds of simulated time
+
+        :param capture_every: seconds between frames passed to on_frame
+        :param on_frame: called with (simulated seconds into the run, SimFrame)
+        """
+        elapsed = 0.0
+        next_capture = 0.0
+        while elapsed < seconds:
+            self.step(step)
+            elapsed += step
+            if capture_every and on_frame and elapsed >= next_capture:
+                on_frame(elapsed, self.frame())
+                next_capture += capture_every
+
+    def run_async(self, seconds) -> None:
+        """
+        Run the sign as AsyncRunner's tasks, as examples/code.py does with
+        ASYNC_RUNTIME, for seconds of simulated time
+        """
+        # pylint: disable=import-outside-toplevel
+        from give_me_a_sign.asyncio_runtime import AsyncRunner
+
+        loop = VirtualEventLoop(self.clock)
+        try:
+            loop.run_for(seconds, AsyncRunner(self.app).main())
+        finally:
+            loop.close()
+
+    def publish(self, topic, payload, retain=False) -> None:
+        """Publish to the broker as another client would"""
+        self.broker.publish(topic, payload, retain)
+
+    def published(self, topic_filter="#") -> list:
+        """(topic, payload) for everything published so far matching topic_filter"""
+        return self.broker.published(topic_filter)
+
+    def press(self, button, seconds=0.1) -> None:
+        """Hold BUTTON_UP (1) or BUTTON_DOWN (2) for seconds, running the loop"""
+        import digitalio  # pylint: disable=import-outside-toplevel
+
+        pin = "BUTTON_UP" if button == 1 else "BUTTON_DOWN"
+        digitalio.PINS[pin] = False
+        try:
+            self.run(seconds)
+        finally:
+            del digitalio.PINS[pin]
+        self.step()
+
+    def frame(self) -> SimFrame:
+        """What the matrix shows right now"""
+        return SimFrame(self.display.capture())
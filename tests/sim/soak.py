@@ -0,0 +1,189 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+Fast-forward soak test: a week of sign time in well under a minute.
+
+    python -m tests.sim.soak --days 7
+
+The sign runs on the virtual clock from just before a US daylight saving
+transition, with a Pacific timezone table, daily solar data and a
+message every few hours, and Home Assistant restarts once a day. Along
+the way the soak counts NTP syncs, Home Assistant discovery publishes
+and diagnostics, notes every timezone offset
+change the clock picks up, samples the heap each simulated hour and times
+every loop pass in real time.
+
+The heap is sampled as sys.getallocatedblocks() after a full collection,
+the same leak signal CPython's own refleak hunting uses; tracemalloc would
+give bytes but slows the run tenfold.
+"""
+
+import argparse
+import calendar
+import contextlib
+import json
+import os
+import sys
+import time
+
+from .simulator import FULL_COLLECT, Simulator
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Thursday 2026-03-05 12:00 UTC; US DST starts Sunday 2026-03-08 at 10:00 UTC
+START = calendar.timegm((2026, 3, 5, 12, 0, 0))
+DST_START = calendar.timegm((2026, 3, 8, 10, 0, 0))
+
+PST = -8 * HOUR
+PDT = -7 * HOUR
+TIMEZONE = {
+    "transitions": [
+        {"timestamp": calendar.timegm((2025, 11, 2, 9, 0, 0)), "offset": PST},
+        {"timestamp": DST_START, "offset": PDT},
+        {"timestamp": calendar.timegm((2026, 11, 1, 9, 0, 0)), "offset": PST},
+    ]
+}
+
+# seconds of simulated time per loop pass; much coarser than the
+# simulator's default so a week takes seconds, still fine enough for every
+# periodic task (the clock skips some colon blinks)
+STEP = 5.0
+
+# hours after boot before heap samples count, so one-time caches and
+# lazily built objects aren't mistaken for growth
+WARMUP_HOURS = 6
+
+MESSAGE_INTERVAL = 6 * HOUR
+
+# Home Assistant's birth message, which should bring one re-advertisement
+HA_RESTART_INTERVAL = DAY
+
+
+def _solar(now) -> dict:
+    """HA-style next sunrise (14:00 UTC) and next sunset (02:00 UTC)"""
+    midnight = now - now % DAY
+    sunrise = midnight + 14 * HOUR
+    sunset = midnight + 26 * HOUR
+    if sunrise <= now:
+        sunrise += DAY
+    if sunset - DAY > now:
+        sunset -= DAY
+    return {"sunrise": sunrise, "sunset": sunset}
+
+
+def _discovery_count(broker) -> int:
+    return sum(
+        count
+        for topic, count in broker.counts.items()
+        if topic.startswith("homeassistant/") and topic.endswith("/config")
+    )
+
+
+def soak(days=7, step=STEP, start=START) -> dict:
+    """Run the sign for days of simulated time and report on it"""
+    # pylint: disable=too-many-locals,import-outside-toplevel
+    sim = Simulator(start=start)
+    sim.install()
+
+    import adafruit_ntp
+    from give_me_a_sign.stats import Histogram
+
+    sim.broker.keep_log = False
+    sim.boot()
+
+    prefix = sim.settings["MQTT_TOPIC_PREFIX"]
+    mqtt = sim.app.platform._mqtt  # pylint: disable=protected-access
+    base = mqtt._ha_sign_base  # pylint: disable=protected-access
+    sim.publish(f"{prefix}/all/module/timezone", json.dumps(TIMEZONE))
+
+    passes = Histogram()
+    heap = []
+    offsets = []
+    last_offset = None
+    ntp_at_boot = adafruit_ntp.NTP.requests
+    # the sign advertises on the first pass after connecting
+    sim.step()
+    discovery_at_boot = _discovery_count(sim.broker)
+    ha_restarts = 0
+    next_hour = sim.clock.monotonic() + HOUR
+    next_message = sim.clock.monotonic()
+    next_ha_restart = sim.clock.monotonic() + HA_RESTART_INTERVAL
+    next_solar = sim.clock.monotonic()
+
+    end = sim.clock.monotonic() + days * DAY
+    wall_start = time.perf_counter()
+    while sim.clock.monotonic() < end:
+        now = sim.clock.monotonic()
+        if now >= next_solar:
+            sim.publish(
+                f"{prefix}/all/module/solar", json.dumps(_solar(int(sim.clock.time())))
+            )
+            next_solar += DAY
+        if now >= next_message:
+            sim.publish(
+                f"{prefix}/all/module/message", '{"text": "soak", "duration": 5}'
+            )
+            next_message += MESSAGE_INTERVAL
+        if now >= next_ha_restart:
+            sim.publish("homeassistant/status", "online")
+            ha_restarts += 1
+            next_ha_restart += HA_RESTART_INTERVAL
+
+        before = time.perf_counter_ns()
+        sim.step(step)
+        passes.record((time.perf_counter_ns() - before) // 1000)
+
+        offset = sim.app.clock.timezone_offset
+        if offset != last_offset:
+            offsets.append([int(sim.clock.time()), offset])
+            last_offset = offset
+
+        if sim.clock.monotonic() >= next_hour:
+            FULL_COLLECT()
+            heap.append(sys.getallocatedblocks())
+            next_hour += HOUR
+
+    wall = time.perf_counter() - wall_start
+
+    settled = heap[WARMUP_HOURS:] or heap
+    return {
+        "days": days,
+        "step": step,
+        "dst_start": DST_START,
+        "passes": sim.passes,
+        "wall_seconds": round(wall, 1),
+        "ntp_syncs": adafruit_ntp.NTP.requests - ntp_at_boot,
+        "ha_restarts": ha_restarts,
+        "advertisements": _discovery_count(sim.broker) - discovery_at_boot,
+        "diagnostics": sim.broker.counts.get(f"{base}/diagnostics", 0),
+        "offsets": offsets,
+        "heap_blocks_start": settled[0],
+        "heap_blocks_end": settled[-1],
+        "heap_blocks_max": max(settled),
+        "loop_ms": passes.summary(),
+    }
+
+
+def main(argv=None) -> None:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.sim.soak", description=__doc__
+    )
+    parser.add_argument("--days", type=int, default=7)
+    parser.add_argument("--step", type=float, default=STEP)
+    parser.add_argument("--verbose", action="store_true", help="show the sign's output")
+    args = parser.parse_args(argv)
+    if args.verbose:
+        report = soak(args.days, args.step)
+    else:
+        with open(os.devnull, "w", encoding="utf-8") as null:
+            with contextlib.redirect_stdout(null):
+                report = soak(args.days, args.step)
+    print(json.dumps(report))
+
+
+if __name__ == "__main__":
+    main()
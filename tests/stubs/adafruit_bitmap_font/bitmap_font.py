@@ -1,9 +0,0 @@
-# SPDX-FileCopyrightText: 2026 John Romkey
-#
-# SPDX-License-Identifier: MIT
-
-"""Minimal ``adafruit_bitmap_font.bitmap_font`` stub for host-side unit tests."""
-
-
-def load_font(path):
-    return path
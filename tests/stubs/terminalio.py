@@ -1,7 +0,0 @@
-# SPDX-FileCopyrightText: 2026 John Romkey
-#
-# SPDX-License-Identifier: MIT
-
-"""Minimal ``terminalio`` stub for host-side unit tests."""
-
-FONT = "terminal_font"
@@ -0,0 +1,125 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the asyncio runtime's tasks and their guard."""
+
+from types import SimpleNamespace
+
+from give_me_a_sign import asyncio_runtime
+from give_me_a_sign.asyncio_runtime import AsyncRunner
+from tests.sim.clock import VirtualEventLoop
+
+
+def _runner():
+    errors = []
+    app = SimpleNamespace(logger=SimpleNamespace(error=errors.append))
+    return AsyncRunner(app), errors
+
+
+def test_guard_returns_no_backoff_on_success():
+    runner, errors = _runner()
+    calls = []
+
+    assert runner._guard("test", lambda: calls.append(1)) == 0
+    assert calls == [1]
+    assert not errors
+
+
+def test_guard_backs_off_and_logs_exceptions():
+    runner, errors = _runner()
+
+    def broken():
+        raise ValueError("boom")
+
+    assert runner._guard("test", broken) == asyncio_runtime.ERROR_BACKOFF
+    assert errors and errors[0].startswith("asyncio_runtime:test")
+
+
+def test_guard_backs_off_longer_on_os_error():
+    runner, _ = _runner()
+
+    def broken():
+        raise OSError(5)
+
+    assert runner._guard("test", broken) == asyncio_runtime.OS_ERROR_BACKOFF
+
+
+def _counting_app(platform_loop=None, tones=None):
+    calls = {"mqtt": 0, "render": 0, "gc": 0, "buttons": 0}
+
+    def count(name):
+        def step():
+            calls[name] += 1
+
+        return step
+
+    app = SimpleNamespace(
+        platform=SimpleNamespace(loop=platform_loop or count("mqtt")),
+        render=count("render"),
+        collect_garbage=count("gc"),
+        update_buttons=count("buttons"),
+        tones=tones,
+        logger=SimpleNamespace(error=lambda message: None),
+    )
+    return app, calls
+
+
+def _drive(app, clock, seconds):
+    loop = VirtualEventLoop(clock)
+    try:
+        loop.run_for(seconds, AsyncRunner(app).main())
+    finally:
+        loop.close()
+
+
+def test_tasks_run_at_their_own_cadence(virtual_clock):
+    app, calls = _counting_app()
+
+    _drive(app, virtual_clock, 1)
+
+    # a pass at 0 and one every interval after, within a tick either way
+    assert abs(calls["render"] - 1 / asyncio_runtime.RENDER_INTERVAL) <= 1
+    assert abs(calls["mqtt"] - 1 / asyncio_runtime.MQTT_INTERVAL) <= 1
+    assert abs(calls["buttons"] - 1 / asyncio_runtime.BUTTON_INTERVAL) <= 1
+    # garbage is collected right after each frame
+    assert calls["gc"] == calls["render"]
+
+
+def test_failing_task_backs_off_without_stopping_the_others(virtual_clock):
+    failures = []
+
+    def broken():
+        failures.append(virtual_clock.monotonic())
+        raise OSError(5)
+
+    app, calls = _counting_app(platform_loop=broken)
+
+    _drive(app, virtual_clock, 2)
+
+    interval = asyncio_runtime.MQTT_INTERVAL + asyncio_runtime.OS_ERROR_BACKOFF
+    assert len(failures) == 2
+    assert abs(failures[1] - failures[0] - interval) < 0.001
+    assert abs(calls["render"] - 2 / asyncio_runtime.RENDER_INTERVAL) <= 1
+
+
+def test_tones_task_wakes_when_the_tone_changes(virtual_clock):
+    changes = []
+
+    class _Tones:
+        def __init__(self):
+            self.notes = [0.3, 0.2]
+
+        def loop(self):
+            changes.append(virtual_clock.monotonic())
+
+        def next_change(self):
+            return self.notes.pop(0) if self.notes else None
+
+    start = virtual_clock.monotonic()
+    app, _ = _counting_app(tones=_Tones())
+
+    _drive(app, virtual_clock, 0.55)
+
+    # at once, then as each note ends
+    assert [round(when - start, 3) for when in changes] == [0, 0.3, 0.5]
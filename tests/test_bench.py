@@ -0,0 +1,71 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Checks on the micro-benchmark suite itself; timing runs via python -m tests.bench."""
+
+import json
+
+import pytest
+
+from tests.bench import runner
+from tests.bench.cases import CASES
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_case_runs(name):
+    CASES[name]()()
+
+
+def test_baseline_covers_every_case():
+    baseline = json.loads(runner.BASELINE.read_text(encoding="utf-8"))
+    assert set(baseline["cases"]) == set(CASES)
+
+
+def _results(relative, peak_bytes):
+    return {
+        "cases": {"case": {"ns": 0, "relative": relative, "peak_bytes": peak_bytes}}
+    }
+
+
+def test_compare_passes_within_margin():
+    baseline = _results(1.0, 1000)
+    assert not runner.compare(baseline, _results(1.2, 1200), margin=0.25)
+
+
+def test_compare_flags_slower_case():
+    baseline = _results(1.0, 1000)
+    regressions = runner.compare(baseline, _results(1.3, 1000), margin=0.25)
+    assert len(regressions) == 1 and "time" in regressions[0]
+
+
+def test_compare_flags_bigger_allocation():
+    baseline = _results(1.0, 1000)
+    regressions = runner.compare(baseline, _results(1.0, 2000), margin=0.25)
+    assert len(regressions) == 1 and "peak" in regressions[0]
+
+
+def test_compare_without_timings_only_flags_allocations():
+    baseline = _results(1.0, 1000)
+    assert not runner.compare(baseline, _results(3.0, 1000), timings=False)
+    regressions = runner.compare(baseline, _results(3.0, 2000), timings=False)
+    assert len(regressions) == 1 and "peak" in regressions[0]
+
+
+def test_allocations_only_run_passes_slower_case(monkeypatch, tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(_results(1.0, 1000)), encoding="utf-8")
+    monkeypatch.setattr(runner, "BASELINE", baseline)
+    monkeypatch.setattr(runner, "run", lambda only: _results(3.0, 1000))
+
+    assert runner.main(["--allocations-only"]) == 0
+    assert "SLOWER case: time" in capsys.readouterr().out
+    assert runner.main([]) == 1
+
+
+def test_compare_ignores_new_cases():
+    assert not runner.compare({"cases": {}}, _results(9.0, 9000))
+
+
+def test_peak_allocation_sees_the_allocation():
+    assert runner.peak_allocation(lambda: bytearray(10_000)) >= 10_000
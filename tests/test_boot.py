@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for boot milestone timing."""
+
+from give_me_a_sign.boot import BootTimer
+
+
+def test_milestones_are_milliseconds_since_power_on_in_order(virtual_clock):
+    timer = BootTimer()
+    timer.mark("init")
+    virtual_clock.advance(3.25)
+    timer.mark("wifi")
+
+    assert timer.report() == {"init": 5000, "wifi": 8250}
+    assert list(timer.report()) == ["init", "wifi"]
+
+
+def test_a_milestone_is_recorded_once(virtual_clock):
+    timer = BootTimer()
+    timer.mark("clock")
+    virtual_clock.advance(1)
+    timer.mark("clock")
+
+    assert timer.elapsed("clock") == 5000
+    assert timer.elapsed("mqtt") is None
+
+
+def test_the_boot_is_done_once_the_clock_shows_and_mqtt_is_up(virtual_clock):
+    timer = BootTimer()
+    timer.mark("first_clock")
+    timer.mark("wifi")
+    assert not timer.done
+
+    virtual_clock.advance(0.5)
+    timer.mark("mqtt")
+    timer.mark("ntp")
+
+    assert timer.done
+    assert timer.report() == {"first_clock": 5000, "wifi": 5000, "mqtt": 5500}
@@ -4,11 +4,12 @@
 
 """Unit tests for clock timezone and solar logic."""
 
+import time
 from types import SimpleNamespace
 
 import pytest
 
-from give_me_a_sign.clock import Clock
+from give_me_a_sign.clock import Clock, TimeSnapshot
 from give_me_a_sign.data import Data
 
 
@@ -36,6 +37,9 @@ def clock(monkeypatch):
     instance._timezone_cache_until = 0
     instance._timezone_cached_offset = 0
     instance._solar_prev_sunrise = None
+    instance._snapshot = TimeSnapshot()
+    instance._mini_font = None
+    instance._mini_font_enabled = True
     return instance
 
 
@@ -51,7 +55,7 @@ def _set_solar(clock, now, sunrise_delta, sunset_delta):
 
 def test_timezone_offset_selects_latest_transition(clock, monkeypatch):
     now = 1_700_000_000
-    monkeypatch.setattr("give_me_a_sign.clock.time.time", lambda: now)
+    monkeypatch.setattr("give_me_a_sign.timesource.time", lambda: now)
 
     clock._app.data.set_item(
         Clock.KEY_TIMEZONE,
@@ -72,7 +76,7 @@ def test_timezone_offset_selects_latest_transition(clock, monkeypatch):
 
 def test_timezone_update_invalidates_cache(clock, monkeypatch):
     now = 1_700_000_000
-    monkeypatch.setattr("give_me_a_sign.clock.time.time", lambda: now)
+    monkeypatch.setattr("give_me_a_sign.timesource.time", lambda: now)
 
     clock._timezone_cache_until = now + 99999
     clock._timezone_cached_offset = 123
@@ -91,7 +95,7 @@ def test_timezone_update_invalidates_cache(clock, monkeypatch):
 
 def test_timezone_empty_transitions(clock, monkeypatch):
     now = 1_700_000_000
-    monkeypatch.setattr("give_me_a_sign.clock.time.time", lambda: now)
+    monkeypatch.setattr("give_me_a_sign.timesource.time", lambda: now)
 
     clock._app.data.set_item(
         Clock.KEY_TIMEZONE,
@@ -175,3 +179,58 @@ def test_is_sundown_ha_next_event_day(clock):
 
 def test_is_sundown_without_solar(clock):
     assert clock.is_sundown is False
+
+
+def test_snapshot_applies_offset_and_formats_text(clock, monkeypatch):
+    now = 1_700_000_001
+    monkeypatch.setattr("give_me_a_sign.timesource.time", lambda: now)
+    clock._app.data.set_item(
+        Clock.KEY_TIMEZONE,
+        {"timezone": "X", "transitions": [{"timestamp": 0, "offset": 3600}]},
+    )
+
+    snap = clock.snapshot()
+    assert snap.utc == now
+    assert snap.offset == 3600
+    local = snap.local
+    assert tuple(local)[:6] == tuple(time.localtime(now + 3600))[:6]
+    assert snap.text == f"{local[3]}:{local[4]:02d}"
+    assert snap.color == Clock.NO_SOLAR_COLOR
+    assert clock.get_local_time() == now + 3600
+
+
+def test_snapshot_recomputed_only_when_second_changes(clock, monkeypatch):
+    now = [1_700_000_000]
+    monkeypatch.setattr("give_me_a_sign.timesource.time", lambda: now[0])
+    calls = []
+    real = clock._calculate_color
+
+    def _counting(epoch):
+        calls.append(epoch)
+        return real(epoch)
+
+    clock._calculate_color = _counting
+
+    first = clock.snapshot()
+    first_text = first.text
+    assert clock.snapshot() is first
+    assert calls == [1_700_000_000]
+
+    now[0] += 1
+    assert clock.snapshot().utc == 1_700_000_001
+    assert calls == [1_700_000_000, 1_700_000_001]
+    # the colon blinks: even and odd seconds render differently
+    assert clock.snapshot().text != first_text
+
+
+def test_mini_font_released_and_reloaded_with_memory_tier(clock):
+    clock._mini_font = "loaded font"
+    assert clock.mini_font_enabled
+
+    clock.mini_font_enabled = False
+    assert not clock.mini_font_enabled
+    assert clock._mini_font is None
+
+    # turning it back on loads the font again when the mini clock next needs it
+    clock.mini_font_enabled = True
+    assert clock.mini_font_enabled
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Tests for coldpath: cold modules are unloaded after use."""
+
+import sys
+
+import pytest
+
+import give_me_a_sign
+from give_me_a_sign import coldpath
+from give_me_a_sign.home_assistant import HomeAssistant
+from give_me_a_sign.mqtt import SignMQTT
+
+
+def _loaded(name) -> bool:
+    return f"give_me_a_sign.{name}" in sys.modules or hasattr(give_me_a_sign, name)
+
+
+def test_call_returns_result_and_unloads():
+    coldpath.unload("timeparse")
+    result = coldpath.call("timeparse", "parse_iso8601_utc", "2026-03-08T10:30:00Z")
+    assert result == 1772965800
+    assert not _loaded("timeparse")
+
+
+def test_call_unloads_when_function_fails():
+    coldpath.unload("timeparse")
+    with pytest.raises(AttributeError):
+        coldpath.call("timeparse", "no_such_function")
+    assert not _loaded("timeparse")
+
+
+def test_unload_of_module_never_loaded_is_harmless():
+    coldpath.unload("no_such_module")
+
+
+class _MQTT:  # pylint: disable=too-few-public-methods
+    def publish(self, *args, **kwargs):
+        pass
+
+
+def test_resident_modules_leave_discovery_unloaded():
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", _MQTT(), "givemeasign/sign/aa_bb")
+    configs = list(ha.create_autodiscovery_config())
+    assert configs and all("topic" in config for config in configs)
+    assert not _loaded("discovery")
+
+
+def test_resident_modules_leave_timeparse_unloaded():
+    # pylint: disable=protected-access
+    assert SignMQTT._parse_iso8601_utc("2026-03-08T02:30:00-08:00") == 1772965800
+    assert not _loaded("timeparse")
@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for adaptive garbage collection scheduling."""
+
+import pytest
+
+from give_me_a_sign.collector import NS_PER_SECOND, Collector
+
+
+class FakeHeap:
+    """Heap whose allocations are set by the test and freed by collect()"""
+
+    SIZE = 100_000
+
+    def __init__(self):
+        self.allocated = 20_000
+        self.live = 20_000
+        self.collections = 0
+
+    def collect(self):
+        self.collections += 1
+        self.allocated = self.live
+
+    def mem_alloc(self):
+        return self.allocated
+
+    def mem_free(self):
+        return FakeHeap.SIZE - self.allocated
+
+
+@pytest.fixture
+def heap():
+    return FakeHeap()
+
+
+@pytest.fixture
+def collector(heap, monkeypatch):
+    monkeypatch.setattr("give_me_a_sign.timesource.monotonic_ns", lambda: 0)
+    return Collector(heap.collect, heap.mem_alloc, heap.mem_free)
+
+
+def test_waits_for_idle(collector, heap):
+    now = Collector.INITIAL_INTERVAL * NS_PER_SECOND
+
+    assert collector.poll(now, idle=False) is False
+    assert collector.poll(now, idle=True) is True
+    assert heap.collections == 1
+    assert collector.pauses.count == 1
+
+
+def test_never_more_often_than_min_interval(collector, heap):
+    heap.allocated = FakeHeap.SIZE
+
+    assert collector.poll(NS_PER_SECOND // 2, idle=True) is False
+    assert heap.collections == 0
+
+
+def test_collects_while_busy_when_heap_is_nearly_used(collector, heap):
+    heap.allocated += int(collector.free_after * Collector.URGENT_FRACTION)
+
+    assert collector.poll(2 * NS_PER_SECOND, idle=False) is True
+
+
+def test_collects_while_busy_after_max_interval(collector):
+    assert collector.poll(Collector.MAX_INTERVAL * NS_PER_SECOND, idle=False) is True
+
+
+def test_interval_adapts_to_allocation_rate(collector, heap):
+    # 40 KB in 5 s with 80 KB free after collecting: a quarter of the free
+    # heap lasts 2.5 s
+    heap.allocated += 40_000
+    collector.collect(5 * NS_PER_SECOND)
+
+    assert collector.alloc_rate == 8_000
+    assert collector.interval == pytest.approx(2.5)
+
+    # a quiet sign backs off to the maximum
+    heap.allocated += 10
+    collector.collect(35 * NS_PER_SECOND)
+    assert collector.interval < Collector.MAX_INTERVAL
+    for second in range(60, 600, 30):
+        collector.collect(second * NS_PER_SECOND)
+    assert collector.interval == Collector.MAX_INTERVAL
+
+
+def test_collections_per_minute(collector):
+    for second in range(10, 70, 10):
+        collector.collect(second * NS_PER_SECOND)
+
+    assert collector.collections_per_minute(60 * NS_PER_SECOND) == pytest.approx(6)
+
+    collector.reset_stats(60 * NS_PER_SECOND)
+    assert collector.collections_per_minute(120 * NS_PER_SECOND) == 0
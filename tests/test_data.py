@@ -58,7 +58,7 @@ def test_age_and_last_updated(data_without_restore, monkeypatch):
     assert store.last_updated("message") == 0
 
     times = iter([100.0, 125.0])
-    monkeypatch.setattr("give_me_a_sign.data.time.time", lambda: next(times))
+    monkeypatch.setattr("give_me_a_sign.timesource.time", lambda: next(times))
 
     store.set_item("message", {"text": "hi"})
     assert store.last_updated("message") == 100.0
@@ -130,3 +130,61 @@ def test_restore_clears_dirty_flags_and_drops_empty_entries(monkeypatch):
     assert store.get_item("message") == {"text": "persisted"}
     assert store.is_updated("message") is False
     assert "empty_shell" not in store.all()
+
+
+def test_generation_changes_on_set(data_without_restore):
+    store = data_without_restore
+    before = store.generation
+    store.set_item("aqi", {"aqi": 1})
+    assert store.generation != before
+    store.clear_updated("aqi")
+    assert store.generation == before + 1
+
+
+def test_listeners_called_on_set(data_without_restore):
+    store = data_without_restore
+    seen = []
+    store.add_listener(seen.append)
+    store.set_item("greet", {"person": "A"})
+    store.set_item("greet", {"person": "B"})
+    assert seen == ["greet", "greet"]
+
+
+def test_remove_item(data_without_restore):
+    store = data_without_restore
+    store.set_item("lunar", {"phase": 0.5})
+    generation = store.generation
+
+    store.remove_item("lunar")
+
+    assert not store.has_item("lunar")
+    assert store.generation == generation + 1
+
+    store.remove_item("lunar")
+    assert store.generation == generation + 1
+
+
+def test_set_items_is_one_change(data_without_restore, monkeypatch):
+    store = data_without_restore
+    saves = []
+    monkeypatch.setattr(store, "_save", lambda: saves.append(True))
+    seen = []
+    store.add_listener(seen.append)
+    before = store.generation
+
+    store.set_items(
+        {
+            "timezone": {"timezone": "UTC", "transitions": []},
+            "playlist": [{"screen": "clock"}],
+            "greet": {"person": "A"},
+        }
+    )
+
+    assert store.generation == before + 1
+    assert len(saves) == 1
+    assert seen == ["timezone", "playlist", "greet"]
+    assert store.get_item("greet") == {"person": "A"}
+    assert store.is_updated("playlist")
+
+    store.set_items({})
+    assert store.generation == before + 1
@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the diagnostics interval command."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from give_me_a_sign.mqtt import SignMQTT
+
+
+class _Logger:
+    def __init__(self):
+        self.errors = []
+
+    def error(self, message, *args):
+        self.errors.append(message)
+
+
+@pytest.fixture
+def sign_mqtt(virtual_clock):  # pylint: disable=unused-argument
+    mqtt = SignMQTT.__new__(SignMQTT)
+    mqtt._app = SimpleNamespace(logger=_Logger())
+    mqtt._diagnostics_interval = 60
+    mqtt._info_interval = 0
+    mqtt._next_diagnostic_time = 0
+    mqtt._next_info_time = None
+    return mqtt
+
+
+def test_command_sets_both_intervals(sign_mqtt):
+    sign_mqtt._on_diagnostics_command(
+        None, None, '{"interval": 15, "info_interval": 600}'
+    )
+
+    assert sign_mqtt._diagnostics_interval == 15
+    assert sign_mqtt._info_interval == 600
+    # info goes out again straight away, showing the new intervals
+    assert sign_mqtt._next_info_time == 0
+
+
+def test_command_leaves_unmentioned_interval(sign_mqtt):
+    sign_mqtt._on_diagnostics_command(None, None, b'{"info_interval": 3600}')
+
+    assert sign_mqtt._diagnostics_interval == 60
+    assert sign_mqtt._info_interval == 3600
+
+
+@pytest.mark.parametrize(
+    "payload",
+    ["fast", '{"interval": 1}', '{"info_interval": -5}', '{"interval": "x"}', "[]"],
+)
+def test_bad_command_changes_nothing(sign_mqtt, payload):
+    sign_mqtt._on_diagnostics_command(None, None, payload)
+
+    assert sign_mqtt._diagnostics_interval == 60
+    assert sign_mqtt._info_interval == 0
+    assert sign_mqtt._next_info_time is None
+    assert sign_mqtt._app.logger.errors
@@ -0,0 +1,138 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for pre-rendered frames in ``give_me_a_sign.frame``."""
+
+from types import SimpleNamespace
+
+import pytest
+from encode_frame import encode
+
+from give_me_a_sign.data import Data
+from give_me_a_sign.frame import Frame
+from give_me_a_sign.mqtt import SignMQTT
+from give_me_a_sign.pressure import MemoryPressure
+
+PALETTE = [(0, 0, 0), (255, 0, 0), (0, 255, 0), (0, 0, 255)]
+
+
+def _app(display_width=128, display_height=64):
+    shown = []
+    return SimpleNamespace(
+        canvas_width=64,
+        canvas_height=32,
+        display=SimpleNamespace(
+            width=display_width, height=display_height, root_group=None
+        ),
+        show_group=shown.append,
+        shown=shown,
+    )
+
+
+def _chart(width, height):
+    """Bars over a plain background, with a noisy first row"""
+    pixels = bytearray(width * height)
+    for x in range(width):
+        pixels[x] = x % 4
+        bar_height = (x * 7) % height
+        for y in range(height - bar_height, height):
+            pixels[y * width + x] = 1 + (x // 8) % 3
+    return bytes(pixels)
+
+
+def _pixels(frame):
+    bitmap = frame._bitmap
+    return bytes(
+        bitmap[x, y] for y in range(bitmap.height) for x in range(bitmap.width)
+    )
+
+
+@pytest.mark.parametrize("rle", [False, True])
+def test_canvas_frame_decoded_and_shown_scaled(rle):
+    app = _app()
+    frame = Frame(app)
+    pixels = _chart(64, 32)
+
+    summary = frame.receive(bytearray(encode(64, 32, PALETTE, pixels, rle=rle)))
+
+    assert summary["width"] == 64 and summary["colors"] == 4
+    assert summary["encoding"] == ("rle" if rle else "raw")
+    assert _pixels(frame) == pixels
+    assert frame._palette[1] == 0xFF0000
+    assert frame.show()
+    assert app.shown == [frame._group]
+
+
+def test_native_frame_with_long_runs_shown_unscaled():
+    app = _app(display_width=256, display_height=64)
+    frame = Frame(app)
+    pixels = bytes(256 * 63) + bytes(range(256))
+
+    payload = encode(256, 64, [(index, 0, 0) for index in range(256)], pixels)
+    assert frame.receive(payload)["encoding"] == "rle"
+    # a mostly blank frame compresses to a small fraction
+    assert len(payload) < 256 * 64 // 4
+
+    assert _pixels(frame) == pixels
+    assert frame.show()
+    assert app.display.root_group is frame._group
+    assert not app.shown
+
+
+def test_nothing_to_show_before_a_frame():
+    assert not Frame(_app()).show()
+
+
+@pytest.mark.parametrize(
+    "damage",
+    [
+        lambda payload: b"XX" + payload[2:],
+        lambda payload: payload[:2] + b"\x07" + payload[3:],
+        lambda payload: payload[:-1],
+        lambda payload: payload + b"\x00",
+        lambda payload: payload[:4] + b"\x20\x00" + payload[6:],
+    ],
+)
+def test_damaged_frames_rejected(damage):
+    frame = Frame(_app())
+    payload = encode(64, 32, PALETTE, _chart(64, 32))
+
+    assert frame.receive(damage(payload)) is None
+    assert not frame.show()
+
+
+def _publishing(monkeypatch):
+    """A frame screen and the SignMQTT that stores frames published to it"""
+    monkeypatch.setattr(Data, "_restore", lambda self: False)
+    app = _app()
+    frame = Frame(app)
+    app.data = Data()
+    app.logger = SimpleNamespace(
+        debug=lambda *args: None, info=lambda *args: None, error=print
+    )
+    app.memory = MemoryPressure()
+    app.modules = SimpleNamespace(get={"frame": frame}.get)
+    mqtt = SignMQTT.__new__(SignMQTT)
+    mqtt._app = app
+    return app, frame, mqtt
+
+
+def test_published_frame_stored_without_json(monkeypatch):
+    app, frame, mqtt = _publishing(monkeypatch)
+
+    payload = bytearray(encode(64, 32, PALETTE, _chart(64, 32)))
+    mqtt.store_data("frame", payload)
+
+    assert app.data.get_item("frame")["bytes"] == len(payload)
+    assert frame.show()
+
+
+def test_largest_canvas_frame_taken_under_memory_pressure(monkeypatch):
+    app, frame, mqtt = _publishing(monkeypatch)
+    app.memory.tier = MemoryPressure.DROP_DATA
+
+    palette = [(index, 0, 0) for index in range(256)]
+    mqtt.store_data("frame", bytearray(encode(64, 32, palette, _chart(64, 32), False)))
+
+    assert frame.show()
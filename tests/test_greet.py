@@ -62,3 +62,9 @@ def test_greet_non_string_person(greeter):
     greet, app = greeter
     _publish_greet(app, {"person": 5})
     assert greet.show() is False
+
+
+def test_greet_explicit_payload_ignores_data(greeter):
+    greet, app = greeter
+    assert greet.show({"person": "Ann B."}) is True
+    assert app._shown[1].text == "Ann"
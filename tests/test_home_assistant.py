@@ -96,3 +96,160 @@ def test_publish_advertisements_uses_retain_and_qos_1():
     assert mqtt.published
     assert all(call["kwargs"].get("retain") is True for call in mqtt.published)
     assert all(call["kwargs"].get("qos") == 1 for call in mqtt.published)
+
+
+def test_autodiscovery_includes_profiler():
+    base = "givemeasign/sign/aa_bb_cc_dd_ee_ff"
+    ha = HomeAssistant(
+        "aa:bb:cc:dd:ee:ff", _DummyMQTT(), base, ("platform", "playlist")
+    )
+    configs = _configs_by_topic(ha.create_autodiscovery_config())
+
+    switch = configs["homeassistant/switch/givemeasign_aa_bb_cc_dd_ee_ff/perf/config"]
+    assert switch["command_topic"] == f"{base}/perf/set"
+    assert switch["state_topic"] == f"{base}/perf/state"
+
+    sensor = configs[
+        "homeassistant/sensor/givemeasign_aa_bb_cc_dd_ee_ff/perf_playlist/config"
+    ]
+    assert sensor["state_topic"] == f"{base}/perf"
+    assert sensor["value_template"] == "{{ value_json['playlist'].p95 }}"
+    assert sensor["entity_category"] == "diagnostic"
+    assert (
+        "homeassistant/sensor/givemeasign_aa_bb_cc_dd_ee_ff/perf_platform/config"
+        in configs
+    )
+
+
+def _device_payloads(mqtt):
+    return [
+        call["args"][1]
+        for call in mqtt.published
+        if call["args"][0]
+        == "homeassistant/device/givemeasign_aa_bb_cc_dd_ee_ff/config"
+    ]
+
+
+def test_device_config_holds_every_entity_once():
+    base = "givemeasign/sign/aa_bb_cc_dd_ee_ff"
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", _DummyMQTT(), base, ("platform",))
+    entities = list(ha.create_autodiscovery_config())
+    config = ha.create_device_config()
+
+    assert config["device"]["identifiers"] == ["givemeasign_aa_bb_cc_dd_ee_ff"]
+    assert config["origin"]["name"] == "give-me-a-sign"
+    assert config["availability_topic"] == f"{base}/available"
+    components = config["components"]
+    assert len(components) == len(entities)
+    assert {c["unique_id"] for c in components.values()} == {
+        e["payload"]["unique_id"] for e in entities
+    }
+    assert components["message_notify"]["platform"] == "notify"
+    assert components["message"]["platform"] == "text"
+    assert components["perf_platform"]["state_topic"] == f"{base}/perf"
+    assert all("device" not in c for c in components.values())
+
+
+def test_device_config_published_once_until_ha_restarts():
+    mqtt = _DummyMQTT()
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", mqtt, "givemeasign/sign/aa_bb")
+
+    for _ in range(3):
+        ha.loop()
+    assert len(mqtt.published) == 1
+    assert len(_device_payloads(mqtt)) == 1
+    assert mqtt.published[0]["kwargs"] == {"retain": True, "qos": 1}
+
+    ha.on_status("offline")
+    ha.loop()
+    assert len(_device_payloads(mqtt)) == 1
+
+    ha.on_status("online")
+    ha.loop()
+    ha.loop()
+    payloads = _device_payloads(mqtt)
+    assert len(payloads) == 2 and payloads[0] is payloads[1]
+
+
+def test_device_config_republished_only_when_it_changes():
+    mqtt = _DummyMQTT()
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", mqtt, "givemeasign/sign/aa_bb")
+    ha.loop()
+
+    # a reconnect rebuilds it, but the broker already has the same one
+    ha.set_mqtt_client(mqtt)
+    ha.loop()
+    assert len(_device_payloads(mqtt)) == 1
+
+    ha._perf_stages = ("platform",)  # pylint: disable=protected-access
+    ha.set_mqtt_client(mqtt)
+    ha.loop()
+    assert len(_device_payloads(mqtt)) == 2
+
+
+def test_legacy_entity_configs_are_migrated_and_cleared():
+    mqtt = _DummyMQTT()
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", mqtt, "givemeasign/sign/aa_bb")
+    assert ha.legacy_topic == "homeassistant/+/givemeasign_aa_bb_cc_dd_ee_ff/+/config"
+    ha.loop()
+    mqtt.published.clear()
+
+    topic = "homeassistant/sensor/givemeasign_aa_bb_cc_dd_ee_ff/uptime/config"
+    ha.on_legacy_config(topic, '{"name": "Uptime"}')
+    ha.loop()
+    ha.loop()
+    sent = [(call["args"][0], call["args"][1]) for call in mqtt.published]
+    assert sent[0] == (topic, HomeAssistant.MIGRATE_PAYLOAD)
+    assert sent[1][0].startswith("homeassistant/device/")
+    assert sent[2] == (topic, "")
+
+    # the broker echoing those back doesn't start another migration
+    ha.on_legacy_config(topic, HomeAssistant.MIGRATE_PAYLOAD)
+    ha.on_legacy_config(topic, "")
+    mqtt.published.clear()
+    ha.loop()
+    assert not mqtt.published
+
+
+def test_entity_discovery_setting_advertises_each_entity(monkeypatch):
+    monkeypatch.setenv("HA_DISCOVERY", "entity")
+    mqtt = _DummyMQTT()
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", mqtt, "givemeasign/sign/aa_bb")
+    assert ha.legacy_topic is None
+
+    ha.loop()
+    assert not _device_payloads(mqtt)
+    assert len(mqtt.published) == len(list(ha.create_autodiscovery_config())) + 1
+    assert mqtt.published[-1]["args"] == ("givemeasign/sign/aa_bb/available", "online")
+
+
+def test_advertisement_spread_across_loop_calls(monkeypatch):
+    monkeypatch.setenv("HA_DISCOVERY", "entity")
+    # one message per call
+    monkeypatch.setattr(HomeAssistant, "PUBLISH_BUDGET_NS", 0)
+    mqtt = _DummyMQTT()
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", mqtt, "givemeasign/sign/aa_bb")
+    total = len(list(ha.create_autodiscovery_config())) + 1
+
+    for calls in range(1, total + 1):
+        ha.loop()
+        assert len(mqtt.published) == calls
+    ha.loop()
+    assert len(mqtt.published) == total
+    topics = [call["args"][0] for call in mqtt.published]
+    assert len(set(topics)) == total
+
+
+def test_interrupted_advertisement_starts_over_on_reconnect(monkeypatch):
+    monkeypatch.setenv("HA_DISCOVERY", "entity")
+    monkeypatch.setattr(HomeAssistant, "PUBLISH_BUDGET_NS", 0)
+    mqtt = _DummyMQTT()
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", mqtt, "givemeasign/sign/aa_bb")
+    ha.loop()
+    ha.loop()
+
+    reconnected = _DummyMQTT()
+    ha.set_mqtt_client(reconnected)
+    monkeypatch.setattr(HomeAssistant, "PUBLISH_BUDGET_NS", 10**12)
+    ha.loop()
+    assert len(reconnected.published) == len(list(ha.create_autodiscovery_config())) + 1
@@ -0,0 +1,87 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the greet/message/image interrupt queue."""
+
+from give_me_a_sign.interrupts import InterruptQueue
+
+SECOND = 1_000_000_000
+
+
+def _drain(queue, now=0):
+    shown = []
+    while True:
+        item = queue.pop(now)
+        if item is None:
+            return shown
+        shown.append((item.key, item.payload))
+
+
+def test_fifo_within_priority_and_priority_first():
+    queue = InterruptQueue(4)
+    queue.push("greet", {"person": "A"}, 0, 2, 15, 60)
+    queue.push("greet", {"person": "B"}, 0, 2, 15, 60)
+    queue.push("message", {"text": "hi"}, 0, 1, 15, 60)
+    queue.push("message", {"text": "urgent", "priority": 9}, 0, 1, 15, 60)
+
+    assert _drain(queue) == [
+        ("message", {"text": "urgent", "priority": 9}),
+        ("greet", {"person": "A"}),
+        ("greet", {"person": "B"}),
+        ("message", {"text": "hi"}),
+    ]
+
+
+def test_duplicates_collapse():
+    queue = InterruptQueue(4)
+    queue.push("greet", {"person": "A"}, 0, 2, 15, 60)
+    queue.push("greet", {"person": "A"}, 0, 2, 15, 60)
+    assert len(queue) == 1
+
+
+def test_payload_overrides_duration_and_ttl():
+    queue = InterruptQueue(2)
+    queue.push("message", {"text": "x", "duration": 30, "ttl": 5}, 0, 1, 15, 60)
+    assert queue.pop(4 * SECOND).duration == 30
+
+    queue.push("message", {"text": "x", "ttl": 5}, 0, 1, 15, 60)
+    assert queue.pop(5 * SECOND) is None
+
+
+def test_bad_overrides_fall_back_to_defaults():
+    queue = InterruptQueue(2)
+    queue.push(
+        "message", {"text": "x", "duration": "long", "priority": -3}, 0, 1, 15, 60
+    )
+    item = queue.pop(0)
+    assert item.duration == 15
+    assert item.priority == 1
+
+
+def test_full_queue_evicts_weakest_or_drops():
+    queue = InterruptQueue(2)
+    assert queue.push("message", {"text": "1"}, 0, 1, 15, 60)
+    assert queue.push("message", {"text": "2"}, 0, 1, 15, 60)
+    # same priority as everything waiting: dropped
+    assert not queue.push("message", {"text": "3"}, 0, 1, 15, 60)
+    # outranks the oldest lowest-priority item: replaces it
+    assert queue.push("greet", {"person": "A"}, 0, 2, 15, 60)
+    assert _drain(queue) == [("greet", {"person": "A"}), ("message", {"text": "2"})]
+
+
+def test_expired_slots_are_reused():
+    queue = InterruptQueue(1)
+    queue.push("greet", {"person": "A"}, 0, 2, 15, 1)
+    assert queue.push("greet", {"person": "B"}, 2 * SECOND, 1, 15, 60)
+    assert _drain(queue, 2 * SECOND) == [("greet", {"person": "B"})]
+
+
+def test_slots_are_preallocated():
+    queue = InterruptQueue(3)
+    slots = list(queue._slots)
+    for index in range(10):
+        queue.push("greet", {"person": str(index)}, 0, 1 + index, 15, 60)
+        queue.pop(0)
+    assert queue._slots == slots
+    assert all(a is b for a, b in zip(queue._slots, slots))
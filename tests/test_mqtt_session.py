@@ -0,0 +1,134 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for catching up on a resumed persistent MQTT session."""
+
+from types import SimpleNamespace
+
+from give_me_a_sign import coldpath
+from give_me_a_sign import mqtt as sign_mqtt_module
+from give_me_a_sign.mqtt import SignMQTT
+from give_me_a_sign.profiler import Profiler
+
+
+class _Logger:
+    def __init__(self):
+        self.errors = []
+
+    def error(self, message, *args):
+        self.errors.append(message)
+
+
+class _Client:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.subscribed = []
+        self.callbacks = {}
+        # ("subscribe" or "callback", topic) in the order they happened
+        self.calls = []
+
+    def subscribe(self, topic, qos=0):
+        self.subscribed.append((topic, qos))
+        self.calls.append(("subscribe", topic))
+
+    def add_topic_callback(self, topic, method):
+        self.callbacks[topic] = method
+        self.calls.append(("callback", topic))
+
+
+def _sign_mqtt(session_present):
+    mqtt = SignMQTT.__new__(SignMQTT)
+    mqtt._app = SimpleNamespace(
+        logger=_Logger(), profiler=Profiler((), mem_alloc=lambda: 0)
+    )
+    mqtt._mqtt = _Client()
+    mqtt._subscribe_qos = 1
+    mqtt._session_present = session_present
+    mqtt._inbox = [] if session_present else None
+    mqtt._inbox_added = False
+    return mqtt
+
+
+def test_resumed_session_adds_callbacks_without_subscribing():
+    mqtt = _sign_mqtt(session_present=True)
+    mqtt._add_handler("sign/greet", "greet", lambda *args: None)
+    mqtt._subscribe(["sign/greet"])
+
+    assert not mqtt._mqtt.subscribed
+    assert "sign/greet" in mqtt._mqtt.callbacks
+
+
+def test_new_session_subscribes_at_qos_1():
+    mqtt = _sign_mqtt(session_present=False)
+    mqtt._subscribe(["sign/greet"])
+
+    assert mqtt._mqtt.subscribed == [("sign/greet", 1)]
+
+
+def test_every_callback_added_before_the_first_subscribe():
+    mqtt = _sign_mqtt(session_present=False)
+    mqtt._app.modules = SimpleNamespace(keys=lambda: ["greet"])
+    mqtt._topic_prefix = "givemeasign"
+    mqtt._ha_sign_base = base = "givemeasign/sign/test"
+    mqtt._display_command_topic = f"{base}/display/set"
+    mqtt._time_command_topic = f"{base}/time/set"
+    mqtt._data_publish_topic = f"{base}/data/publish"
+    mqtt._diagnostics_command_topic = f"{base}/diagnostics/set"
+    mqtt._perf_command_topic = f"{base}/perf/set"
+    mqtt._home_assistant = SimpleNamespace(
+        STATUS_TOPIC="homeassistant/status", legacy_topic=None
+    )
+
+    coldpath.call("connect", "subscribe_all", mqtt)
+
+    kinds = [kind for kind, _ in mqtt._mqtt.calls]
+    assert "callback" not in kinds[kinds.index("subscribe") :]
+    assert set(mqtt._mqtt.callbacks) == {topic for topic, _ in mqtt._mqtt.subscribed}
+
+
+def test_held_messages_handled_a_few_per_pass():
+    mqtt = _sign_mqtt(session_present=True)
+    handled = []
+    mqtt._add_handler("sign/greet", "greet", lambda c, t, m: handled.append(m))
+    deliver = mqtt._mqtt.callbacks["sign/greet"]
+    for index in range(5):
+        deliver(mqtt._mqtt, "sign/greet", str(index))
+    assert not handled
+
+    mqtt._catch_up()
+    assert handled == ["0", "1"]
+    mqtt._catch_up()
+    mqtt._catch_up()
+    assert handled == ["0", "1", "2", "3", "4"]
+    assert mqtt._inbox is None
+
+    # caught up: messages are handled as they arrive again
+    deliver(mqtt._mqtt, "sign/greet", "5")
+    assert handled[-1] == "5"
+
+
+def test_deliver_goes_through_the_profiler_only_while_enabled():
+    mqtt = _sign_mqtt(session_present=False)
+    handled = []
+    tracked = []
+    profiler = mqtt._app.profiler
+    track = profiler.track
+    profiler.track = lambda name, *args: tracked.append(name) or track(name, *args)
+    handler = ("greet", lambda client, topic, message: handled.append(message))
+
+    mqtt._deliver(handler, None, "sign/greet", "off")
+    profiler.enabled = True
+    mqtt._deliver(handler, None, "sign/greet", "on")
+
+    assert handled == ["off", "on"]
+    assert tracked == ["greet"]
+
+
+def test_backlog_bounded(monkeypatch):
+    monkeypatch.setattr(sign_mqtt_module, "CATCH_UP_MAX", 3)
+    mqtt = _sign_mqtt(session_present=True)
+    for index in range(5):
+        mqtt._deliver(("greet", None), None, "sign/greet", str(index))
+
+    assert [held[3] for held in mqtt._inbox] == ["2", "3", "4"]
+    assert len(mqtt._app.logger.errors) == 2
@@ -55,6 +55,8 @@ def sign_mqtt(monkeypatch):
         display_enabled=True,
     )
     mqtt._mqtt = _RecordingMQTT()
+    # publish straight to the recorder rather than queueing
+    mqtt._outbox = mqtt._mqtt
     mqtt._ha_sign_base = "givemeasign/sign/aa_bb_cc_dd_ee_ff"
     mqtt._time_state_topic = f"{mqtt._ha_sign_base}/time/state"
     mqtt._data_state_topic = f"{mqtt._ha_sign_base}/data/state"
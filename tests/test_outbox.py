@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the outgoing MQTT message queue."""
+
+import pytest
+
+from give_me_a_sign.home_assistant import HomeAssistant
+from give_me_a_sign.outbox import Outbox
+
+
+class _Client:
+    def __init__(self, fail=False):
+        self.published = []
+        self.fail = fail
+
+    def publish(self, topic, payload, retain=False, qos=0):
+        if self.fail:
+            raise OSError("broker gone")
+        self.published.append((topic, payload, retain, qos))
+
+
+def test_newest_payload_per_topic_in_first_queued_order(virtual_clock):
+    # pylint: disable=unused-argument
+    outbox = Outbox()
+    outbox.publish("sign/display/state", "OFF", retain=True, qos=1)
+    outbox.publish("sign/diagnostics", "{}")
+    outbox.publish("sign/display/state", "ON", retain=True, qos=1)
+    outbox.publish("sign/display/state", "OFF", retain=True, qos=1)
+
+    client = _Client()
+    assert outbox.drain(client) == 2
+    assert client.published == [
+        ("sign/display/state", "OFF", True, 1),
+        ("sign/diagnostics", "{}", False, 0),
+    ]
+    assert outbox.coalesced == 2
+    assert not outbox.full
+
+
+def test_rate_limited_to_burst_then_rate(virtual_clock):
+    outbox = Outbox(rate=5, burst=3)
+    for index in range(10):
+        outbox.publish(f"topic/{index}", "x")
+
+    client = _Client()
+    assert outbox.drain(client) == 3
+    assert outbox.drain(client) == 0
+    virtual_clock.advance(0.2)
+    assert outbox.drain(client) == 1
+    virtual_clock.advance(10)
+    # the bucket holds at most a burst
+    assert outbox.drain(client) == 3
+    assert len(outbox) == 3
+
+
+def test_drain_stops_at_time_budget(virtual_clock, monkeypatch):
+    monkeypatch.setattr(Outbox, "BUDGET_NS", 0)
+    outbox = Outbox()
+    outbox.publish("a", "1")
+    outbox.publish("b", "2")
+
+    client = _Client()
+    assert outbox.drain(client) == 1
+    virtual_clock.advance(1)
+    assert outbox.drain(client) == 1
+    assert [message[0] for message in client.published] == ["a", "b"]
+
+
+def test_failed_publish_stays_queued(virtual_clock):
+    # pylint: disable=unused-argument
+    outbox = Outbox()
+    outbox.publish("a", "1")
+
+    with pytest.raises(OSError):
+        outbox.drain(_Client(fail=True))
+    assert len(outbox) == 1
+
+    client = _Client()
+    outbox.drain(client)
+    assert client.published == [("a", "1", False, 0)]
+
+
+def test_home_assistant_feeds_outbox_one_message_at_a_time(virtual_clock):
+    # pylint: disable=unused-argument
+    outbox = Outbox(rate=1000, burst=1000)
+    ha = HomeAssistant("aa:bb:cc:dd:ee:ff", outbox, "givemeasign/sign/aa_bb")
+    ha.loop()
+    client = _Client()
+    outbox.drain(client)
+
+    # a migration sends two messages to the same topic; neither may be lost
+    topic = "homeassistant/sensor/givemeasign_aa_bb_cc_dd_ee_ff/uptime/config"
+    ha.on_legacy_config(topic, '{"name": "Uptime"}')
+    for _ in range(5):
+        ha.loop()
+        assert len(outbox) <= 1
+        outbox.drain(client)
+
+    sent = [(message[0], message[1]) for message in client.published[1:]]
+    assert sent[0] == (topic, HomeAssistant.MIGRATE_PAYLOAD)
+    assert sent[1][0].startswith("homeassistant/device/")
+    assert sent[2] == (topic, "")
@@ -0,0 +1,148 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for playlist parsing and rotation."""
+
+import pytest
+
+from give_me_a_sign.data import Data
+from give_me_a_sign.playlist import Playlist
+
+SCREENS = {
+    "clock": None,
+    "weather": "weather",
+    "aqi": "aqi",
+    "uvi": "uv",
+    "pollen": "pollen",
+}
+CONDITIONS = ("daylight",)
+NOW = 1_700_000_000
+
+
+@pytest.fixture
+def data(monkeypatch):
+    monkeypatch.setattr(Data, "_restore", lambda self: False)
+    monkeypatch.setattr("give_me_a_sign.timesource.time", lambda: NOW)
+    return Data()
+
+
+def _default(data):
+    playlist = Playlist.parse(Playlist.DEFAULT, SCREENS, CONDITIONS)
+    playlist.refresh(data, NOW)
+    return playlist
+
+
+def test_default_playlist_matches_classic_rotation():
+    playlist = Playlist.parse(Playlist.DEFAULT, SCREENS, CONDITIONS)
+    assert [screen.name for screen in playlist] == list(SCREENS)
+    assert [screen.duration for screen in playlist] == [20, 10, 10, 10, 10]
+    assert playlist[3].condition == "daylight"
+    assert all(screen.max_age == 3600 for screen in playlist)
+    assert playlist[1].key == "weather"
+    assert playlist[0].key is None
+
+
+def test_advance_wraps_and_restart(data):
+    data.set_item("aqi", {"aqi": 10})
+    playlist = Playlist.parse(
+        {
+            "screens": [
+                {"screen": "clock", "duration": 5},
+                {"screen": "aqi", "duration": 3},
+            ]
+        },
+        SCREENS,
+        CONDITIONS,
+    )
+    playlist.refresh(data, NOW)
+    assert playlist.current.name == "clock"
+    assert playlist.advance().name == "aqi"
+    assert playlist.advance().name == "clock"
+    playlist.advance()
+    assert playlist.restart().name == "clock"
+    assert playlist.index == 0
+
+
+def test_parse_accepts_bare_list_and_max_age():
+    playlist = Playlist.parse(
+        [{"screen": "weather", "duration": "10", "max_age": 0}], SCREENS, CONDITIONS
+    )
+    assert playlist.current.duration == 10
+    assert playlist.current.max_age == 0
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        [],
+        {"screens": []},
+        "clock",
+        [{"screen": "nope", "duration": 10}],
+        [{"screen": "clock"}],
+        [{"screen": "clock", "duration": 0}],
+        [{"screen": "clock", "duration": "soon"}],
+        [{"screen": "clock", "duration": 5, "condition": "raining"}],
+        ["clock"],
+        [{"screen": ["clock"], "duration": 1}],
+        [{"screen": "clock", "duration": 1, "condition": {}}],
+        [{"screen": "clock", "duration": 1e400}],
+    ],
+)
+def test_parse_rejects_bad_payloads(payload):
+    with pytest.raises(ValueError):
+        Playlist.parse(payload, SCREENS, CONDITIONS)
+
+
+def test_rotation_skips_screens_without_data(data):
+    playlist = _default(data)
+    assert playlist.restart().name == "clock"
+    # nothing but the clock has data, so the rotation stays on it
+    assert playlist.advance().name == "clock"
+
+    data.set_item("uv", {"index": 3})
+    assert playlist.is_stale(data, NOW)
+    playlist.refresh(data, NOW)
+    assert playlist.advance().name == "uvi"
+    assert playlist.advance().name == "clock"
+
+
+def test_rotation_skips_screens_failing_condition(data):
+    data.set_item("uv", {"index": 3})
+    playlist = _default(data)
+    assert playlist.advance(lambda screen: screen.condition is None).name == "clock"
+
+
+def test_eligibility_expires_at_the_freshness_deadline(data):
+    data.set_item("weather", {"current": {}})
+    data._data["weather"][Data.KEY_LAST_UPDATED] = NOW - 3000
+    playlist = _default(data)
+
+    assert playlist.is_eligible(1)
+    assert not playlist.is_stale(data, NOW + 599)
+    assert playlist.is_stale(data, NOW + 600)
+
+    playlist.refresh(data, NOW + 600)
+    assert not playlist.is_eligible(1)
+    assert not playlist.is_stale(data, NOW + 10_000)
+
+
+def test_mark_empty_lasts_until_data_changes(data):
+    data.set_item("aqi", {"aqi": "bad"})
+    playlist = _default(data)
+    assert playlist.advance().name == "aqi"
+
+    playlist.mark_empty()
+    assert not playlist.is_eligible()
+    assert playlist.advance().name == "clock"
+
+    data.set_item("aqi", {"aqi": 12})
+    playlist.refresh(data, NOW)
+    assert playlist.advance().name == "aqi"
+
+
+def test_nothing_eligible_returns_none(data):
+    playlist = Playlist.parse([{"screen": "aqi", "duration": 3}], SCREENS, CONDITIONS)
+    playlist.refresh(data, NOW)
+    assert playlist.restart() is None
+    assert playlist.advance() is None
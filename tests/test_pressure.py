@@ -0,0 +1,53 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for memory pressure tiers."""
+
+from give_me_a_sign.pressure import MemoryPressure
+
+KB = 1024
+
+
+def test_starts_normal():
+    memory = MemoryPressure()
+
+    assert memory.tier == MemoryPressure.NORMAL
+    assert memory.name == "normal"
+    assert memory.update(200 * KB) is False
+    assert memory.changes == 0
+
+
+def test_falls_through_tiers():
+    memory = MemoryPressure()
+
+    assert memory.update(40 * KB) is True
+    assert memory.tier == MemoryPressure.DROP_CACHES
+
+    # a sudden drop can skip tiers
+    assert memory.update(10 * KB) is True
+    assert memory.tier == MemoryPressure.DROP_DATA
+    assert memory.changes == 2
+
+
+def test_recovers_with_hysteresis():
+    memory = MemoryPressure()
+    memory.update(10 * KB)
+
+    # just above the threshold isn't enough to leave the tier
+    assert memory.update(17 * KB) is False
+    assert memory.tier == MemoryPressure.DROP_DATA
+
+    assert memory.update(100 * KB) is True
+    assert memory.tier == MemoryPressure.NORMAL
+    assert memory.changes == 2
+
+
+def test_refuses_large_payloads_only_under_pressure():
+    memory = MemoryPressure()
+    large = MemoryPressure.LARGE_PAYLOAD + 1
+
+    assert memory.refuses(large) is False
+    memory.update(20 * KB)
+    assert memory.refuses(large) is True
+    assert memory.refuses(100) is False
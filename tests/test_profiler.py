@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the per-stage loop profiler."""
+
+import pytest
+
+from give_me_a_sign.profiler import Profiler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [0]
+    monkeypatch.setattr("give_me_a_sign.timesource.monotonic_ns", lambda: now[0])
+    return now
+
+
+class FakeHeap:
+    def __init__(self):
+        self.allocated = 10_000
+
+    def mem_alloc(self):
+        return self.allocated
+
+
+def test_disabled_by_default():
+    assert Profiler(("a",), FakeHeap().mem_alloc).enabled is False
+
+
+def test_records_back_to_back_stages(clock):
+    profiler = Profiler(("platform", "render"), FakeHeap().mem_alloc)
+    profiler.enabled = True
+
+    start = 0
+    clock[0] = 2_000_000
+    start = profiler.record("platform", start)
+    clock[0] = 2_300_000
+    assert profiler.record("render", start) == 2_300_000
+
+    summary = profiler.summary()
+    assert summary["platform"]["p95"] == 2.0
+    assert summary["render"]["p50"] == 0.3
+    assert summary["render"]["max"] == 0.3
+
+
+def test_stages_without_samples_report_zero():
+    profiler = Profiler(("platform",), FakeHeap().mem_alloc)
+
+    assert profiler.summary() == {
+        "platform": {"p50": 0, "p95": 0, "max": 0, "alloc_per_min": 0}
+    }
+
+
+def test_enabling_forgets_old_samples(clock):
+    profiler = Profiler(("platform",), FakeHeap().mem_alloc)
+    profiler.enabled = True
+    clock[0] = 1_000_000
+    profiler.record("platform", 0)
+
+    profiler.enabled = False
+    profiler.enabled = True
+
+    assert profiler.summary()["platform"]["max"] == 0
+
+
+def test_allocations_per_stage(clock):
+    heap = FakeHeap()
+    profiler = Profiler(("platform", "render", "gc"), heap.mem_alloc)
+    profiler.enabled = True
+
+    start = profiler.begin()
+    heap.allocated += 600
+    start = profiler.record("platform", start)
+    heap.allocated += 1_200
+    start = profiler.record("render", start)
+    # a collection shrinks the heap; not counted as negative
+    heap.allocated -= 5_000
+    profiler.record("gc", start)
+
+    clock[0] = 30 * 1_000_000_000
+    summary = profiler.summary()
+    assert summary["platform"]["alloc_per_min"] == 1_200
+    assert summary["render"]["alloc_per_min"] == 2_400
+    assert summary["gc"]["alloc_per_min"] == 0
+    assert profiler.top_allocators() == [["render", 2_400], ["platform", 1_200]]
+
+
+def test_track_callbacks(clock):
+    heap = FakeHeap()
+    profiler = Profiler(("platform",), heap.mem_alloc)
+
+    def callback(size):
+        heap.allocated += size
+        return size
+
+    # not accounted while disabled
+    assert profiler.track("store_data:weather", callback, 100) == 100
+    profiler.enabled = True
+    assert profiler.track("store_data:weather", callback, 300) == 300
+
+    clock[0] = 60 * 1_000_000_000
+    assert profiler.top_allocators() == [["store_data:weather", 300]]
+
+    profiler.reset()
+    assert profiler.top_allocators() == []
@@ -0,0 +1,70 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the display module registry."""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from give_me_a_sign.registry import BUILTIN, Registry
+
+
+def _app():
+    errors = []
+    return SimpleNamespace(logger=SimpleNamespace(error=errors.append)), errors
+
+
+@pytest.mark.parametrize("name", sorted(BUILTIN))
+def test_builtin_keys_match_the_classes(name):
+    keys, path = BUILTIN[name]
+    module_name, _, class_name = path.rpartition(".")
+    cls = getattr(__import__(module_name, None, None, (class_name,)), class_name)
+
+    assert keys[:1] == ((cls.KEY,) if hasattr(cls, "KEY") else ())
+
+
+def test_modules_are_imported_and_built_on_first_use(tmp_path, monkeypatch):
+    (tmp_path / "custom_screen.py").write_text(
+        "class Custom:\n    def __init__(self, app):\n        self.app = app\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "custom_screen", raising=False)
+    app, _ = _app()
+    registry = Registry(app, disabled=())
+    registry.register("custom", "custom_screen.Custom", ("bus",))
+
+    assert "custom_screen" not in sys.modules
+    assert registry.loaded("custom") is None
+
+    module = registry.get("custom")
+
+    assert module.app is app
+    assert registry.get("custom") is module
+    assert registry.loaded("custom") is module
+    assert "bus" in registry.keys()
+
+
+def test_disabled_modules_are_never_loaded_or_subscribed(monkeypatch):
+    monkeypatch.setenv("DISABLED_MODULES", "weather, pollen")
+    app, _ = _app()
+    registry = Registry(app)
+
+    assert registry.get("weather") is None
+    assert not registry.enabled("pollen")
+    assert registry.enabled("message")
+    assert "forecast" not in registry.keys()
+    assert "message" in registry.keys()
+
+
+def test_a_module_that_fails_to_load_is_turned_off():
+    app, errors = _app()
+    registry = Registry(app, disabled=())
+    registry.register("missing", "no_such_module.Screen", ("missing",))
+
+    assert registry.get("missing") is None
+    assert not registry.enabled("missing")
+    assert "missing" not in registry.keys()
+    assert errors and errors[0].startswith("registry:can't load missing")
@@ -0,0 +1,103 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+SessionMQTT against the real MiniMQTT's CONNACK handling.
+
+tests/sim/hal has its own adafruit_minimqtt, so the client runs in an
+interpreter of its own, connecting to a socket that replays a CONNACK.
+"""
+
+import json
+import subprocess
+import sys
+from importlib import metadata
+from pathlib import Path
+
+import pytest
+
+_REPO = Path(__file__).resolve().parent.parent
+
+_CONNECT = """
+import json
+import sys
+import types
+
+package = types.ModuleType("give_me_a_sign")
+package.__path__ = ["give_me_a_sign"]
+sys.modules["give_me_a_sign"] = package
+from give_me_a_sign.session import SessionMQTT
+
+
+class Socket:
+    def __init__(self, incoming):
+        self.incoming = bytearray(incoming)
+
+    def settimeout(self, timeout):
+        pass
+
+    def connect(self, address):
+        pass
+
+    def send(self, data):
+        return len(data)
+
+    def recv_into(self, buffer, size=0):
+        size = min(size or len(buffer), len(self.incoming))
+        buffer[:size] = self.incoming[:size]
+        del self.incoming[:size]
+        return size
+
+    def close(self):
+        pass
+
+
+class Pool:
+    AF_INET = 2
+    SOCK_STREAM = 1
+
+    def __init__(self, incoming):
+        self.socket_ = Socket(incoming)
+
+    def getaddrinfo(self, host, port, family=0, type=0, proto=0, flags=0):
+        return [(2, 1, 0, "", (host, port))]
+
+    def socket(self, family, type, proto=0):
+        return self.socket_
+
+
+report = {}
+for flags in (0, 1):
+    client = SessionMQTT(
+        broker="broker",
+        client_id="sign",
+        socket_pool=Pool(bytes((0x20, 0x02, flags, 0x00))),
+        connect_retries=1,
+    )
+    returned = client.connect(clean_session=False)
+    report[flags] = {"returned": returned, "session_present": client.session_present}
+print(json.dumps(report))
+"""
+
+
+def test_session_present_read_from_the_connack():
+    try:
+        metadata.version("adafruit-circuitpython-minimqtt")
+    except metadata.PackageNotFoundError:
+        pytest.skip("needs MiniMQTT installed (requirements.txt)")
+    result = subprocess.run(
+        [sys.executable, "-c", _CONNECT],
+        cwd=_REPO,
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    assert not report["0"]["session_present"]
+    assert report["1"]["session_present"]
+    # what MiniMQTT itself says, whatever the broker sent
+    assert report["1"]["returned"] == 0
@@ -0,0 +1,463 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""
+End-to-end tests through the headless simulator.
+
+The simulator replaces process-wide modules (time, gc, sys.implementation),
+so each scenario runs in its own interpreter.
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+_REPO = Path(__file__).resolve().parent.parent
+
+
+def _simulate(body, settings=None):
+    """Run body after booting a Simulator as sim; returns what it printed last as JSON"""
+    script = "from tests.sim import Simulator\n"
+    script += f"sim = Simulator(settings={settings!r})\nsim.boot()\n"
+    script += textwrap.dedent(body)
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=_REPO,
+        capture_output=True,
+        text=True,
+        timeout=300,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def _soak(days):
+    result = subprocess.run(
+        [sys.executable, "-m", "tests.sim.soak", "--days", str(days)],
+        cwd=_REPO,
+        capture_output=True,
+        text=True,
+        timeout=600,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_boots_to_clock_and_announces_itself():
+    report = _simulate(
+        """
+        import json
+        sim.run(2)
+        base = sim.app._platform._mqtt._ha_sign_base
+        print(json.dumps({
+            "lit": sim.frame().lit(),
+            "available": sim.broker.last(base + "/available"),
+            "discovery": len(sim.published("homeassistant/#")),
+        }))
+        """
+    )
+
+    assert report["lit"] > 0
+    assert report["available"] == "online"
+    # one device config, not a config per entity
+    assert report["discovery"] == 1
+
+
+def test_diagnostics_split_into_info_and_metrics():
+    report = _simulate(
+        """
+        import json
+        base = sim.app._platform._mqtt._ha_sign_base
+        sim.run(130)
+        before = len(sim.published(base + "/diagnostics"))
+        sim.publish(base + "/diagnostics/set", '{"interval": 10, "info_interval": 30}')
+        sim.run(45)
+        print(json.dumps({
+            "info": json.loads(sim.broker.retained[base + "/info"]),
+            "diagnostics": json.loads(sim.broker.last(base + "/diagnostics")),
+            "before": before,
+            "after": len(sim.published(base + "/diagnostics")) - before,
+            "infos": len(sim.published(base + "/info")),
+        }))
+        """,
+        settings={"DIAGNOSTICS_INTERVAL": "60"},
+    )
+
+    info = report["info"]
+    assert info["board"] and info["flash_size"] > 0
+    assert info["diagnostics_interval"] == 10 and info["info_interval"] == 30
+    diagnostics = report["diagnostics"]
+    assert "uptime" in diagnostics and "free_memory" in diagnostics
+    assert "board" not in diagnostics and "python_version" not in diagnostics
+
+    # a minute apart, then every 10 s; info on connect, on the command and
+    # 30 s after it
+    assert report["before"] == 3
+    assert report["after"] >= 4
+    assert report["infos"] == 3
+
+
+def test_display_toggles_coalesce_into_one_state_update():
+    report = _simulate(
+        """
+        import json
+        base = sim.app._platform._mqtt._ha_sign_base
+        sim.run(1)
+        before = len(sim.published(base + "/display/state"))
+        for payload in ("OFF", "ON", "OFF", "ON", "OFF"):
+            sim.publish(base + "/display/set", payload)
+        sim.run(1)
+        print(json.dumps({
+            "updates": len(sim.published(base + "/display/state")) - before,
+            "state": sim.broker.last(base + "/display/state"),
+        }))
+        """
+    )
+
+    assert report == {"updates": 1, "state": "OFF"}
+
+
+def test_bulk_message_is_stored_as_one_change():
+    report = _simulate(
+        """
+        import json
+        sim.run(1)
+        before = sim.app.data.generation
+        sim.publish("givemeasign/all/bulk", json.dumps({
+            "lunar": {"phase": 0.5},
+            "message": "hello",
+            "debug": {"level": 1},
+        }))
+        sim.run(1)
+        print(json.dumps({
+            "changes": sim.app.data.generation - before,
+            "lunar": sim.app.data.get_item("lunar"),
+            "message": sim.app.data.get_item("message"),
+        }))
+        """
+    )
+
+    assert report == {
+        "changes": 1,
+        "lunar": {"phase": 0.5},
+        "message": {"text": "hello"},
+    }
+
+
+_WIFI_BLIP = """
+    import json
+    import wifi
+    mqtt = sim.app._platform._mqtt
+    sim.run(2)
+    # the network goes, and the broker notices the connection died
+    wifi.radio.connected = False
+    mqtt._mqtt.drop()
+    for index in range(5):
+        sim.publish("givemeasign/all/module/greet", json.dumps({"person": f"Person {index}"}))
+    # the sign rejoins WiFi and reconnects
+    sim.run(10)
+    print(json.dumps({
+        "greet": sim.app.data.get_item("greet"),
+        "resumed": mqtt._session_present,
+        "caught_up": mqtt._inbox is None,
+    }))
+"""
+
+
+def test_persistent_session_keeps_messages_sent_during_a_blip():
+    report = _simulate(_WIFI_BLIP, settings={"MQTT_PERSISTENT_SESSION": "1"})
+
+    assert report["resumed"] and report["caught_up"]
+    assert report["greet"] == {"person": "Person 4"}
+
+
+def test_clean_session_loses_messages_sent_during_a_blip():
+    report = _simulate(_WIFI_BLIP)
+
+    assert not report["resumed"]
+    assert report["greet"] is None
+
+
+def test_first_join_is_a_connect_and_later_ones_reconnects():
+    script = textwrap.dedent(
+        """
+        from tests.sim import Simulator
+        sim = Simulator()
+        sim.install()
+        import wifi
+        wifi.radio.connected = False
+        sim.boot()
+        print("booted")
+        wifi.radio.connected = False
+        sim.run(10)
+        """
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=_REPO,
+        capture_output=True,
+        text=True,
+        timeout=300,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    boot, after = result.stdout.split("booted\n")
+
+    assert "WiFi connect attempt" in boot and "WiFi connected\n" in boot
+    assert "reconnect" not in boot
+    assert "WiFi reconnect attempt" in after and "WiFi reconnected" in after
+
+
+def test_image_sent_in_chunks_resumes_after_a_blip():
+    report = _simulate(
+        """
+        import binascii
+        import json
+        import wifi
+        mqtt = sim.app._platform._mqtt
+        base = mqtt._ha_sign_base
+        with open("extras/images/sunny.bmp", "rb") as file:
+            image = file.read()
+        chunks = [image[offset:offset + 128] for offset in range(0, len(image), 128)]
+        manifest = json.dumps({
+            "id": "sunny", "size": len(image), "crc32": binascii.crc32(image),
+            "chunk_size": 128, "name": "sunny.bmp",
+        })
+        sim.run(1)
+        sim.publish(base + "/transfer", manifest)
+        for index in range(2):
+            sim.publish(f"{base}/transfer/sunny/{index}", chunks[index])
+        sim.run(1)
+        # the rest is sent into a dead connection
+        wifi.radio.connected = False
+        mqtt._mqtt.drop()
+        for index in range(2, len(chunks)):
+            sim.publish(f"{base}/transfer/sunny/{index}", chunks[index])
+        sim.run(10)
+        status = json.loads(sim.broker.retained[base + "/transfer/status"])
+        # back: send the manifest again and go on from where the sign says
+        sim.publish(base + "/transfer", manifest)
+        for index in range(status["next"], len(chunks)):
+            sim.publish(f"{base}/transfer/sunny/{index}", chunks[index])
+        sim.run(1)
+        from give_me_a_sign.transfer import Transfer
+        with open(Transfer.DIRECTORY + "/sunny.bmp", "rb") as file:
+            saved = file.read()
+        print(json.dumps({
+            "resumed_at": status["next"],
+            "state": json.loads(sim.broker.retained[base + "/transfer/status"])["state"],
+            "intact": saved == image,
+        }))
+        """
+    )
+
+    assert report == {"resumed_at": 2, "state": "done", "intact": True}
+
+
+def test_pre_rendered_frame_shown_from_the_playlist():
+    report = _simulate(
+        """
+        import json, sys
+        sys.path.insert(0, "extras/frame")
+        from encode_frame import encode
+        pixels = (bytes(32) + bytes([1]) * 32) * 32
+        frame = encode(64, 32, [(255, 0, 0), (0, 0, 255)], pixels)
+        sim.publish("givemeasign/all/module/playlist", json.dumps(
+            {"screens": [{"screen": "frame", "duration": 10}]}
+        ))
+        sim.publish("givemeasign/all/module/frame", frame)
+        sim.run(2)
+        print(json.dumps({
+            "left": sim.frame()[10, 10],
+            "right": sim.frame()[50, 20],
+            "stored": sim.app.data.get_item("frame"),
+            "size": len(frame),
+        }))
+        """
+    )
+
+    assert report["left"] == 0xFF0000 and report["right"] == 0x0000FF
+    assert report["stored"]["encoding"] == "rle"
+    assert report["stored"]["bytes"] == report["size"]
+
+
+def test_clock_changes_with_simulated_minutes():
+    report = _simulate(
+        """
+        import json
+        sim.run(1)
+        before = sim.frame()
+        sim.run(60)
+        print(json.dumps({"changed": sim.frame() != before}))
+        """
+    )
+
+    assert report["changed"]
+
+
+def test_message_is_displayed_scaled_and_saved_as_png(tmp_path):
+    path = tmp_path / "frame.png"
+    report = _simulate(
+        f"""
+        import json
+        sim.run(1)
+        clock = sim.frame()
+        sim.publish("givemeasign/all/module/message", '{{"text": "Hi", "duration": 10}}')
+        sim.run(1)
+        frame = sim.frame()
+        frame.save_png({str(path)!r}, scale=4)
+        print(json.dumps({{"state": sim.app._loop_state, "changed": frame != clock}}))
+        """
+    )
+
+    assert report["changed"]
+    assert report["state"] == 5  # States.MESSAGE
+    assert path.read_bytes()[:8] == b"\x89PNG\r\n\x1a\n"
+
+
+def test_boot_milestones_are_published_once_the_clock_is_up():
+    report = _simulate(
+        """
+        import json
+        sim.run(1)
+        base = sim.app._platform._mqtt._ha_sign_base
+        print(json.dumps({
+            "boot": json.loads(sim.broker.last(base + "/boot")),
+            "count": len(sim.published(base + "/boot")),
+        }))
+        """
+    )
+
+    milestones = report["boot"]
+    assert list(milestones) == [
+        "init",
+        "clock",
+        "first_clock",
+        "started",
+        "wifi",
+        "ntp",
+        "mqtt",
+    ]
+    assert list(milestones.values()) == sorted(milestones.values())
+    assert report["count"] == 1
+
+
+def test_boot_benchmark_counts_network_waits():
+    result = subprocess.run(
+        [sys.executable, "-m", "tests.sim.boot", "--runs", "1"],
+        cwd=_REPO,
+        capture_output=True,
+        text=True,
+        timeout=300,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    virtual = report["virtual_ms"]
+    # the clock is up before the network is even tried
+    assert virtual["first_clock"] <= virtual["started"] < virtual["wifi"]
+    assert virtual["wifi"] - virtual["started"] >= 3000
+    assert virtual["mqtt"] - virtual["ntp"] >= 500
+    assert set(report["wall_ms"]) == set(virtual)
+
+
+def test_disabled_modules_are_never_imported_or_shown():
+    report = _simulate(
+        """
+        import json, sys
+        sim.publish("givemeasign/all/module/weather", '{"temperature": 70}')
+        sim.publish("givemeasign/all/module/message", '{"text": "Hi"}')
+        sim.run(40)
+        print(json.dumps({
+            "imported": sorted(
+                name for name in sys.modules if name.startswith("give_me_a_sign.")
+            ),
+            "screens": sorted(sim.app._screens),
+        }))
+        """,
+        settings={"DISABLED_MODULES": "weather,aqi,uv,pollen,trimet,tones,frame"},
+    )
+
+    for name in ("weather", "aqi", "uv", "pollen", "trimet", "tones", "frame"):
+        assert f"give_me_a_sign.{name}" not in report["imported"]
+    assert "give_me_a_sign.message" in report["imported"]
+    assert report["screens"] == ["clock"]
+
+
+def test_interrupt_for_a_module_that_fails_to_load_is_dropped():
+    report = _simulate(
+        """
+        import json
+        modules = sim.app.modules
+        modules._modules.pop("greet", None)
+        modules._specs["greet"] = (("greet",), "give_me_a_sign.missing.Greet")
+        sim.publish("givemeasign/all/module/greet", '{"person": "Ada"}')
+        sim.run(5)
+        print(json.dumps({
+            "errors": [message for _, message in sim.app.logger.records],
+            "lit": sim.frame().lit(),
+        }))
+        """
+    )
+
+    assert "give_me_a_sign:no greet module, dropped interrupt" in report["errors"]
+    # still showing the playlist
+    assert report["lit"] > 0
+
+
+def test_week_long_soak():
+    report = _soak(days=7)
+    days = report["days"]
+
+    # NTP every 6 hours, HA discovery once per Home Assistant restart,
+    # diagnostics every minute (scheduled a minute after the pass that sent
+    # the last, so they slip by up to a step each time)
+    assert report["ntp_syncs"] == days * 4
+    assert report["advertisements"] == report["ha_restarts"] > 0
+    assert report["diagnostics"] >= days * 86400 // (60 + report["step"]) - 1
+
+    # the clock moved to daylight time at the transition, within a step
+    changes = report["offsets"]
+    assert changes[-1][1] == -7 * 3600
+    assert abs(changes[-1][0] - report["dst_start"]) <= report["step"]
+
+    # bounded host-side buffers fill up, but nothing grows for a week
+    assert report["heap_blocks_end"] - report["heap_blocks_start"] < 1000
+    assert report["loop_ms"]["max"] < 1000
+
+
+def test_runtimes_report_render_latency():
+    # only the waits move the clock, so the numbers are the same every run
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "tests.sim.latency",
+            "--seconds",
+            "30",
+            "--cpu-scale",
+            "0",
+        ],
+        cwd=_REPO,
+        capture_output=True,
+        text=True,
+        timeout=300,
+        check=False,
+    )
+    assert result.returncode == 0, result.stdout + result.stderr
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    for runtime in ("superloop", "asyncio"):
+        latency = report[runtime]
+        assert latency["count"] >= 30 / 0.35
+        assert 0 < latency["p50"] <= latency["p99"] <= latency["max"]
+        # one MQTT read and a render interval at most, never a stall
+        assert latency["max"] <= 250 + 50 + 1
+    # the superloop's MQTT read is in every gap between frames
+    assert report["superloop"]["p50"] >= 250
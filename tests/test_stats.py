@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the loop timing histogram."""
+
+from give_me_a_sign.stats import Histogram
+
+
+def test_empty_histogram_reports_zero():
+    histogram = Histogram()
+
+    assert histogram.percentile(0.5) == 0
+    assert histogram.summary() == {
+        "p50": 0,
+        "p95": 0,
+        "p99": 0,
+        "max": 0,
+        "count": 0,
+    }
+
+
+def test_percentiles_use_bucket_bounds():
+    histogram = Histogram()
+    for _ in range(98):
+        histogram.record(2_000)
+    histogram.record(40_000)
+    histogram.record(400_000)
+
+    assert histogram.count == 100
+    assert histogram.percentile(0.5) == 2_500
+    assert histogram.percentile(0.99) == 50_000
+    assert histogram.percentile(1.0) == 400_000
+    assert histogram.max == 400_000
+
+
+def test_percentile_never_exceeds_max():
+    histogram = Histogram()
+    histogram.record(120)
+
+    assert histogram.percentile(0.5) == 120
+
+
+def test_overflow_bucket_reports_max():
+    histogram = Histogram()
+    histogram.record(9_000_000)
+
+    assert histogram.percentile(0.99) == 9_000_000
+
+
+def test_reset():
+    histogram = Histogram()
+    histogram.record(1_000)
+    histogram.reset()
+
+    assert histogram.count == 0
+    assert histogram.max == 0
+    assert histogram.percentile(0.5) == 0
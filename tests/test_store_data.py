@@ -8,6 +8,7 @@ import pytest
 
 from give_me_a_sign.data import Data
 from give_me_a_sign.mqtt import SignMQTT
+from give_me_a_sign.pressure import MemoryPressure
 
 
 class _Logger:
@@ -15,6 +16,9 @@ class _Logger:
         self.errors = []
         self.infos = []
 
+    def debug(self, message, *args):
+        pass
+
     def error(self, message, *args):
         self.errors.append(message)
 
@@ -22,11 +26,18 @@ class _Logger:
         self.infos.append(message)
 
 
+class _Modules:  # pylint: disable=too-few-public-methods
+    def keys(self):
+        return ["aqi", "greet", "message", "weather"]
+
+
 class _App:
     def __init__(self):
         self.data = Data()
         self.logger = _Logger()
         self.display_enabled = True
+        self.memory = MemoryPressure()
+        self.modules = _Modules()
 
 
 @pytest.fixture
@@ -44,6 +55,23 @@ def test_decode_mqtt_payload():
     assert SignMQTT._decode_mqtt_payload("plain") == "plain"
 
 
+def test_store_from_received_buffer(sign_mqtt):
+    sign_mqtt.store_data("weather", bytearray(b'{"current": {"temperature": 70}}'))
+    sign_mqtt.store_data("message", bytearray("caf\u00e9".encode()))
+
+    assert sign_mqtt._app.data.get_item("weather") == {"current": {"temperature": 70}}
+    assert sign_mqtt._app.data.get_item("message") == {"text": "caf\u00e9"}
+
+
+def test_log_lines_left_for_the_logger_to_format(sign_mqtt):
+    sign_mqtt.store_data("weather", b"not json")
+
+    # the payload goes to the logger as an argument, not pre-formatted
+    assert sign_mqtt._app.logger.errors == [
+        "server:store_data(%s) store_data failed: %s"
+    ]
+
+
 def test_store_valid_json(sign_mqtt):
     sign_mqtt.store_data("weather", '{"current": {"temperature": 70}}')
     assert sign_mqtt._app.data.get_item("weather") == {"current": {"temperature": 70}}
@@ -78,3 +106,60 @@ def test_store_invalid_json_other_endpoint(sign_mqtt):
     sign_mqtt.store_data("weather", "not json")
     assert sign_mqtt._app.data.get_item("weather") is None
     assert sign_mqtt._app.logger.errors
+
+
+def test_large_payload_refused_under_memory_pressure(sign_mqtt):
+    sign_mqtt._app.memory.tier = MemoryPressure.DROP_FONTS
+    payload = '{"text": "' + "x" * MemoryPressure.LARGE_PAYLOAD + '"}'
+
+    sign_mqtt.store_data("message", payload)
+
+    assert sign_mqtt._app.data.get_item("message") is None
+    assert sign_mqtt._app.logger.errors
+
+    sign_mqtt.store_data("message", '{"text": "short"}')
+    assert sign_mqtt._app.data.get_item("message") == {"text": "short"}
+
+
+def test_non_essential_data_dropped_under_memory_pressure(sign_mqtt):
+    sign_mqtt._app.memory.tier = MemoryPressure.DROP_DATA
+
+    sign_mqtt.store_data("lunar", '{"phase": 0.5}')
+
+    assert sign_mqtt._app.data.get_item("lunar") is None
+
+
+def test_bulk_stores_every_key_as_one_change(sign_mqtt):
+    data = sign_mqtt._app.data
+    before = data.generation
+
+    sign_mqtt.store_bulk(
+        '{"weather": {"current": {"temperature": 70}}, "aqi": "{\\"aqi\\": 12}",'
+        ' "message": "hello", "greet": {"person": "Jane D."}}'
+    )
+
+    assert data.generation == before + 1
+    assert data.get_item("weather") == {"current": {"temperature": 70}}
+    assert data.get_item("aqi") == {"aqi": 12}
+    assert data.get_item("message") == {"text": "hello"}
+    assert data.get_item("greet") == {"person": "Jane D."}
+    assert not sign_mqtt._app.logger.errors
+
+
+def test_bulk_skips_unknown_and_unusable_keys(sign_mqtt):
+    sign_mqtt.store_bulk('{"bogus": 1, "weather": "not json", "aqi": {"aqi": 3}}')
+
+    assert sign_mqtt._app.data.get_item("aqi") == {"aqi": 3}
+    assert sign_mqtt._app.data.get_item("bogus") is None
+    assert sign_mqtt._app.data.get_item("weather") is None
+    assert len(sign_mqtt._app.logger.errors) == 2
+
+
+@pytest.mark.parametrize("payload", ["not json", '["weather"]'])
+def test_bulk_needs_an_object(sign_mqtt, payload):
+    before = sign_mqtt._app.data.generation
+
+    sign_mqtt.store_bulk(payload)
+
+    assert sign_mqtt._app.data.generation == before
+    assert sign_mqtt._app.logger.errors
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for the package-wide time source and the virtual clock."""
+
+import time
+from types import SimpleNamespace
+
+from give_me_a_sign import timesource
+from give_me_a_sign.collector import Collector
+from give_me_a_sign.data import Data
+from give_me_a_sign.tones import Tones
+
+
+def test_virtual_clock_drives_data_age(virtual_clock, monkeypatch):
+    monkeypatch.setattr(Data, "_restore", lambda self: False)
+    store = Data()
+    store.set_item("weather", {"temperature": 72})
+
+    virtual_clock.advance(90)
+
+    assert store.age("weather") == 90
+
+
+def test_setting_the_wall_clock_leaves_monotonic_time_alone(virtual_clock):
+    before = timesource.monotonic_ns()
+
+    virtual_clock.set_time(2_000_000_000)
+
+    assert timesource.time() == 2_000_000_000
+    assert timesource.monotonic_ns() == before
+
+
+def test_sleep_advances_the_virtual_clock(virtual_clock):
+    before = timesource.monotonic()
+
+    timesource.sleep(2.5)
+
+    assert timesource.monotonic() == before + 2.5
+
+
+def test_tones_finish_on_virtual_time(virtual_clock, monkeypatch):
+    monkeypatch.setattr(Data, "_restore", lambda self: False)
+    app = SimpleNamespace(data=Data())
+    player = Tones(app)
+    app.data.set_item(
+        Tones.KEY, {"tones": [{"frequency": 440, "duration": 5, "volume": 100}]}
+    )
+    player.play()
+    player.loop()
+
+    assert player.next_change() == 5
+    virtual_clock.advance(5)
+    player.loop()
+    assert player.next_change() is None
+
+
+def test_collector_runs_on_the_virtual_clock(virtual_clock):
+    collector = Collector(
+        collect=lambda: None, mem_alloc=lambda: 0, mem_free=lambda: 100_000
+    )
+
+    virtual_clock.advance(Collector.MAX_INTERVAL)
+
+    assert collector.poll(timesource.monotonic_ns(), idle=False) is True
+
+
+def test_use_none_restores_the_real_clock():
+    timesource.use(SimpleNamespace(monotonic_ns=int, monotonic=int, time=int, sleep=id))
+    timesource.use(None)
+
+    assert timesource.time is time.time
+    assert timesource.monotonic_ns is time.monotonic_ns
@@ -59,3 +59,16 @@ def test_play_bad_tone_entry(tones_player):
 
     assert player.play() is False
     assert player._current_index is None
+
+
+def test_next_change_idle_and_playing(tones_player):
+    player, app = tones_player
+    assert player.next_change() is None
+
+    app.data.set_item(
+        Tones.KEY, {"tones": [{"frequency": 440, "duration": 5, "volume": 100}]}
+    )
+    player.play()
+    player.loop()
+
+    assert 4 < player.next_change() <= 5
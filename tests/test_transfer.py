@@ -0,0 +1,177 @@
+# SPDX-FileCopyrightText: 2026 John Romkey
+#
+# SPDX-License-Identifier: MIT
+
+"""Unit tests for chunked transfers in ``give_me_a_sign.transfer``."""
+
+import binascii
+import json
+from types import SimpleNamespace
+
+import pytest
+
+import storage
+
+from give_me_a_sign.pressure import MemoryPressure
+from give_me_a_sign.transfer import Transfer
+
+STATUS = "givemeasign/sign/aa_bb/transfer/status"
+
+
+class _Logger:
+    def __init__(self):
+        self.errors = []
+
+    def error(self, message, *args):
+        self.errors.append(message % args)
+
+    def info(self, message, *args):
+        pass
+
+
+class _Client:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.published = []
+
+    def publish(self, topic, payload, retain=False, qos=0):
+        # pylint: disable=unused-argument
+        self.published.append((topic, json.loads(payload)))
+
+    @property
+    def status(self):
+        return self.published[-1][1]
+
+
+@pytest.fixture
+def transfer(tmp_path, monkeypatch):
+    monkeypatch.setattr(Transfer, "DIRECTORY", str(tmp_path / "transfers"))
+    storage.reset()
+    stored = []
+    app = SimpleNamespace(logger=_Logger(), memory=MemoryPressure())
+    receiver = Transfer(app, _Client(), STATUS, lambda *args: stored.append(args))
+    receiver.stored = stored
+    return receiver
+
+
+def _manifest(payload, chunk_size=4, **target):
+    manifest = {
+        "id": "t1",
+        "size": len(payload),
+        "crc32": binascii.crc32(payload),
+        "chunk_size": chunk_size,
+    }
+    manifest.update(target or {"name": "picture.bmp"})
+    return json.dumps(manifest)
+
+
+def _chunks(payload, chunk_size=4):
+    return [
+        bytearray(payload[offset : offset + chunk_size])
+        for offset in range(0, len(payload), chunk_size)
+    ]
+
+
+def test_file_streamed_to_flash(transfer):
+    payload = b"BM\x00\x01binary\xffdata"
+    transfer.start(_manifest(payload))
+    for index, chunk in enumerate(_chunks(payload)):
+        transfer.write("t1", str(index), chunk)
+
+    path = f"{Transfer.DIRECTORY}/picture.bmp"
+    with open(path, "rb") as file:
+        assert file.read() == payload
+    assert transfer._client.status == {
+        "id": "t1",
+        "state": "done",
+        "next": 4,
+        "received": len(payload),
+        "size": len(payload),
+    }
+    assert not transfer.active
+    # the filesystem is read-only again after every write
+    assert storage.remount_calls[-1] == ("/", True)
+
+
+def test_key_transfer_resumes_after_reconnect(transfer):
+    payload = json.dumps({"timezone": "UTC", "transitions": []}).encode()
+    chunks = _chunks(payload)
+    transfer.start(_manifest(payload, key="timezone"))
+    transfer.write("t1", "0", chunks[0])
+    transfer.write("t1", "1", chunks[1])
+
+    # the connection drops: chunk 2 never arrives, 3 does
+    transfer.write("t1", "3", chunks[3])
+    assert transfer._client.status["next"] == 2
+
+    # the publisher sends the manifest again and carries on from next
+    transfer.start(_manifest(payload, key="timezone"))
+    assert transfer._client.status["next"] == 2
+    transfer.write("t1", "1", chunks[1])
+    for index in range(2, len(chunks)):
+        transfer.write("t1", str(index), chunks[index])
+
+    assert transfer.stored == [("timezone", bytearray(payload))]
+    assert transfer._client.status["state"] == "done"
+
+
+def test_crc_mismatch_discards_the_file(transfer):
+    payload = b"0123456789"
+    transfer.start(_manifest(payload))
+    chunks = _chunks(payload)
+    chunks[1][0] ^= 0xFF
+    for index, chunk in enumerate(chunks):
+        transfer.write("t1", str(index), chunk)
+
+    assert transfer._client.status["state"] == "failed"
+    assert transfer._client.status["error"] == "crc32 mismatch"
+    with pytest.raises(OSError):
+        open(  # pylint: disable=consider-using-with
+            f"{Transfer.DIRECTORY}/picture.bmp.part", "rb"
+        )
+
+
+def test_short_chunk_before_the_end_fails(transfer):
+    transfer.start(_manifest(b"0123456789"))
+    transfer.write("t1", "0", bytearray(b"012"))
+
+    assert transfer._client.status["state"] == "failed"
+    assert not transfer.active
+
+
+def test_chunks_for_another_transfer_ignored(transfer):
+    transfer.start(_manifest(b"01234567"))
+    transfer.write("other", "0", bytearray(b"0123"))
+
+    assert transfer._client.status["next"] == 0
+
+
+def test_buffer_refused_under_memory_pressure(transfer):
+    transfer._app.memory.tier = MemoryPressure.DROP_FONTS
+    payload = b"x" * (MemoryPressure.LARGE_PAYLOAD + 1)
+    transfer.start(_manifest(payload, key="timezone"))
+
+    assert transfer._client.status["state"] == "failed"
+    assert not transfer.active
+
+
+@pytest.mark.parametrize(
+    "manifest",
+    [
+        "not json",
+        '{"size": 10, "crc32": 0, "name": "a"}',
+        '{"id": "a/b", "size": 10, "crc32": 0, "name": "a"}',
+        '{"id": "a", "size": 0, "crc32": 0, "name": "a"}',
+        '{"id": "a", "size": 10, "crc32": 0, "chunk_size": 65536, "name": "a"}',
+        '{"id": "a", "size": 10, "crc32": 0, "name": "../code.py"}',
+        '{"id": "a", "size": 10, "crc32": 0, "name": ".hidden"}',
+        '{"id": "a", "size": 1.5, "crc32": 0, "key": "timezone"}',
+        '{"id": "a", "size": true, "crc32": 0, "key": "timezone"}',
+        '{"id": "a", "size": 10, "crc32": 0, "chunk_size": 2.5, "name": "a"}',
+    ],
+)
+def test_bad_manifest_ignored(transfer, manifest):
+    transfer.start(manifest)
+
+    assert not transfer.active
+    assert not transfer._client.published
+    assert transfer._app.logger.errors
@@ -4,6 +4,11 @@
 
 """Unit tests for weather helper methods."""
 
+from types import SimpleNamespace
+
+import adafruit_imageload
+
+from give_me_a_sign.pressure import MemoryPressure
 from give_me_a_sign.weather import Weather
 
 
@@ -56,3 +61,44 @@ def test_forecast_text_with_forecast():
 def test_forecast_text_without_forecast():
     assert Weather._forecast_text(None, 45) == "45%"
     assert Weather._forecast_text({"low": "x"}, 45) == "45%"
+
+
+def test_icon_cache(monkeypatch):
+    loads = []
+
+    def load(path, bitmap=None, palette=None):
+        loads.append(path)
+        return object(), object()
+
+    monkeypatch.setattr(adafruit_imageload, "load", load)
+    weather = Weather(SimpleNamespace(memory=MemoryPressure()))
+
+    first = weather._load_icon("01d")
+    assert weather._load_icon("01d") == first
+    assert len(loads) == 1
+
+    weather._load_icon("10d")
+    assert len(loads) == 2
+
+    # turning caching off releases the icon and stops caching
+    weather.cache_icons = False
+    weather._load_icon("10d")
+    weather._load_icon("10d")
+    assert len(loads) == 4
+
+
+def test_built_under_memory_pressure_does_not_cache_icons(monkeypatch):
+    loads = []
+
+    def load(path, bitmap=None, palette=None):
+        loads.append(path)
+        return object(), object()
+
+    monkeypatch.setattr(adafruit_imageload, "load", load)
+    memory = MemoryPressure()
+    memory.tier = MemoryPressure.DROP_CACHES
+    weather = Weather(SimpleNamespace(memory=memory))
+
+    weather._load_icon("01d")
+    weather._load_icon("01d")
+    assert len(loads) == 2